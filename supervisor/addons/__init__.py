@@ -40,6 +40,8 @@ class AddonManager(CoreSysAttributes):
         self.coresys: CoreSys = coresys
         self.data: AddonsData = AddonsData(coresys)
         self.local: dict[str, Addon] = {}
+        self._tokens: dict[str, str] = {}
+        self.generation: int = 0
         self.store: dict[str, AddonStore] = {}
 
     @property
@@ -68,10 +70,21 @@ class AddonManager(CoreSysAttributes):
 
     def from_token(self, token: str) -> Addon | None:
         """Return an add-on from Supervisor token."""
-        for addon in self.installed:
-            if token == addon.supervisor_token:
-                return addon
-        return None
+        if (slug := self._tokens.get(token)) is None:
+            return None
+        return self.local.get(slug)
+
+    def bump_generation(self) -> None:
+        """Mark add-on or store data as changed."""
+        self.generation += 1
+
+    def update_tokens(self) -> None:
+        """Rebuild index of Supervisor tokens of installed add-ons."""
+        self._tokens = {
+            addon.supervisor_token: addon.slug
+            for addon in self.installed
+            if addon.supervisor_token
+        }
 
     async def load(self) -> None:
         """Start up add-on management."""
@@ -84,6 +97,8 @@ class AddonManager(CoreSysAttributes):
         _LOGGER.info("Found %d installed add-ons", len(tasks))
         if tasks:
             await asyncio.wait(tasks)
+        self.update_tokens()
+        self.bump_generation()
 
         # Sync DNS
         await self.sync_dns()
@@ -182,6 +197,8 @@ class AddonManager(CoreSysAttributes):
             raise AddonsError() from err
         else:
             self.local[slug] = addon
+            self.update_tokens()
+            self.bump_generation()
 
         # Reload ingress tokens
         if addon.with_ingress:
@@ -239,6 +256,8 @@ class AddonManager(CoreSysAttributes):
 
         self.data.uninstall(addon)
         self.local.pop(slug)
+        self.update_tokens()
+        self.bump_generation()
 
         _LOGGER.info("Add-on '%s' successfully removed", slug)
 
@@ -364,6 +383,8 @@ class AddonManager(CoreSysAttributes):
         if slug not in self.local:
             _LOGGER.info("Detect new Add-on after restore %s", slug)
             self.local[slug] = addon
+        self.update_tokens()
+        self.bump_generation()
 
         # Update ingress
         if addon.with_ingress:
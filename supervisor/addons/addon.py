@@ -18,6 +18,7 @@ from securetar import atomic_contents_add, secure_path
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
+from ..backups.incremental import DataManifest
 from ..const import (
     ATTR_ACCESS_TOKEN,
     ATTR_AUDIO_INPUT,
@@ -179,6 +180,7 @@ class Addon(AddonModel):
         if self._state == new_state:
             return
         self._state = new_state
+        self.sys_addons.bump_generation()
         self.sys_homeassistant.websocket.send_message(
             {
                 ATTR_TYPE: WSType.SUPERVISOR_EVENT,
@@ -507,6 +509,7 @@ class Addon(AddonModel):
     def save_persist(self) -> None:
         """Save data of add-on."""
         self.sys_addons.data.save_data()
+        self.sys_addons.bump_generation()
 
     async def watchdog_application(self) -> bool:
         """Return True if application is running."""
@@ -668,6 +671,7 @@ class Addon(AddonModel):
         # Access Token
         self.persist[ATTR_ACCESS_TOKEN] = secrets.token_hex(56)
         self.save_persist()
+        self.sys_addons.update_tokens()
 
         # Options
         await self.write_options()
@@ -719,6 +723,10 @@ class Addon(AddonModel):
         except DockerError as err:
             raise AddonsError() from err
 
+    def stats_history(self, window: int) -> list[DockerStats]:
+        """Return stats samples of container of the last seconds."""
+        return self.instance.stats_history(window)
+
     async def write_stdin(self, data) -> None:
         """Write data to add-on stdin.
 
@@ -751,8 +759,13 @@ class Addon(AddonModel):
                 _LOGGER.error,
             ) from err
 
-    async def backup(self, tar_file: tarfile.TarFile) -> None:
-        """Backup state of an add-on."""
+    async def backup(
+        self, tar_file: tarfile.TarFile, manifest: DataManifest | None = None
+    ) -> None:
+        """Backup state of an add-on.
+
+        With a manifest only data changed since the parent backup is stored.
+        """
         is_running = await self.is_running()
 
         with TemporaryDirectory(dir=self.sys_config.path_tmp) as temp:
@@ -798,12 +811,20 @@ class Addon(AddonModel):
                     backup.add(temp, arcname=".")
 
                     # Backup data
-                    atomic_contents_add(
-                        backup,
-                        self.path_data,
-                        excludes=self.backup_exclude,
-                        arcname="data",
-                    )
+                    if manifest is not None:
+                        manifest.add_contents(
+                            backup,
+                            self.path_data,
+                            excludes=self.backup_exclude,
+                            arcname="data",
+                        )
+                    else:
+                        atomic_contents_add(
+                            backup,
+                            self.path_data,
+                            excludes=self.backup_exclude,
+                            arcname="data",
+                        )
 
             if (
                 is_running
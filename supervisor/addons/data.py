@@ -46,12 +46,14 @@ class AddonsData(FileConfiguration, CoreSysAttributes):
             ATTR_IMAGE: addon.image,
         }
         self.save_data()
+        self.sys_addons.bump_generation()
 
     def uninstall(self, addon: Addon) -> None:
         """Set add-on as uninstalled."""
         self.system.pop(addon.slug, None)
         self.user.pop(addon.slug, None)
         self.save_data()
+        self.sys_addons.bump_generation()
 
     def update(self, addon: AddonStore) -> None:
         """Update version of add-on."""
@@ -60,6 +62,7 @@ class AddonsData(FileConfiguration, CoreSysAttributes):
             {ATTR_VERSION: addon.version, ATTR_IMAGE: addon.image}
         )
         self.save_data()
+        self.sys_addons.bump_generation()
 
     def restore(self, slug: str, user: Config, system: Config, image: str) -> None:
         """Restore data to add-on."""
@@ -68,3 +71,4 @@ class AddonsData(FileConfiguration, CoreSysAttributes):
 
         self.user[slug][ATTR_IMAGE] = image
         self.save_data()
+        self.sys_addons.bump_generation()
@@ -1,4 +1,5 @@
 """Init file for Supervisor RESTful API."""
+from functools import partial
 import logging
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,7 @@ from .homeassistant import APIHomeAssistant
 from .host import APIHost
 from .ingress import APIIngress
 from .jobs import APIJobs
+from .middleware.compression import CompressionMiddleware
 from .middleware.security import SecurityMiddleware
 from .multicast import APIMulticast
 from .network import APINetwork
@@ -33,7 +35,7 @@ from .security import APISecurity
 from .services import APIServices
 from .store import APIStore
 from .supervisor import APISupervisor
-from .utils import api_process
+from .utils import ResponseCache, addons_tag, api_cache, api_etag, api_process
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -49,9 +51,12 @@ class RestAPI(CoreSysAttributes):
         """Initialize Docker base wrapper."""
         self.coresys: CoreSys = coresys
         self.security: SecurityMiddleware = SecurityMiddleware(coresys)
+        self.compression: CompressionMiddleware = CompressionMiddleware(coresys)
+        self.response_cache: ResponseCache = ResponseCache()
         self.webapp: web.Application = web.Application(
             client_max_size=MAX_CLIENT_SIZE,
             middlewares=[
+                self.compression.compression,
                 self.security.system_validation,
                 self.security.token_validation,
             ],
@@ -303,12 +308,14 @@ class RestAPI(CoreSysAttributes):
         """Register Supervisor functions."""
         api_supervisor = APISupervisor()
         api_supervisor.coresys = self.coresys
+        api_supervisor.response_cache = self.response_cache
 
         self.webapp.add_routes(
             [
                 web.get("/supervisor/ping", api_supervisor.ping),
                 web.get("/supervisor/info", api_supervisor.info),
                 web.get("/supervisor/stats", api_supervisor.stats),
+                web.get("/supervisor/cache", api_supervisor.cache),
                 web.get("/supervisor/logs", api_supervisor.logs),
                 web.post("/supervisor/update", api_supervisor.update),
                 web.post("/supervisor/reload", api_supervisor.reload),
@@ -386,6 +393,7 @@ class RestAPI(CoreSysAttributes):
         """Register Add-on functions."""
         api_addons = APIAddons()
         api_addons.coresys = self.coresys
+        api_addons.response_cache = self.response_cache
 
         self.webapp.add_routes(
             [
@@ -410,12 +418,17 @@ class RestAPI(CoreSysAttributes):
         # Legacy routing to support requests for not installed addons
         api_store = APIStore()
         api_store.coresys = self.coresys
+        api_store.response_cache = self.response_cache
 
+        @api_etag(addons_tag)
+        @api_cache(addons_tag)
         @api_process
-        async def addons_addon_info(request: web.Request) -> dict[str, Any]:
+        async def addons_addon_info(
+            api: APIAddons, request: web.Request
+        ) -> dict[str, Any]:
             """Route to store if info requested for not installed addon."""
             try:
-                return await api_addons.info(request)
+                return await api.info(request)
             except APIAddonNotInstalled:
                 # Route to store/{addon}/info but add missing fields
                 return dict(
@@ -424,7 +437,9 @@ class RestAPI(CoreSysAttributes):
                     options=self.sys_addons.store[request.match_info["addon"]].options,
                 )
 
-        self.webapp.add_routes([web.get("/addons/{addon}/info", addons_addon_info)])
+        self.webapp.add_routes(
+            [web.get("/addons/{addon}/info", partial(addons_addon_info, api_addons))]
+        )
 
     def _register_ingress(self) -> None:
         """Register Ingress functions."""
@@ -436,6 +451,7 @@ class RestAPI(CoreSysAttributes):
                 web.post("/ingress/session", api_ingress.create_session),
                 web.post("/ingress/validate_session", api_ingress.validate_session),
                 web.get("/ingress/panels", api_ingress.panels),
+                web.get("/ingress/stats", api_ingress.stats),
                 web.view("/ingress/{token}/{path:.*}", api_ingress.handler),
             ]
         )
@@ -536,6 +552,7 @@ class RestAPI(CoreSysAttributes):
         """Register store endpoints."""
         api_store = APIStore()
         api_store.coresys = self.coresys
+        api_store.response_cache = self.response_cache
 
         self.webapp.add_routes(
             [
@@ -606,6 +623,7 @@ class RestAPI(CoreSysAttributes):
         self.webapp.add_routes(
             [
                 web.get("/docker/info", api_docker.info),
+                web.get("/docker/stats", api_docker.stats),
                 web.get("/docker/registries", api_docker.registries),
                 web.post("/docker/registries", api_docker.create_registry),
                 web.delete("/docker/registries/{hostname}", api_docker.remove_registry),
@@ -95,6 +95,7 @@ from ..const import (
     AddonBoot,
 )
 from ..coresys import CoreSysAttributes
+from ..docker.collector import STATS_HISTORY
 from ..docker.stats import DockerStats
 from ..exceptions import (
     APIAddonNotInstalled,
@@ -104,8 +105,18 @@ from ..exceptions import (
     PwnedSecret,
 )
 from ..validate import docker_ports
-from .const import ATTR_SIGNED, CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate, json_loads
+from .const import ATTR_HISTORY, ATTR_SIGNED, CONTENT_TYPE_BINARY
+from .utils import (
+    ResponseCache,
+    addons_tag,
+    api_cache,
+    api_etag,
+    api_process,
+    api_process_raw,
+    api_stream_logs,
+    api_validate,
+    json_loads,
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -127,10 +138,34 @@ SCHEMA_OPTIONS = vol.Schema(
 # pylint: disable=no-value-for-parameter
 SCHEMA_SECURITY = vol.Schema({vol.Optional(ATTR_PROTECTED): vol.Boolean()})
 
+SCHEMA_STATS = vol.Schema(
+    {
+        vol.Optional(ATTR_HISTORY, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=STATS_HISTORY)
+        )
+    }
+)
+
+
+def _stats_data(stats: DockerStats) -> dict[str, Any]:
+    """Return data of a stats sample."""
+    return {
+        ATTR_CPU_PERCENT: stats.cpu_percent,
+        ATTR_MEMORY_USAGE: stats.memory_usage,
+        ATTR_MEMORY_LIMIT: stats.memory_limit,
+        ATTR_MEMORY_PERCENT: stats.memory_percent,
+        ATTR_NETWORK_RX: stats.network_rx,
+        ATTR_NETWORK_TX: stats.network_tx,
+        ATTR_BLK_READ: stats.blk_read,
+        ATTR_BLK_WRITE: stats.blk_write,
+    }
+
 
 class APIAddons(CoreSysAttributes):
     """Handle RESTful API for add-on functions."""
 
+    response_cache: ResponseCache
+
     def _extract_addon(self, request: web.Request) -> Addon:
         """Return addon, throw an exception it it doesn't exist."""
         addon_slug: str = request.match_info.get("addon")
@@ -150,6 +185,8 @@ class APIAddons(CoreSysAttributes):
 
         return addon
 
+    @api_etag(addons_tag)
+    @api_cache(addons_tag)
     @api_process
     async def list(self, request: web.Request) -> dict[str, Any]:
         """Return all add-ons or repositories."""
@@ -365,21 +402,22 @@ class APIAddons(CoreSysAttributes):
 
     @api_process
     async def stats(self, request: web.Request) -> dict[str, Any]:
-        """Return resource information."""
+        """Return resource information, with samples of the last seconds."""
         addon = self._extract_addon(request)
+        try:
+            query = SCHEMA_STATS(dict(request.query))
+        except vol.Invalid as ex:
+            raise APIError(humanize_error(dict(request.query), ex)) from None
 
         stats: DockerStats = await addon.stats()
 
-        return {
-            ATTR_CPU_PERCENT: stats.cpu_percent,
-            ATTR_MEMORY_USAGE: stats.memory_usage,
-            ATTR_MEMORY_LIMIT: stats.memory_limit,
-            ATTR_MEMORY_PERCENT: stats.memory_percent,
-            ATTR_NETWORK_RX: stats.network_rx,
-            ATTR_NETWORK_TX: stats.network_tx,
-            ATTR_BLK_READ: stats.blk_read,
-            ATTR_BLK_WRITE: stats.blk_write,
-        }
+        data = _stats_data(stats)
+        if query[ATTR_HISTORY]:
+            data[ATTR_HISTORY] = [
+                _stats_data(sample)
+                for sample in addon.stats_history(query[ATTR_HISTORY])
+            ]
+        return data
 
     @api_process
     def uninstall(self, request: web.Request) -> Awaitable[None]:
@@ -412,10 +450,10 @@ class APIAddons(CoreSysAttributes):
         return asyncio.shield(addon.rebuild())
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return logs from add-on."""
         addon = self._extract_addon(request)
-        return addon.logs()
+        return await api_stream_logs(request, addon.instance)
 
     @api_process
     async def stdin(self, request: web.Request) -> None:
@@ -35,7 +35,7 @@ from ..exceptions import APIError
 from ..host.sound import StreamType
 from ..validate import version_tag
 from .const import CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate
+from .utils import api_process, api_process_raw, api_stream_logs, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -115,9 +115,9 @@ class APIAudio(CoreSysAttributes):
         await asyncio.shield(self.sys_plugins.audio.update(version))
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return Audio Docker logs."""
-        return self.sys_plugins.audio.logs()
+        return await api_stream_logs(request, self.sys_plugins.audio.instance)
 
     @api_process
     def restart(self, request: web.Request) -> Awaitable[None]:
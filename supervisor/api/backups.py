@@ -9,17 +9,22 @@ from aiohttp import web
 from aiohttp.hdrs import CONTENT_DISPOSITION
 import voluptuous as vol
 
+from ..backups.const import BackupCodec
 from ..backups.validate import ALL_FOLDERS, FOLDER_HOMEASSISTANT, days_until_stale
 from ..const import (
     ATTR_ADDONS,
     ATTR_BACKUPS,
+    ATTR_CODEC,
     ATTR_COMPRESSED,
     ATTR_CONTENT,
     ATTR_DATE,
     ATTR_DAYS_UNTIL_STALE,
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
+    ATTR_INCREMENTAL,
+    ATTR_LEVEL,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PASSWORD,
     ATTR_PROTECTED,
     ATTR_REPOSITORIES,
@@ -59,6 +64,9 @@ SCHEMA_BACKUP_FULL = vol.Schema(
         vol.Optional(ATTR_NAME): str,
         vol.Optional(ATTR_PASSWORD): vol.Maybe(str),
         vol.Optional(ATTR_COMPRESSED): vol.Maybe(vol.Boolean()),
+        vol.Optional(ATTR_INCREMENTAL): vol.Boolean(),
+        vol.Optional(ATTR_CODEC): vol.Coerce(BackupCodec),
+        vol.Optional(ATTR_LEVEL): vol.All(int, vol.Range(min=0, max=22)),
     }
 )
 
@@ -165,7 +173,11 @@ class APIBackups(CoreSysAttributes):
             ATTR_DATE: backup.date,
             ATTR_SIZE: backup.size,
             ATTR_COMPRESSED: backup.compressed,
+            ATTR_CODEC: backup.codec,
+            ATTR_LEVEL: backup.level,
             ATTR_PROTECTED: backup.protected,
+            ATTR_INCREMENTAL: backup.incremental,
+            ATTR_PARENT: backup.parent,
             ATTR_SUPERVISOR_VERSION: backup.supervisor_version,
             ATTR_HOMEASSISTANT: backup.homeassistant_version,
             ATTR_ADDONS: data_addons,
@@ -213,7 +225,7 @@ class APIBackups(CoreSysAttributes):
     async def remove(self, request):
         """Remove a backup."""
         backup = self._extract_slug(request)
-        return self.sys_backups.remove(backup)
+        return await self.sys_backups.remove(backup)
 
     async def download(self, request):
         """Download a backup file."""
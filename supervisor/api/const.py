@@ -9,6 +9,9 @@ CONTENT_TYPE_URL = "application/x-www-form-urlencoded"
 
 COOKIE_INGRESS = "ingress_session"
 
+CACHE_CONTROL_ASSET = "private, max-age=3600"
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
 HEADER_TOKEN_OLD = "X-Hassio-Key"
 HEADER_TOKEN = "X-Supervisor-Token"
 
@@ -37,3 +40,20 @@ ATTR_SYSFS = "sysfs"
 ATTR_DEV_PATH = "dev_path"
 ATTR_ATTRIBUTES = "attributes"
 ATTR_CHILDREN = "children"
+ATTR_CONNECT_TIME = "connect_time"
+ATTR_CONNECTIONS_CREATED = "connections_created"
+ATTR_CONNECTIONS_REUSED = "connections_reused"
+ATTR_ENTRIES = "entries"
+ATTR_FILTER = "filter"
+ATTR_FOLLOW = "follow"
+ATTR_HISTORY = "history"
+ATTR_HITS = "hits"
+ATTR_MISSES = "misses"
+ATTR_POOLS = "pools"
+ATTR_QUEUED = "queued"
+ATTR_REQUESTS = "requests"
+ATTR_SINCE = "since"
+ATTR_SORT = "sort"
+ATTR_TAIL = "tail"
+ATTR_TIMESTAMPS = "timestamps"
+ATTR_TOTAL = "total"
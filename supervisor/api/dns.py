@@ -26,7 +26,7 @@ from ..coresys import CoreSysAttributes
 from ..exceptions import APIError
 from ..validate import dns_server_list, version_tag
 from .const import ATTR_FALLBACK, ATTR_LLMNR, ATTR_MDNS, CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate
+from .utils import api_process, api_process_raw, api_stream_logs, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -105,9 +105,9 @@ class APICoreDNS(CoreSysAttributes):
         await asyncio.shield(self.sys_plugins.dns.update(version))
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return DNS Docker logs."""
-        return self.sys_plugins.dns.logs()
+        return await api_stream_logs(request, self.sys_plugins.dns.instance)
 
     @api_process
     def restart(self, request: web.Request) -> Awaitable[None]:
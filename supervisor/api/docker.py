@@ -4,10 +4,20 @@ from typing import Any
 
 from aiohttp import web
 import voluptuous as vol
+from voluptuous.humanize import humanize_error
 
 from ..const import (
+    ATTR_BLK_READ,
+    ATTR_BLK_WRITE,
+    ATTR_CONTAINERS,
+    ATTR_CPU_PERCENT,
     ATTR_HOSTNAME,
     ATTR_LOGGING,
+    ATTR_MEMORY_LIMIT,
+    ATTR_MEMORY_PERCENT,
+    ATTR_MEMORY_USAGE,
+    ATTR_NETWORK_RX,
+    ATTR_NETWORK_TX,
     ATTR_PASSWORD,
     ATTR_REGISTRIES,
     ATTR_STORAGE,
@@ -15,6 +25,8 @@ from ..const import (
     ATTR_VERSION,
 )
 from ..coresys import CoreSysAttributes
+from ..exceptions import APIError
+from .const import ATTR_SORT, ATTR_TOTAL
 from .utils import api_process, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -28,6 +40,32 @@ SCHEMA_DOCKER_REGISTRY = vol.Schema(
     }
 )
 
+# Columns of stats, in order of the payload
+STATS_COLUMNS = (
+    ATTR_CPU_PERCENT,
+    ATTR_MEMORY_USAGE,
+    ATTR_MEMORY_LIMIT,
+    ATTR_MEMORY_PERCENT,
+    ATTR_NETWORK_RX,
+    ATTR_NETWORK_TX,
+    ATTR_BLK_READ,
+    ATTR_BLK_WRITE,
+)
+
+# Columns which add up over all containers
+STATS_TOTAL_COLUMNS = (
+    ATTR_CPU_PERCENT,
+    ATTR_MEMORY_USAGE,
+    ATTR_NETWORK_RX,
+    ATTR_NETWORK_TX,
+    ATTR_BLK_READ,
+    ATTR_BLK_WRITE,
+)
+
+SCHEMA_STATS = vol.Schema(
+    {vol.Optional(ATTR_SORT, default=ATTR_CPU_PERCENT): vol.In(STATS_COLUMNS)}
+)
+
 
 class APIDocker(CoreSysAttributes):
     """Handle RESTful API for Docker configuration."""
@@ -74,3 +112,28 @@ class APIDocker(CoreSysAttributes):
             ATTR_LOGGING: self.sys_docker.info.logging,
             ATTR_REGISTRIES: data_registries,
         }
+
+    @api_process
+    async def stats(self, request: web.Request) -> dict[str, Any]:
+        """Return stats of all running containers, highest usage first.
+
+        Stats are sent as one list per column, rows are in order of containers.
+        """
+        try:
+            query = SCHEMA_STATS(dict(request.query))
+        except vol.Invalid as ex:
+            raise APIError(humanize_error(dict(request.query), ex)) from None
+
+        samples = sorted(
+            self.sys_docker.collector.sweep().items(),
+            key=lambda item: (-getattr(item[1], query[ATTR_SORT]), item[0]),
+        )
+
+        data: dict[str, Any] = {ATTR_CONTAINERS: [name for name, _ in samples]}
+        for column in STATS_COLUMNS:
+            data[column] = [getattr(stats, column) for _, stats in samples]
+        data[ATTR_TOTAL] = {column: sum(data[column]) for column in STATS_TOTAL_COLUMNS}
+        data[ATTR_TOTAL][ATTR_CPU_PERCENT] = round(
+            data[ATTR_TOTAL][ATTR_CPU_PERCENT], 2
+        )
+        return data
@@ -35,7 +35,7 @@ from ..coresys import CoreSysAttributes
 from ..exceptions import APIError
 from ..validate import docker_image, network_port, version_tag
 from .const import CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate
+from .utils import api_process, api_process_raw, api_stream_logs, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -165,9 +165,9 @@ class APIHomeAssistant(CoreSysAttributes):
         return asyncio.shield(self.sys_homeassistant.core.rebuild())
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return Home Assistant Docker logs."""
-        return self.sys_homeassistant.core.logs()
+        return await api_stream_logs(request, self.sys_homeassistant.core.instance)
 
     @api_process
     async def check(self, request: web.Request) -> None:
@@ -5,7 +5,7 @@ import logging
 from typing import Any
 
 import aiohttp
-from aiohttp import ClientTimeout, hdrs, web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import (
     HTTPBadGateway,
     HTTPServiceUnavailable,
@@ -24,13 +24,26 @@ from ..const import (
     ATTR_TITLE,
 )
 from ..coresys import CoreSysAttributes
-from .const import COOKIE_INGRESS, HEADER_TOKEN, HEADER_TOKEN_OLD
+from .const import (
+    ATTR_CONNECT_TIME,
+    ATTR_CONNECTIONS_CREATED,
+    ATTR_CONNECTIONS_REUSED,
+    ATTR_POOLS,
+    ATTR_QUEUED,
+    ATTR_REQUESTS,
+    COOKIE_INGRESS,
+    HEADER_TOKEN,
+    HEADER_TOKEN_OLD,
+)
 from .utils import api_process, api_validate, require_home_assistant
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 VALIDATE_SESSION_DATA = vol.Schema({ATTR_SESSION: str})
 
+# Larger responses are streamed
+MAX_SIMPLE_RESPONSE = 64 * 1024
+
 
 class APIIngress(CoreSysAttributes):
     """Ingress view to handle add-on webui routing."""
@@ -65,6 +78,22 @@ class APIIngress(CoreSysAttributes):
 
         return {ATTR_PANELS: addons}
 
+    @api_process
+    async def stats(self, request: web.Request) -> dict[str, Any]:
+        """Return usage of the ingress connection pools."""
+        return {
+            ATTR_POOLS: {
+                slug: {
+                    ATTR_REQUESTS: pool.requests,
+                    ATTR_CONNECTIONS_CREATED: pool.connections_created,
+                    ATTR_CONNECTIONS_REUSED: pool.connections_reused,
+                    ATTR_QUEUED: pool.queued,
+                    ATTR_CONNECT_TIME: round(pool.connect_time, 3),
+                }
+                for slug, pool in self.sys_ingress.pools.items()
+            }
+        }
+
     @api_process
     @require_home_assistant
     async def create_session(self, request: web.Request) -> dict[str, Any]:
@@ -162,32 +191,20 @@ class APIIngress(CoreSysAttributes):
         url = self._create_url(addon, path)
         source_header = _init_header(request, addon)
 
-        # Passing the raw stream breaks requests for some webservers
-        # since we just need it for POST requests really, for all other methods
-        # we read the bytes and pass that to the request to the add-on
-        # add-ons needs to add support with that in the configuration
-        data = (
-            request.content
-            if request.method == "POST" and addon.ingress_stream
-            else await request.read()
-        )
-
-        async with self.sys_websession.request(
+        pool = await self.sys_ingress.get_pool(addon)
+        async with pool.session.request(
             request.method,
             url,
             headers=source_header,
             params=request.query,
             allow_redirects=False,
-            data=data,
-            timeout=ClientTimeout(total=None),
+            data=await _request_body(request, addon, source_header),
         ) as result:
             headers = _response_header(result)
+            content_length = result.content_length
 
             # Simple request
-            if (
-                hdrs.CONTENT_LENGTH in result.headers
-                and int(result.headers.get(hdrs.CONTENT_LENGTH, 0)) < 4_194_000
-            ):
+            if content_length is not None and content_length <= MAX_SIMPLE_RESPONSE:
                 # Return Response
                 body = await result.read()
                 return web.Response(
@@ -200,10 +217,13 @@ class APIIngress(CoreSysAttributes):
             # Stream response
             response = web.StreamResponse(status=result.status, headers=headers)
             response.content_type = result.content_type
+            if content_length is not None:
+                response.content_length = content_length
 
             try:
                 await response.prepare(request)
-                async for data in result.content.iter_chunked(4096):
+                # Chunks as large as available, up to the read buffer
+                async for data in result.content.iter_any():
                     await response.write(data)
 
             except (
@@ -216,6 +236,31 @@ class APIIngress(CoreSysAttributes):
             return response
 
 
+async def _request_body(
+    request: web.Request, addon: Addon, headers: dict[str, str]
+) -> aiohttp.StreamReader | bytes | None:
+    """Return request body to pass on to the add-on.
+
+    Bodies of known size are streamed with their Content-Length. Passing a
+    chunked stream breaks requests for some webservers, add-ons need to
+    enable it in their configuration, otherwise these bodies are read first.
+    """
+    if not request.body_exists:
+        return None
+
+    # aiohttp decompresses the body, its size is unknown
+    if (
+        request.content_length is not None
+        and hdrs.CONTENT_ENCODING not in request.headers
+    ):
+        headers[hdrs.CONTENT_LENGTH] = str(request.content_length)
+        return request.content
+
+    if addon.ingress_stream:
+        return request.content
+    return await request.read()
+
+
 def _init_header(request: web.Request, addon: str) -> CIMultiDict | dict[str, str]:
     """Create initial header."""
     headers = {}
@@ -253,7 +298,6 @@ def _response_header(response: aiohttp.ClientResponse) -> dict[str, str]:
             hdrs.TRANSFER_ENCODING,
             hdrs.CONTENT_LENGTH,
             hdrs.CONTENT_TYPE,
-            hdrs.CONTENT_ENCODING,
         ):
             continue
         headers[name] = value
@@ -0,0 +1,112 @@
+"""Handle compression of API responses."""
+import logging
+import zlib
+
+from aiohttp import hdrs
+from aiohttp.helpers import ETag
+from aiohttp.web import Request, RequestHandler, Response, StreamResponse, middleware
+
+from ...coresys import CoreSys, CoreSysAttributes
+from ..const import CONTENT_TYPE_BINARY, CONTENT_TYPE_JSON, CONTENT_TYPE_TEXT
+from ..utils import ResponseCache, accepted_codings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Smaller bodies don't get smaller enough to be worth it
+COMPRESSION_MIN_SIZE = 1024
+
+# Larger bodies are compressed in the executor
+COMPRESSION_EXECUTOR_SIZE = 256 * 1024
+
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 5
+
+# Logs are sent as binary
+COMPRESSIBLE_TYPES = {CONTENT_TYPE_BINARY, CONTENT_TYPE_JSON, CONTENT_TYPE_TEXT}
+
+# Add-on ingress responses pass unchanged
+NO_COMPRESSION_PREFIX = "/ingress/"
+
+
+def accepted_coding(request: Request) -> str | None:
+    """Return best content coding the client accepts."""
+    accepted = accepted_codings(request)
+    if brotli and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """Compress body with content coding."""
+    if coding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+
+    compressor = zlib.compressobj(
+        COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+    return compressor.compress(body) + compressor.flush()
+
+
+class CompressionMiddleware(CoreSysAttributes):
+    """Compression middleware functions."""
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize compression middleware."""
+        self.coresys: CoreSys = coresys
+        self.cache: ResponseCache = ResponseCache()
+
+    def _should_compress(self, request: Request, response: StreamResponse) -> bool:
+        """Return True if the response body can be compressed."""
+        if not self.sys_config.api_compression:
+            return False
+        if request.path.startswith(NO_COMPRESSION_PREFIX):
+            return False
+        if not isinstance(response, Response) or response.prepared:
+            return False
+        if response.status != 200 or hdrs.CONTENT_ENCODING in response.headers:
+            return False
+        if response.content_type not in COMPRESSIBLE_TYPES:
+            return False
+        return (
+            isinstance(response.body, bytes)
+            and len(response.body) >= COMPRESSION_MIN_SIZE
+        )
+
+    @middleware
+    async def compression(
+        self, request: Request, handler: RequestHandler
+    ) -> StreamResponse:
+        """Compress responses if enabled and the client accepts it."""
+        response = await handler(request)
+        if not self._should_compress(request, response):
+            return response
+
+        response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+        if not (coding := accepted_coding(request)):
+            return response
+
+        # Bodies with a tag are the same until the tag changes, the tag covers
+        # everything of the request they are built from
+        etag = response.etag.value if response.etag else None
+        key = f"{coding}:{request.path}"
+        if not etag or (body := self.cache.get(key, etag)) is None:
+            if len(response.body) > COMPRESSION_EXECUTOR_SIZE:
+                body = await self.sys_run_in_executor(compress, response.body, coding)
+            else:
+                body = compress(response.body, coding)
+            if etag:
+                self.cache.set(key, etag, body)
+
+        response.body = body
+        response.headers[hdrs.CONTENT_ENCODING] = coding
+        if etag:
+            # Other representation of the same data
+            response.etag = ETag(value=etag, is_weak=True)
+        return response
@@ -1,6 +1,8 @@
 """Handle security part of this API."""
+from functools import lru_cache
 import logging
 import re
+from typing import NamedTuple
 
 from aiohttp.web import Request, RequestHandler, Response, middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -113,6 +115,35 @@ ADDONS_ROLE_ACCESS = {
 
 # fmt: on
 
+# Paths with cached route decisions
+ROUTE_CACHE_SIZE = 4096
+
+
+class RouteDecision(NamedTuple):
+    """Security rules matching a path."""
+
+    blacklisted: bool
+    passthrough: bool
+    observer: bool
+    addon_bypass: bool
+
+
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def route_decision(path: str) -> RouteDecision:
+    """Return security rules matching a path."""
+    return RouteDecision(
+        blacklisted=bool(BLACKLIST.match(path)),
+        passthrough=bool(NO_SECURITY_CHECK.match(path)),
+        observer=bool(OBSERVER_CHECK.match(path)),
+        addon_bypass=bool(ADDONS_API_BYPASS.match(path)),
+    )
+
+
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def role_access(role: str, path: str) -> bool:
+    """Return True if an add-on role has access to a path."""
+    return bool(ADDONS_ROLE_ACCESS[role].match(path))
+
 
 class SecurityMiddleware(CoreSysAttributes):
     """Security middleware functions."""
@@ -144,14 +175,15 @@ class SecurityMiddleware(CoreSysAttributes):
         """Check security access of this layer."""
         request_from = None
         supervisor_token = excract_supervisor_token(request)
+        route = route_decision(request.path)
 
         # Blacklist
-        if BLACKLIST.match(request.path):
+        if route.blacklisted:
             _LOGGER.error("%s is blacklisted!", request.path)
             raise HTTPForbidden()
 
         # Ignore security check
-        if NO_SECURITY_CHECK.match(request.path):
+        if route.passthrough:
             _LOGGER.debug("Passthrough %s", request.path)
             return await handler(request)
 
@@ -172,7 +204,7 @@ class SecurityMiddleware(CoreSysAttributes):
 
         # Observer
         if supervisor_token == self.sys_plugins.observer.supervisor_token:
-            if not OBSERVER_CHECK.match(request.path):
+            if not route.observer:
                 _LOGGER.warning("%s invalid Observer access", request.path)
                 raise HTTPForbidden()
             _LOGGER.debug("%s access from Observer", request.path)
@@ -184,12 +216,12 @@ class SecurityMiddleware(CoreSysAttributes):
             addon = self.sys_addons.from_token(supervisor_token)
 
         # Check Add-on API access
-        if addon and ADDONS_API_BYPASS.match(request.path):
+        if addon and route.addon_bypass:
             _LOGGER.debug("Passthrough %s from %s", request.path, addon.slug)
             request_from = addon
         elif addon and addon.access_hassio_api:
             # Check Role
-            if ADDONS_ROLE_ACCESS[addon.hassio_role].match(request.path):
+            if role_access(addon.hassio_role, request.path):
                 _LOGGER.info("%s access from %s", request.path, addon.slug)
                 request_from = addon
             else:
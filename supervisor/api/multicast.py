@@ -23,7 +23,7 @@ from ..coresys import CoreSysAttributes
 from ..exceptions import APIError
 from ..validate import version_tag
 from .const import CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate
+from .utils import api_process, api_process_raw, api_stream_logs, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -69,9 +69,9 @@ class APIMulticast(CoreSysAttributes):
         await asyncio.shield(self.sys_plugins.multicast.update(version))
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return Multicast Docker logs."""
-        return self.sys_plugins.multicast.logs()
+        return await api_stream_logs(request, self.sys_plugins.multicast.instance)
 
     @api_process
     def restart(self, request: web.Request) -> Awaitable[None]:
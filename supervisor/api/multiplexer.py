@@ -0,0 +1,335 @@
+"""Share one Home Assistant websocket between add-ons."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from ..addons.addon import Addon
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import APIError
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Commands whose id keeps receiving events after the result
+STREAMING_COMMANDS = ("render_template",)
+
+
+@dataclass(eq=False)
+class MuxSession:
+    """Websocket of an add-on on the shared connection."""
+
+    addon: Addon
+    server: web.WebSocketResponse
+    upstream: MuxUpstream
+    # local id -> upstream id
+    ids: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class MuxSubscription:
+    """Event subscription shared by add-ons with identical requests."""
+
+    key: str
+    upstream_id: int
+    confirmed: bool = False
+    subscribers: set[tuple[MuxSession, int]] = field(default_factory=set)
+
+
+@dataclass(eq=False)
+class MuxUpstream:
+    """Connection to Core and the routing state of the add-ons using it."""
+
+    client: aiohttp.ClientWebSocketResponse
+    sessions: set[MuxSession] = field(default_factory=set)
+    # upstream id -> session, local id, command type
+    routes: dict[int, tuple[MuxSession, int, str]] = field(default_factory=dict)
+    subscriptions: dict[str, MuxSubscription] = field(default_factory=dict)
+    subscription_ids: dict[int, MuxSubscription] = field(default_factory=dict)
+
+
+class WebSocketMultiplexer(CoreSysAttributes):
+    """Relay add-on websockets over one upstream connection to Core.
+
+    Message ids are remapped per add-on. Identical subscribe_events requests
+    share one subscription upstream and events are fanned out to every
+    subscriber. Each add-on authenticates on its own websocket as before, its
+    access is checked again for every message.
+    """
+
+    def __init__(
+        self,
+        coresys: CoreSys,
+        connect: Callable[[], Awaitable[aiohttp.ClientWebSocketResponse]],
+    ) -> None:
+        """Initialize multiplexer."""
+        self.coresys: CoreSys = coresys
+        self._connect = connect
+        self._upstream: MuxUpstream | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._sessions: set[MuxSession] = set()
+        self._message_id: int = 0
+
+    @property
+    def sessions(self) -> int:
+        """Return number of add-on websockets."""
+        return len(self._sessions)
+
+    async def _get_upstream(self) -> MuxUpstream:
+        """Return upstream connection, connect if needed."""
+        async with self._lock:
+            if self._upstream is None or self._upstream.client.closed:
+                self._upstream = MuxUpstream(await self._connect())
+                self.sys_create_task(self._read_upstream(self._upstream))
+            return self._upstream
+
+    async def handle(self, server: web.WebSocketResponse, addon: Addon) -> None:
+        """Relay an authenticated add-on websocket until it is closed."""
+        try:
+            upstream = await self._get_upstream()
+        except APIError:
+            return
+
+        session = MuxSession(addon, server, upstream)
+        upstream.sessions.add(session)
+        self._sessions.add(session)
+        try:
+            async for msg in server:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                if not addon.access_homeassistant_api:
+                    _LOGGER.warning("Not permitted API access: %s", addon.slug)
+                    break
+
+                data = json.loads(msg.data)
+                for message in data if isinstance(data, list) else [data]:
+                    await self._handle_message(session, message)
+
+        except (ValueError, TypeError, KeyError) as err:
+            _LOGGER.info("Invalid message on WebSocket of %s: %s", addon.slug, err)
+        except (RuntimeError, ConnectionError, APIError) as err:
+            _LOGGER.info("Home Assistant WebSocket API error: %s", err)
+
+        finally:
+            await self._close_session(session)
+
+    async def _handle_message(self, session: MuxSession, message: dict) -> None:
+        """Pass a message of an add-on upstream."""
+        local_id = message["id"]
+        command = message["type"]
+
+        if command == "ping":
+            await session.server.send_json({"id": local_id, "type": "pong"})
+            return
+
+        # Features of the shared connection can't be changed by one add-on
+        if command == "supported_features":
+            await self._send_result(session, local_id)
+            return
+
+        if command == "subscribe_events":
+            await self._subscribe(session, local_id, message)
+            return
+
+        if command == "unsubscribe_events":
+            if await self._unsubscribe(session, message["subscription"]):
+                await self._send_result(session, local_id)
+                return
+
+            upstream_subscription = session.ids.pop(message["subscription"], -1)
+            session.upstream.routes.pop(upstream_subscription, None)
+            message = {**message, "subscription": upstream_subscription}
+
+        await self._send_upstream(session, local_id, message)
+
+    async def _send_upstream(
+        self, session: MuxSession, local_id: int, message: dict[str, Any]
+    ) -> int:
+        """Send message with a new upstream id, return the id."""
+        self._message_id += 1
+        upstream_id = self._message_id
+
+        session.ids[local_id] = upstream_id
+        session.upstream.routes[upstream_id] = (session, local_id, message["type"])
+
+        await session.upstream.client.send_json({**message, "id": upstream_id})
+        return upstream_id
+
+    async def _send_result(
+        self, session: MuxSession, local_id: int, success: bool = True, **data: Any
+    ) -> None:
+        """Send a result to an add-on."""
+        if session.server.closed:
+            return
+        await session.server.send_json(
+            {"id": local_id, "type": "result", "success": success, **data}
+        )
+
+    async def _subscribe(
+        self, session: MuxSession, local_id: int, message: dict[str, Any]
+    ) -> None:
+        """Add add-on to an event subscription, subscribe upstream if new."""
+        key = json.dumps(
+            {name: value for name, value in message.items() if name != "id"},
+            sort_keys=True,
+        )
+
+        upstream = session.upstream
+        if subscription := upstream.subscriptions.get(key):
+            subscription.subscribers.add((session, local_id))
+            if subscription.confirmed:
+                await self._send_result(session, local_id, result=None)
+            return
+
+        self._message_id += 1
+        subscription = MuxSubscription(key, self._message_id)
+        subscription.subscribers.add((session, local_id))
+        upstream.subscriptions[key] = subscription
+        upstream.subscription_ids[subscription.upstream_id] = subscription
+
+        await upstream.client.send_json({**message, "id": subscription.upstream_id})
+
+    async def _unsubscribe(self, session: MuxSession, local_id: int) -> bool:
+        """Remove add-on from a shared subscription.
+
+        Return False if the id isn't a shared subscription of the add-on.
+        """
+        for subscription in session.upstream.subscriptions.values():
+            if (session, local_id) in subscription.subscribers:
+                subscription.subscribers.remove((session, local_id))
+                break
+        else:
+            return False
+
+        if not subscription.subscribers:
+            await self._drop_subscription(session.upstream, subscription)
+        return True
+
+    async def _drop_subscription(
+        self, upstream: MuxUpstream, subscription: MuxSubscription
+    ) -> None:
+        """Unsubscribe upstream once no add-on uses the subscription."""
+        upstream.subscriptions.pop(subscription.key, None)
+
+        # Unsubscribed once Core confirms it
+        if not subscription.confirmed:
+            return
+
+        upstream.subscription_ids.pop(subscription.upstream_id, None)
+        if upstream.client.closed:
+            return
+
+        self._message_id += 1
+        try:
+            await upstream.client.send_json(
+                {
+                    "id": self._message_id,
+                    "type": "unsubscribe_events",
+                    "subscription": subscription.upstream_id,
+                }
+            )
+        except ConnectionError as err:
+            _LOGGER.debug("Can't unsubscribe from Home Assistant: %s", err)
+
+    async def _close_session(self, session: MuxSession) -> None:
+        """Remove an add-on websocket and everything it subscribed."""
+        upstream = session.upstream
+        upstream.sessions.discard(session)
+        self._sessions.discard(session)
+
+        # Add-ons connecting from now on don't join the closing connection
+        if not upstream.sessions and self._upstream is upstream:
+            self._upstream = None
+
+        for upstream_id in session.ids.values():
+            upstream.routes.pop(upstream_id, None)
+
+        for subscription in list(upstream.subscriptions.values()):
+            subscription.subscribers = {
+                subscriber
+                for subscriber in subscription.subscribers
+                if subscriber[0] is not session
+            }
+            if not subscription.subscribers:
+                await self._drop_subscription(upstream, subscription)
+
+        if not session.server.closed:
+            await session.server.close()
+
+        # Last add-on is gone
+        if not upstream.sessions and not upstream.client.closed:
+            await upstream.client.close()
+
+    async def _read_upstream(self, upstream: MuxUpstream) -> None:
+        """Dispatch messages of Core to the add-ons of a connection."""
+        try:
+            async for msg in upstream.client:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                for message in data if isinstance(data, list) else [data]:
+                    await self._dispatch(upstream, message)
+
+        except (ValueError, TypeError, KeyError) as err:
+            _LOGGER.error("Invalid message from Home Assistant WebSocket: %s", err)
+        except (RuntimeError, ConnectionError) as err:
+            _LOGGER.info("Home Assistant WebSocket API error: %s", err)
+
+        finally:
+            if self._upstream is upstream:
+                self._upstream = None
+            if not upstream.client.closed:
+                await upstream.client.close()
+
+            # Add-ons reconnect like after a restart of Core
+            for session in list(upstream.sessions):
+                await session.server.close()
+            upstream.routes.clear()
+            upstream.subscriptions.clear()
+            upstream.subscription_ids.clear()
+
+    async def _dispatch(self, upstream: MuxUpstream, message: dict[str, Any]) -> None:
+        """Pass a message of Core to the add-ons it belongs to."""
+        upstream_id = message.get("id")
+
+        if subscription := upstream.subscription_ids.get(upstream_id):
+            if message["type"] == "result":
+                subscription.confirmed = message.get("success", False)
+                if not subscription.confirmed:
+                    upstream.subscriptions.pop(subscription.key, None)
+                    upstream.subscription_ids.pop(upstream_id, None)
+                elif not subscription.subscribers:
+                    await self._drop_subscription(upstream, subscription)
+                    return
+            targets = list(subscription.subscribers)
+
+        elif route := upstream.routes.get(upstream_id):
+            session, local_id, command = route
+            targets = [(session, local_id)]
+
+            # Keep routes of subscriptions only
+            if message["type"] == "result" and (
+                not message.get("success")
+                or not (
+                    command.startswith("subscribe_") or command in STREAMING_COMMANDS
+                )
+            ):
+                upstream.routes.pop(upstream_id)
+                session.ids.pop(local_id, None)
+
+        else:
+            return
+
+        for session, local_id in targets:
+            if session.server.closed:
+                continue
+            try:
+                await session.server.send_json({**message, "id": local_id})
+            except ConnectionError as err:
+                _LOGGER.debug("Can't relay to %s: %s", session.addon.slug, err)
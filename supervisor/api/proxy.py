@@ -11,6 +11,7 @@ from aiohttp.web_exceptions import HTTPBadGateway, HTTPUnauthorized
 
 from ..coresys import CoreSysAttributes
 from ..exceptions import APIError, HomeAssistantAPIError, HomeAssistantAuthError
+from .multiplexer import WebSocketMultiplexer
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -22,6 +23,8 @@ HEADER_HA_ACCESS = "X-Ha-Access"
 class APIProxy(CoreSysAttributes):
     """API Proxy for Home Assistant."""
 
+    _multiplexer: WebSocketMultiplexer | None = None
+
     def _check_access(self, request: web.Request):
         """Check the Supervisor token."""
         if AUTHORIZATION in request.headers:
@@ -197,6 +200,15 @@ class APIProxy(CoreSysAttributes):
             _LOGGER.error("Can't initialize handshake: %s", err)
             return server
 
+        # Share one connection between add-ons
+        if self.sys_config.websocket_multiplex:
+            if not self._multiplexer:
+                self._multiplexer = WebSocketMultiplexer(
+                    self.coresys, self._websocket_client
+                )
+            await self._multiplexer.handle(server, addon)
+            return server
+
         # init connection to hass
         try:
             client = await self._websocket_client()
@@ -204,31 +216,14 @@ class APIProxy(CoreSysAttributes):
             return server
 
         _LOGGER.info("Home Assistant WebSocket API request running")
+        pumps = [
+            self.sys_create_task(_websocket_pump(server, client)),
+            self.sys_create_task(_websocket_pump(client, server)),
+        ]
         try:
-            client_read = None
-            server_read = None
-            while not server.closed and not client.closed:
-                if not client_read:
-                    client_read = self.sys_create_task(client.receive_str())
-                if not server_read:
-                    server_read = self.sys_create_task(server.receive_str())
-
-                # wait until data need to be processed
-                await asyncio.wait(
-                    [client_read, server_read], return_when=asyncio.FIRST_COMPLETED
-                )
-
-                # server
-                if server_read.done() and not client.closed:
-                    server_read.exception()
-                    await client.send_str(server_read.result())
-                    server_read = None
-
-                # client
-                if client_read.done() and not server.closed:
-                    client_read.exception()
-                    await server.send_str(client_read.result())
-                    client_read = None
+            done, _ = await asyncio.wait(pumps, return_when=asyncio.FIRST_COMPLETED)
+            for pump in done:
+                pump.result()
 
         except asyncio.CancelledError:
             pass
@@ -237,10 +232,8 @@ class APIProxy(CoreSysAttributes):
             _LOGGER.info("Home Assistant WebSocket API error: %s", err)
 
         finally:
-            if client_read:
-                client_read.cancel()
-            if server_read:
-                server_read.cancel()
+            for pump in pumps:
+                pump.cancel()
 
             # close connections
             if not client.closed:
@@ -250,3 +243,24 @@ class APIProxy(CoreSysAttributes):
 
         _LOGGER.info("Home Assistant WebSocket API connection is closed")
         return server
+
+
+async def _websocket_pump(
+    ws_from: web.WebSocketResponse | aiohttp.ClientWebSocketResponse,
+    ws_to: web.WebSocketResponse | aiohttp.ClientWebSocketResponse,
+) -> None:
+    """Forward frames from one websocket to the other until it is closed.
+
+    Pings are answered by each side itself, both keep their own heartbeat.
+    """
+    async for msg in ws_from:
+        if msg.type == aiohttp.WSMsgType.TEXT:
+            await ws_to.send_str(msg.data)
+        elif msg.type == aiohttp.WSMsgType.BINARY:
+            await ws_to.send_bytes(msg.data)
+        elif msg.type == aiohttp.WSMsgType.ERROR:
+            raise ConnectionError(ws_from.exception())
+
+    # Pass on close code of the other side
+    if not ws_to.closed:
+        await ws_to.close(code=ws_from.close_code or aiohttp.WSCloseCode.OK)
@@ -1,5 +1,7 @@
 """Init file for Supervisor Home Assistant RESTful API."""
 import asyncio
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any, Awaitable
 
 from aiohttp import web
@@ -8,7 +10,17 @@ import voluptuous as vol
 from ..addons import AnyAddon
 from ..addons.utils import rating_security
 from ..api.const import ATTR_SIGNED
-from ..api.utils import api_process, api_process_raw, api_validate
+from ..api.utils import (
+    ResponseCache,
+    ResponseTag,
+    addons_tag,
+    api_cache,
+    api_etag,
+    api_process,
+    api_process_raw,
+    api_validate,
+    generation_tag,
+)
 from ..const import (
     ATTR_ADDONS,
     ATTR_ADVANCED,
@@ -53,7 +65,7 @@ from ..exceptions import APIError, APIForbidden
 from ..store.addon import AddonStore
 from ..store.repository import Repository
 from ..store.validate import validate_repository
-from .const import CONTENT_TYPE_PNG, CONTENT_TYPE_TEXT
+from .const import CACHE_CONTROL_ASSET, CONTENT_TYPE_PNG, CONTENT_TYPE_TEXT
 
 SCHEMA_UPDATE = vol.Schema(
     {
@@ -66,9 +78,51 @@ SCHEMA_ADD_REPOSITORY = vol.Schema(
 )
 
 
+def _asset_tag(
+    attribute: str,
+) -> Callable[["APIStore", web.Request], ResponseTag | None]:
+    """Return function to get the tag of an add-on file."""
+
+    def get_tag(api: "APIStore", request: web.Request) -> ResponseTag | None:
+        """Return tag of an add-on file."""
+        return api.asset_tag(request, attribute)
+
+    return get_tag
+
+
 class APIStore(CoreSysAttributes):
     """Handle RESTful API for store functions."""
 
+    response_cache: ResponseCache
+
+    def __init__(self) -> None:
+        """Initialize store API."""
+        self._asset_tags: dict[Path, tuple[int, ResponseTag | None]] = {}
+
+    def asset_tag(self, request: web.Request, attribute: str) -> ResponseTag | None:
+        """Return tag of an add-on file, files only change with the store."""
+        addon = self.sys_addons.store.get(request.match_info.get("addon"))
+        if not addon:
+            return None
+
+        path: Path = getattr(addon, attribute)
+        generation = self.sys_addons.generation
+        if (cached := self._asset_tags.get(path)) and cached[0] == generation:
+            return cached[1]
+
+        try:
+            stat = path.stat()
+        except OSError:
+            tag = None
+        else:
+            tag = ResponseTag(
+                generation_tag(generation, stat.st_mtime_ns, stat.st_size),
+                stat.st_mtime,
+            )
+
+        self._asset_tags[path] = (generation, tag)
+        return tag
+
     def _extract_addon(self, request: web.Request, installed=False) -> AnyAddon:
         """Return add-on, throw an exception it it doesn't exist."""
         addon_slug: str = request.match_info.get("addon")
@@ -170,6 +224,8 @@ class APIStore(CoreSysAttributes):
         """Reload all add-on data from store."""
         await asyncio.shield(self.sys_store.reload())
 
+    @api_etag(addons_tag)
+    @api_cache(addons_tag)
     @api_process
     async def store_info(self, request: web.Request) -> dict[str, Any]:
         """Return store information."""
@@ -184,6 +240,8 @@ class APIStore(CoreSysAttributes):
             ],
         }
 
+    @api_etag(addons_tag)
+    @api_cache(addons_tag)
     @api_process
     async def addons_list(self, request: web.Request) -> list[dict[str, Any]]:
         """Return all store add-ons."""
@@ -209,6 +267,8 @@ class APIStore(CoreSysAttributes):
 
         return await asyncio.shield(addon.update(backup=body.get(ATTR_BACKUP)))
 
+    @api_etag(addons_tag)
+    @api_cache(addons_tag)
     @api_process
     async def addons_addon_info(self, request: web.Request) -> dict[str, Any]:
         """Return add-on information."""
@@ -220,6 +280,7 @@ class APIStore(CoreSysAttributes):
         addon: AddonStore = self._extract_addon(request)
         return self._generate_addon_information(addon, True)
 
+    @api_etag(_asset_tag("path_icon"), CACHE_CONTROL_ASSET)
     @api_process_raw(CONTENT_TYPE_PNG)
     async def addons_addon_icon(self, request: web.Request) -> bytes:
         """Return icon from add-on."""
@@ -230,6 +291,7 @@ class APIStore(CoreSysAttributes):
         with addon.path_icon.open("rb") as png:
             return png.read()
 
+    @api_etag(_asset_tag("path_logo"), CACHE_CONTROL_ASSET)
     @api_process_raw(CONTENT_TYPE_PNG)
     async def addons_addon_logo(self, request: web.Request) -> bytes:
         """Return logo from add-on."""
@@ -240,6 +302,7 @@ class APIStore(CoreSysAttributes):
         with addon.path_logo.open("rb") as png:
             return png.read()
 
+    @api_etag(_asset_tag("path_changelog"))
     @api_process_raw(CONTENT_TYPE_TEXT)
     async def addons_addon_changelog(self, request: web.Request) -> str:
         """Return changelog from add-on."""
@@ -250,6 +313,7 @@ class APIStore(CoreSysAttributes):
         with addon.path_changelog.open("r") as changelog:
             return changelog.read()
 
+    @api_etag(_asset_tag("path_documentation"))
     @api_process_raw(CONTENT_TYPE_TEXT)
     async def addons_addon_documentation(self, request: web.Request) -> str:
         """Return documentation from add-on."""
@@ -9,6 +9,7 @@ import voluptuous as vol
 from ..const import (
     ATTR_ADDONS,
     ATTR_ADDONS_REPOSITORIES,
+    ATTR_API_COMPRESSION,
     ATTR_ARCH,
     ATTR_AUTO_UPDATE,
     ATTR_BLK_READ,
@@ -39,6 +40,7 @@ from ..const import (
     ATTR_VERSION,
     ATTR_VERSION_LATEST,
     ATTR_WAIT_BOOT,
+    ATTR_WEBSOCKET_MULTIPLEX,
     LogLevel,
     UpdateChannel,
 )
@@ -47,8 +49,14 @@ from ..exceptions import APIError
 from ..store.validate import repositories
 from ..utils.validate import validate_timezone
 from ..validate import version_tag, wait_boot
-from .const import CONTENT_TYPE_BINARY
-from .utils import api_process, api_process_raw, api_validate
+from .const import ATTR_ENTRIES, ATTR_HITS, ATTR_MISSES, CONTENT_TYPE_BINARY
+from .utils import (
+    ResponseCache,
+    api_process,
+    api_process_raw,
+    api_stream_logs,
+    api_validate,
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -66,6 +74,8 @@ SCHEMA_OPTIONS = vol.Schema(
         vol.Optional(ATTR_CONTENT_TRUST): vol.Boolean(),
         vol.Optional(ATTR_FORCE_SECURITY): vol.Boolean(),
         vol.Optional(ATTR_AUTO_UPDATE): vol.Boolean(),
+        vol.Optional(ATTR_WEBSOCKET_MULTIPLEX): vol.Boolean(),
+        vol.Optional(ATTR_API_COMPRESSION): vol.Boolean(),
     }
 )
 
@@ -75,6 +85,8 @@ SCHEMA_VERSION = vol.Schema({vol.Optional(ATTR_VERSION): version_tag})
 class APISupervisor(CoreSysAttributes):
     """Handle RESTful API for Supervisor functions."""
 
+    response_cache: ResponseCache
+
     @api_process
     async def ping(self, request):
         """Return ok for signal that the API is ready."""
@@ -99,6 +111,8 @@ class APISupervisor(CoreSysAttributes):
             ATTR_DEBUG_BLOCK: self.sys_config.debug_block,
             ATTR_DIAGNOSTICS: self.sys_config.diagnostics,
             ATTR_AUTO_UPDATE: self.sys_updater.auto_update,
+            ATTR_WEBSOCKET_MULTIPLEX: self.sys_config.websocket_multiplex,
+            ATTR_API_COMPRESSION: self.sys_config.api_compression,
             # Depricated
             ATTR_ADDONS: [
                 {
@@ -149,6 +163,12 @@ class APISupervisor(CoreSysAttributes):
         if ATTR_AUTO_UPDATE in body:
             self.sys_updater.auto_update = body[ATTR_AUTO_UPDATE]
 
+        if ATTR_WEBSOCKET_MULTIPLEX in body:
+            self.sys_config.websocket_multiplex = body[ATTR_WEBSOCKET_MULTIPLEX]
+
+        if ATTR_API_COMPRESSION in body:
+            self.sys_config.api_compression = body[ATTR_API_COMPRESSION]
+
         # Save changes before processing addons in case of errors
         self.sys_updater.save_data()
         self.sys_config.save_data()
@@ -177,6 +197,15 @@ class APISupervisor(CoreSysAttributes):
             ATTR_BLK_WRITE: stats.blk_write,
         }
 
+    @api_process
+    async def cache(self, request: web.Request) -> dict[str, Any]:
+        """Return usage of the API response cache."""
+        return {
+            ATTR_ENTRIES: len(self.response_cache),
+            ATTR_HITS: self.response_cache.hits,
+            ATTR_MISSES: self.response_cache.misses,
+        }
+
     @api_process
     async def update(self, request: web.Request) -> None:
         """Update Supervisor OS."""
@@ -219,6 +248,6 @@ class APISupervisor(CoreSysAttributes):
         return asyncio.shield(self.sys_supervisor.restart())
 
     @api_process_raw(CONTENT_TYPE_BINARY)
-    def logs(self, request: web.Request) -> Awaitable[bytes]:
+    async def logs(self, request: web.Request) -> web.StreamResponse:
         """Return supervisor Docker logs."""
-        return self.sys_supervisor.logs()
+        return await api_stream_logs(request, self.sys_supervisor.instance)
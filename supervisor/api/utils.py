@@ -1,9 +1,15 @@
 """Init file for Supervisor util for RESTful API."""
-import json
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+import logging
+import re
+import secrets
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
 
 from aiohttp import web
-from aiohttp.hdrs import AUTHORIZATION
+from aiohttp.hdrs import ACCEPT_ENCODING, AUTHORIZATION, CACHE_CONTROL, VARY
 from aiohttp.web_exceptions import HTTPUnauthorized
 from aiohttp.web_request import Request
 import voluptuous as vol
@@ -17,12 +23,61 @@ from ..const import (
     RESULT_ERROR,
     RESULT_OK,
 )
-from ..coresys import CoreSys
-from ..exceptions import APIError, APIForbidden, DockerAPIError, HassioError
+from ..coresys import CoreSys, CoreSysAttributes
+from ..docker.interface import DockerInterface
+from ..exceptions import (
+    APIError,
+    APIForbidden,
+    DockerAPIError,
+    DockerError,
+    HassioError,
+)
 from ..utils import check_exception_chain, get_message_from_exception_chain
-from ..utils.json import JSONEncoder
+from ..utils.dt import UTC, parse_datetime
+from ..utils.json import json_bytes, json_loads as _json_loads
 from ..utils.log_format import format_message
-from .const import CONTENT_TYPE_BINARY, HEADER_TOKEN, HEADER_TOKEN_OLD
+from .const import (
+    ATTR_FILTER,
+    ATTR_FOLLOW,
+    ATTR_SINCE,
+    ATTR_TAIL,
+    ATTR_TIMESTAMPS,
+    CACHE_CONTROL_REVALIDATE,
+    CONTENT_TYPE_BINARY,
+    CONTENT_TYPE_JSON,
+    HEADER_TOKEN,
+    HEADER_TOKEN_OLD,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Tags of a previous run don't match
+_INSTANCE_TAG = secrets.token_hex(4)
+
+# Responses kept per cache, least recently used are dropped first
+RESPONSE_CACHE_SIZE = 256
+
+
+class ResponseTag(NamedTuple):
+    """Validators of a cacheable response."""
+
+    etag: str
+    last_modified: float | None = None
+
+    def matches(self, request: web.Request) -> bool:
+        """Return True if the client has this version already."""
+        if request.if_none_match:
+            return any(tag.value == self.etag for tag in request.if_none_match)
+        if self.last_modified is not None and request.if_modified_since:
+            return request.if_modified_since.timestamp() >= int(self.last_modified)
+        return False
+
+    def apply(self, response: web.StreamResponse, cache_control: str) -> None:
+        """Set validators on a response."""
+        response.etag = self.etag
+        if self.last_modified is not None:
+            response.last_modified = self.last_modified
+        response.headers[CACHE_CONTROL] = cache_control
 
 
 def excract_supervisor_token(request: web.Request) -> str | None:
@@ -46,8 +101,8 @@ def json_loads(data: Any) -> dict[str, Any]:
     if not data:
         return {}
     try:
-        return json.loads(data)
-    except json.JSONDecodeError as err:
+        return _json_loads(data)
+    except ValueError as err:
         raise APIError("Invalid json") from err
 
 
@@ -72,6 +127,148 @@ def api_process(method):
     return wrap_api
 
 
+class ResponseCache:
+    """Serialized API responses, valid as long as their tag."""
+
+    def __init__(self, size: int = RESPONSE_CACHE_SIZE) -> None:
+        """Initialize cache."""
+        self._bodies: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._size: int = size
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        """Return number of cached responses."""
+        return len(self._bodies)
+
+    def get(self, key: str, etag: str) -> bytes | None:
+        """Return cached body if it has this tag."""
+        cached = self._bodies.get(key)
+        if cached and cached[0] == etag:
+            self._bodies.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, etag: str, body: bytes) -> None:
+        """Cache body with its tag, replaces older versions."""
+        self._bodies[key] = (etag, body)
+        self._bodies.move_to_end(key)
+        if len(self._bodies) > self._size:
+            self._bodies.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._bodies.clear()
+
+
+def accepted_codings(request: web.Request) -> set[str]:
+    """Return content codings the client accepts."""
+    accepted: set[str] = set()
+    for coding in request.headers.get(ACCEPT_ENCODING, "").split(","):
+        name, _, params = coding.strip().lower().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            accepted.add(name.strip())
+    return accepted
+
+
+def generation_tag(*parts: Any) -> str:
+    """Return entity tag of a version of data in this run."""
+    return "-".join([_INSTANCE_TAG, *(str(part) for part in parts)])
+
+
+def addons_tag(api: CoreSysAttributes, request: web.Request) -> ResponseTag:
+    """Return tag of responses built from add-on, store and hardware data."""
+    return ResponseTag(
+        generation_tag(
+            api.sys_addons.generation,
+            api.sys_hardware.generation,
+            api.sys_homeassistant.version,
+        )
+    )
+
+
+def api_etag(
+    get_tag: Callable[[Any, web.Request], ResponseTag | None],
+    cache_control: str = CACHE_CONTROL_REVALIDATE,
+):
+    """Answer conditional requests without running the wrapped function.
+
+    The tag is computed first, errors of the function get no validators.
+    """
+
+    def wrap_method(method):
+        """Wrap function with a conditional response."""
+
+        async def wrap_api(api, request: web.Request, *args, **kwargs):
+            """Return API information or not modified."""
+            tag = get_tag(api, request)
+            if tag and tag.matches(request):
+                response = web.Response(status=304)
+                tag.apply(response, cache_control)
+                return response
+
+            response = await method(api, request, *args, **kwargs)
+            if tag and response.status == 200:
+                tag.apply(response, cache_control)
+            return response
+
+        return wrap_api
+
+    return wrap_method
+
+
+def cache_key(request: web.Request, query: tuple[str, ...] = ()) -> str:
+    """Return cache key of the path and the query parameters in use."""
+    params = [(name, request.query[name]) for name in query if name in request.query]
+    if not params:
+        return request.path
+    return f"{request.path}?{urlencode(params)}"
+
+
+def api_cache(
+    get_tag: Callable[[Any, web.Request], ResponseTag], query: tuple[str, ...] = ()
+):
+    """Reuse serialized JSON responses as long as their tag is the same.
+
+    The API object needs a response_cache. Responses are cached per path and
+    the query parameters the function reads. Requests of an add-on for itself
+    are not cached.
+    """
+
+    def wrap_method(method):
+        """Wrap function with a response cache."""
+
+        async def wrap_api(api, request: web.Request, *args, **kwargs):
+            """Return cached or new API information."""
+            cache: ResponseCache = api.response_cache
+            if request.match_info.get("addon") == "self":
+                return await method(api, request, *args, **kwargs)
+
+            etag = get_tag(api, request).etag
+            key = cache_key(request, query)
+            if (body := cache.get(key, etag)) is not None:
+                return web.Response(
+                    body=body, content_type=CONTENT_TYPE_JSON, charset="utf-8"
+                )
+
+            response = await method(api, request, *args, **kwargs)
+            if response.status == 200 and isinstance(response.body, bytes):
+                cache.set(key, etag, response.body)
+            return response
+
+        return wrap_api
+
+    return wrap_method
+
+
 def require_home_assistant(method):
     """Ensure that the request comes from Home Assistant."""
 
@@ -104,6 +301,8 @@ def api_process_raw(content):
                 msg_data = b""
                 msg_type = CONTENT_TYPE_BINARY
 
+            if isinstance(msg_data, web.StreamResponse):
+                return msg_data
             return web.Response(body=msg_data, content_type=msg_type)
 
         return wrap_api
@@ -120,21 +319,25 @@ def api_return_error(
         if check_exception_chain(error, DockerAPIError):
             message = format_message(message)
 
-    return web.json_response(
-        {
-            JSON_RESULT: RESULT_ERROR,
-            JSON_MESSAGE: message or "Unknown error, see supervisor",
-        },
+    return web.Response(
+        body=json_bytes(
+            {
+                JSON_RESULT: RESULT_ERROR,
+                JSON_MESSAGE: message or "Unknown error, see supervisor",
+            }
+        ),
         status=400,
-        dumps=lambda x: json.dumps(x, cls=JSONEncoder),
+        content_type=CONTENT_TYPE_JSON,
+        charset="utf-8",
     )
 
 
 def api_return_ok(data: dict[str, Any] | None = None) -> web.Response:
     """Return an API ok answer."""
-    return web.json_response(
-        {JSON_RESULT: RESULT_OK, JSON_DATA: data or {}},
-        dumps=lambda x: json.dumps(x, cls=JSONEncoder),
+    return web.Response(
+        body=json_bytes({JSON_RESULT: RESULT_OK, JSON_DATA: data or {}}),
+        content_type=CONTENT_TYPE_JSON,
+        charset="utf-8",
     )
 
 
@@ -157,3 +360,116 @@ async def api_validate(
         data_validated[origin_value] = data[origin_value]
 
     return data_validated
+
+
+RE_LOG_CURSOR = re.compile(r"^(\d+)(?:\.(\d{1,9}))?$")
+
+# Filtered lines are cut at this length
+LOG_LINE_MAX = 64 * 1024
+
+
+def log_cursor(value: str) -> str:
+    """Return Docker timestamp of a unix time or date of a log line."""
+    if match := RE_LOG_CURSOR.match(value):
+        return f"{match.group(1)}.{(match.group(2) or '').ljust(9, '0')}"
+
+    if (date := parse_datetime(value)) is None:
+        raise vol.Invalid(f"{value} is not a unix time or date")
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=UTC)
+    return f"{int(date.timestamp())}.{date.microsecond * 1000:09d}"
+
+
+# pylint: disable=no-value-for-parameter
+SCHEMA_LOGS = vol.Schema(
+    {
+        vol.Optional(ATTR_FOLLOW, default=False): vol.Boolean(),
+        vol.Optional(ATTR_TAIL, default=100): vol.Any(
+            "all", vol.All(vol.Coerce(int), vol.Range(min=0))
+        ),
+        vol.Optional(ATTR_SINCE): log_cursor,
+        vol.Optional(ATTR_TIMESTAMPS, default=False): vol.Boolean(),
+        vol.Optional(ATTR_FILTER): vol.All(str, vol.Length(min=1)),
+    }
+)
+
+
+async def filter_lines(
+    chunks: AsyncIterator[bytes], pattern: bytes
+) -> AsyncIterator[bytes]:
+    """Yield lines of a stream which contain pattern.
+
+    Lines longer than LOG_LINE_MAX are cut, the rest of them is dropped.
+    """
+    partial = b""
+    overlong = False
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            if overlong:
+                if (end := chunk.find(b"\n")) < 0:
+                    continue
+                chunk = chunk[end:]
+                overlong = False
+
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()
+            if len(partial) > LOG_LINE_MAX:
+                partial = partial[:LOG_LINE_MAX]
+                overlong = True
+
+            if matched := [line + b"\n" for line in lines if pattern in line]:
+                yield b"".join(matched)
+
+    if pattern in partial:
+        yield partial
+
+
+async def api_stream_logs(
+    request: web.Request, instance: DockerInterface
+) -> web.StreamResponse:
+    """Send logs of a container as they are read from Docker.
+
+    Last lines are sent by default, follow keeps the response open for new
+    lines until the client disconnects.
+    """
+    try:
+        query = SCHEMA_LOGS(dict(request.query))
+    except vol.Invalid as ex:
+        raise APIError(humanize_error(dict(request.query), ex)) from None
+
+    try:
+        chunks = await instance.logs_stream(
+            follow=query[ATTR_FOLLOW],
+            tail=query[ATTR_TAIL],
+            since=query.get(ATTR_SINCE),
+            timestamps=query[ATTR_TIMESTAMPS],
+        )
+    except DockerError as err:
+        raise APIError(f"Can't read logs of {instance.name}: {err}") from err
+
+    if ATTR_FILTER in query:
+        chunks = filter_lines(chunks, query[ATTR_FILTER].encode())
+
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_BINARY
+
+    # Compressed data is held back until enough is written, not for follow
+    if instance.sys_config.api_compression and not query[ATTR_FOLLOW]:
+        response.headers[VARY] = ACCEPT_ENCODING
+        if "gzip" in accepted_codings(request):
+            response.enable_compression(web.ContentCoding.gzip)
+    await response.prepare(request)
+
+    # Closing the generator ends the request to Docker right away
+    try:
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                await response.write(chunk)
+    except DockerError as err:
+        _LOGGER.warning("Log stream of %s ended: %s", instance.name, err)
+    except ConnectionResetError:
+        # Client is gone
+        return response
+
+    await response.write_eof()
+    return response
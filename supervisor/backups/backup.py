@@ -1,31 +1,47 @@
 """Representation of a backup file."""
+from __future__ import annotations
+
+import asyncio
 from base64 import b64decode, b64encode
+from collections.abc import Iterator
+import copy
 from datetime import timedelta
+from functools import partial
+import io
 import json
 import logging
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
 import tarfile
 from tempfile import TemporaryDirectory
-from typing import Any, Awaitable
+from threading import Lock
+import time
+from typing import Any, Awaitable, Callable
 
 from awesomeversion import AwesomeVersion, AwesomeVersionCompareException
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from securetar import SecureTarFile, atomic_contents_add, secure_path
+from securetar import SecureTarFile, atomic_contents_add
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from ..addons import Addon
 from ..const import (
     ATTR_ADDONS,
+    ATTR_CODEC,
     ATTR_COMPRESSED,
     ATTR_CRYPTO,
     ATTR_DATE,
     ATTR_DOCKER,
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
+    ATTR_INCREMENTAL,
+    ATTR_KEY_DIGEST,
+    ATTR_LAYERS,
+    ATTR_LEVEL,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PASSWORD,
     ATTR_PROTECTED,
     ATTR_REGISTRIES,
@@ -42,9 +58,12 @@ from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import AddonsError, BackupError
 from ..utils import remove_folder
 from ..utils.dt import parse_datetime, utcnow
-from ..utils.json import write_json_file
-from .const import BackupType
-from .utils import key_to_iv, password_to_key
+from ..utils.json import JSONEncoder
+from .codec import codec_from_name, inner_tar_name, is_compressible
+from .const import BackupCodec, BackupType
+from .incremental import DataManifest, FileState, manifest_name, merge_layers
+from .stream import InnerSecureTarFile, InnerSecureTarReader, SpooledInnerSecureTarFile
+from .utils import key_digest, key_to_iv, password_to_key
 from .validate import SCHEMA_BACKUP
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -58,10 +77,17 @@ class Backup(CoreSysAttributes):
         self.coresys: CoreSys = coresys
         self._tarfile: Path = tar_file
         self._data: dict[str, Any] = {}
-        self._tmp = None
+        self._members: dict[str, tarfile.TarInfo] = {}
+        self._outer_tar: tarfile.TarFile | None = None
+        self._parent_used: bool = False
         self._key: bytes | None = None
         self._aes: Cipher | None = None
 
+    @property
+    def data(self) -> dict[str, Any]:
+        """Return backup.json data."""
+        return self._data
+
     @property
     def version(self) -> int:
         """Return backup version."""
@@ -97,6 +123,38 @@ class Backup(CoreSysAttributes):
         """Return whether backup is compressed."""
         return self._data[ATTR_COMPRESSED]
 
+    @property
+    def codec(self) -> BackupCodec:
+        """Return compression codec, gzip for backups without one recorded."""
+        if codec := self._data.get(ATTR_CODEC):
+            return codec
+        return BackupCodec.GZIP if self.compressed else BackupCodec.NONE
+
+    @property
+    def level(self) -> int | None:
+        """Return compression level."""
+        return self._data.get(ATTR_LEVEL)
+
+    @property
+    def incremental(self) -> bool:
+        """Return True if add-on data is stored against a parent backup."""
+        return self._data.get(ATTR_INCREMENTAL, False)
+
+    @property
+    def parent(self) -> str | None:
+        """Return slug of the parent backup."""
+        return self._data.get(ATTR_PARENT)
+
+    @property
+    def key_digest(self) -> str | None:
+        """Return digest of the key of an incremental backup."""
+        return self._data.get(ATTR_KEY_DIGEST)
+
+    @property
+    def layers(self) -> list[str]:
+        """Return slugs of removed parents folded into this backup."""
+        return self._data.get(ATTR_LAYERS, [])
+
     @property
     def addons(self):
         """Return backup date."""
@@ -173,7 +231,19 @@ class Backup(CoreSysAttributes):
             days=self.sys_backups.days_until_stale
         )
 
-    def new(self, slug, name, date, sys_type, password=None, compressed=True):
+    def new(
+        self,
+        slug,
+        name,
+        date,
+        sys_type,
+        password=None,
+        compressed=True,
+        incremental=False,
+        parent=None,
+        codec=None,
+        level=None,
+    ):
         """Initialize a new backup."""
         # Init metadata
         self._data[ATTR_VERSION] = 2
@@ -192,8 +262,19 @@ class Backup(CoreSysAttributes):
             self._data[ATTR_PROTECTED] = True
             self._data[ATTR_CRYPTO] = CRYPTO_AES128
 
-        if not compressed:
+        if not compressed or codec == BackupCodec.NONE:
             self._data[ATTR_COMPRESSED] = False
+            self._data[ATTR_CODEC] = BackupCodec.NONE
+        else:
+            self._data[ATTR_CODEC] = codec or BackupCodec.GZIP
+            self._data[ATTR_LEVEL] = level
+
+        if incremental:
+            self._data[ATTR_INCREMENTAL] = True
+            self._data[ATTR_PARENT] = parent
+            if self._key:
+                # Children can only share parent layers with the same key
+                self._data[ATTR_KEY_DIGEST] = key_digest(self._key)
 
     def set_password(self, password: str) -> bool:
         """Set the password for an existing backup."""
@@ -263,7 +344,10 @@ class Backup(CoreSysAttributes):
             _LOGGER.error("Can't read data for %s: %s", self.tarfile, err)
             return False
 
-        # validate
+        return self.load_data(raw_dict)
+
+    def load_data(self, raw_dict: dict[str, Any]) -> bool:
+        """Validate and use backup.json data, read from tar file or index."""
         try:
             self._data = SCHEMA_BACKUP(raw_dict)
         except vol.Invalid as err:
@@ -278,135 +362,454 @@ class Backup(CoreSysAttributes):
 
     async def __aenter__(self):
         """Async context to open a backup."""
-        self._tmp = TemporaryDirectory(dir=str(self.sys_config.path_tmp))
-
-        # create a backup
+        # create a backup, inner tarfiles are streamed into it
         if not self.tarfile.is_file():
+            # GNU format keeps member headers a single block for any size
+            self._outer_tar = await self.sys_run_in_executor(
+                partial(tarfile.open, self.tarfile, "w:", format=tarfile.GNU_FORMAT)
+            )
             return self
 
-        # extract an existing backup
-        def _extract_backup():
-            """Extract a backup."""
-            with tarfile.open(self.tarfile, "r:") as tar:
-                tar.extractall(path=self._tmp.name, members=secure_path(tar))
-
-        await self.sys_run_in_executor(_extract_backup)
+        # index an existing backup, inner tarfiles are read in place
+        self._members = await self.sys_run_in_executor(self._read_members)
 
     async def __aexit__(self, exception_type, exception_value, traceback):
         """Async context to close a backup."""
-        # exists backup or exception on build
-        if self.tarfile.is_file() or exception_type is not None:
-            self._tmp.cleanup()
+        # exists backup
+        if self._outer_tar is None:
+            self._members = {}
             return
 
-        # validate data
+        def _discard_backup():
+            """Remove an incomplete backup."""
+            self._outer_tar.close()
+            self.tarfile.unlink(missing_ok=True)
+
         try:
-            self._data = SCHEMA_BACKUP(self._data)
-        except vol.Invalid as err:
-            _LOGGER.error(
-                "Invalid data for %s: %s", self.tarfile, humanize_error(self._data, err)
+            # exception on build
+            if exception_type is not None:
+                await self.sys_run_in_executor(_discard_backup)
+                return
+
+            # validate data
+            try:
+                self._data = SCHEMA_BACKUP(self._data)
+            except vol.Invalid as err:
+                _LOGGER.error(
+                    "Invalid data for %s: %s",
+                    self.tarfile,
+                    humanize_error(self._data, err),
+                )
+                await self.sys_run_in_executor(_discard_backup)
+                raise ValueError("Invalid config") from None
+
+            # new backup, append metadata last
+            def _finish_backup():
+                """Write backup.json and close the backup."""
+                self._add_member(
+                    self._outer_tar,
+                    "backup.json",
+                    json.dumps(self._data, indent=2, cls=JSONEncoder),
+                )
+                self._outer_tar.close()
+
+            try:
+                await self.sys_run_in_executor(_finish_backup)
+            except (OSError, ValueError, TypeError) as err:
+                _LOGGER.error("Can't write backup: %s", err)
+                self.tarfile.unlink(missing_ok=True)
+        finally:
+            self._outer_tar = None
+
+    def _read_members(self) -> dict[str, tarfile.TarInfo]:
+        """Read member offsets of a backup."""
+        with tarfile.open(self.tarfile, "r:") as tar:
+            return {
+                PurePath(member.name).as_posix(): member
+                for member in tar.getmembers()
+                if member.isfile()
+            }
+
+    def _read_member(self, name: str) -> str | None:
+        """Read a text member of a backup."""
+        with tarfile.open(self.tarfile, "r:") as tar:
+            try:
+                return tar.extractfile(f"./{name}").read().decode()
+            except KeyError:
+                return None
+
+    @staticmethod
+    def _add_member(tar: tarfile.TarFile, name: str, data: str) -> None:
+        """Add a text member to a backup."""
+        raw = data.encode()
+        tar_info = tarfile.TarInfo(name=f"./{name}")
+        tar_info.size = len(raw)
+        tar_info.mtime = int(time.time())
+        tar.addfile(tar_info, io.BytesIO(raw))
+
+    def _inner_tar(self, name: str) -> InnerSecureTarReader | None:
+        """Return reader for an inner tarfile of an opened backup, any codec."""
+        for codec in BackupCodec:
+            if member := self._members.get(inner_tar_name(name, codec)):
+                return InnerSecureTarReader(
+                    self.tarfile, member, key=self._key, codec=codec
+                )
+        return None
+
+    def _inner_codec(self, path: Path) -> BackupCodec:
+        """Return codec for an inner tarfile, none if its data won't shrink."""
+        if self.codec == BackupCodec.NONE or is_compressible(path):
+            return self.codec
+        _LOGGER.info("Data of %s is not compressible, storing it as is", path)
+        return BackupCodec.NONE
+
+    @staticmethod
+    def _layer_names(addon_slug: str, layer: str | None) -> list[str]:
+        """Return possible names of an add-on inner tarfile or folded layer."""
+        name = f"{addon_slug}.{layer}" if layer else addon_slug
+        return [inner_tar_name(name, codec) for codec in BackupCodec]
+
+    def _addon_layers(self, addon_slug: str) -> Iterator[InnerSecureTarReader]:
+        """Yield inner tarfiles of an add-on along the chain, newest first."""
+        backup: Backup = self
+        members = self._members
+        while True:
+            for layer in [None, *backup.layers]:
+                for name in self._layer_names(addon_slug, layer):
+                    if member := members.get(name):
+                        yield InnerSecureTarReader(
+                            backup.tarfile,
+                            member,
+                            key=self._key,
+                            codec=codec_from_name(name),
+                        )
+                        break
+
+            if not backup.parent:
+                return
+            if not (parent := self.sys_backups.get(backup.parent)):
+                raise BackupError(
+                    f"Parent backup {backup.parent} of {backup.slug} is missing",
+                    _LOGGER.error,
+                )
+            backup = parent
+            members = backup._read_members()  # pylint: disable=protected-access
+
+    async def _parent_manifest(self, addon_slug: str) -> dict[str, FileState] | None:
+        """Return add-on data manifest of the parent backup."""
+        if not self.parent:
+            return None
+        if not (parent := self.sys_backups.get(self.parent)):
+            _LOGGER.warning(
+                "Parent backup %s is missing, storing all data of %s",
+                self.parent,
+                addon_slug,
             )
-            raise ValueError("Invalid config") from None
+            return None
 
-        # new backup, build it
-        def _create_backup():
-            """Create a new backup."""
-            with tarfile.open(self.tarfile, "w:") as tar:
-                tar.add(self._tmp.name, arcname=".")
+        try:
+            raw = await self.sys_run_in_executor(
+                parent._read_member,  # pylint: disable=protected-access
+                manifest_name(addon_slug),
+            )
+            if raw is None:
+                return None
+            files = DataManifest.load(self._decrypt_data(raw)).files
+            self._parent_used = True
+            return files
+        except (tarfile.TarError, OSError, ValueError, TypeError) as err:
+            _LOGGER.warning(
+                "Can't read %s manifest of parent backup %s, storing all data: %s",
+                addon_slug,
+                parent.slug,
+                err,
+            )
+            return None
+
+    async def _merge_addon(
+        self, addon_slug: str, addon_file: SecureTarFile, target: Path
+    ) -> SecureTarFile:
+        """Merge add-on data of an incremental backup with its parents."""
+        raw = await self.sys_run_in_executor(
+            self._read_member, manifest_name(addon_slug)
+        )
+        if raw is None:
+            return addon_file
+        manifest = DataManifest.load(self._decrypt_data(raw))
+
+        def _merge() -> set[str]:
+            """Write merged inner tarfile."""
+            with tarfile.open(target, "w:", format=tarfile.GNU_FORMAT) as output:
+                return merge_layers(output, self._addon_layers(addon_slug), manifest)
 
         try:
-            write_json_file(Path(self._tmp.name, "backup.json"), self._data)
-            await self.sys_run_in_executor(_create_backup)
-        except (OSError, json.JSONDecodeError) as err:
-            _LOGGER.error("Can't write backup: %s", err)
-        finally:
-            self._tmp.cleanup()
+            missing = await self.sys_run_in_executor(_merge)
+        except (tarfile.TarError, OSError) as err:
+            raise BackupError(
+                f"Can't merge {addon_slug} data with parent backups: {err}",
+                _LOGGER.error,
+            ) from err
+
+        if missing:
+            raise BackupError(
+                f"{len(missing)} files of {addon_slug} missing in parent backups",
+                _LOGGER.error,
+            )
+        return SecureTarFile(target, "r", gzip=False)
 
-    async def store_addons(self, addon_list: list[str]):
+    async def rebase(self, parent: Backup) -> None:
+        """Fold add-on data of a parent backup, which is removed, into this one.
+
+        Inner tarfiles of the parent are copied as they are, no password needed.
+        """
+        data = {
+            **self._data,
+            ATTR_PARENT: parent.parent,
+            ATTR_LAYERS: [*self.layers, parent.slug, *parent.layers],
+        }
+        temp_file = self.tarfile.with_name(f"{self.tarfile.name}.tmp")
+
+        def _rebase():
+            """Rewrite backup with layers of the parent."""
+            with tarfile.open(self.tarfile, "r:") as tar, tarfile.open(
+                parent.tarfile, "r:"
+            ) as parent_tar, tarfile.open(
+                temp_file, "w:", format=tarfile.GNU_FORMAT
+            ) as output:
+                for member in tar:
+                    if PurePath(member.name).as_posix() == "backup.json":
+                        continue
+                    output.addfile(
+                        member, tar.extractfile(member) if member.isfile() else None
+                    )
+
+                parent_members = {
+                    PurePath(member.name).as_posix(): member
+                    for member in parent_tar.getmembers()
+                }
+                for addon_slug in self.addon_list:
+                    for layer in [None, *parent.layers]:
+                        for name in self._layer_names(addon_slug, layer):
+                            if not (member := parent_members.get(name)):
+                                continue
+                            layer_member = copy.copy(member)
+                            layer_member.name = "./" + inner_tar_name(
+                                f"{addon_slug}.{layer or parent.slug}",
+                                codec_from_name(name),
+                            )
+                            output.addfile(layer_member, parent_tar.extractfile(member))
+                            break
+
+                self._add_member(
+                    output, "backup.json", json.dumps(data, indent=2, cls=JSONEncoder)
+                )
+            os.replace(temp_file, self.tarfile)
+
+        try:
+            await self.sys_run_in_executor(_rebase)
+        except (tarfile.TarError, OSError) as err:
+            temp_file.unlink(missing_ok=True)
+            raise BackupError(
+                f"Can't fold parent {parent.slug} into backup {self.slug}: {err}",
+                _LOGGER.error,
+            ) from err
+
+        self._data = data
+
+    async def _store_inner_tars(
+        self,
+        tar_names: list[str],
+        store: Callable[[int, SecureTarFile], Awaitable[None]],
+        concurrency: int,
+    ) -> None:
+        """Store inner tarfiles, up to concurrency at once.
+
+        Sequential stores stream straight into the backup. Concurrent stores
+        build their tarfiles in spools at the same time, each is appended to
+        the backup once it is done. The codec of each tarfile follows from
+        its name.
+        """
+        if concurrency <= 1:
+            for index, tar_name in enumerate(tar_names):
+                await store(
+                    index,
+                    InnerSecureTarFile(
+                        self._outer_tar,
+                        tar_name,
+                        key=self._key,
+                        codec=codec_from_name(tar_name),
+                        level=self.level,
+                    ),
+                )
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+        writer_lock = Lock()
+
+        async def _store(index: int, tar_name: str) -> None:
+            """Store an inner tarfile once a slot is free."""
+            async with semaphore:
+                await store(
+                    index,
+                    SpooledInnerSecureTarFile(
+                        self._outer_tar,
+                        tar_name,
+                        writer_lock,
+                        key=self._key,
+                        codec=codec_from_name(tar_name),
+                        level=self.level,
+                        spool_dir=self.sys_config.path_tmp,
+                    ),
+                )
+
+        # Never leave add-ons stopped mid backup, let running stores finish
+        results = await asyncio.gather(
+            *[_store(index, tar_name) for index, tar_name in enumerate(tar_names)],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def store_addons(
+        self,
+        addon_list: list[Addon],
+        concurrency: int = 1,
+        on_progress: Callable[[], None] | None = None,
+    ):
         """Add a list of add-ons into backup."""
+        addons_data: list[dict[str, Any] | None] = [None] * len(addon_list)
+        manifests: list[DataManifest | None] = [None] * len(addon_list)
 
-        async def _addon_save(addon: Addon):
+        async def _addon_save(index: int, addon_file: SecureTarFile):
             """Task to store an add-on into backup."""
-            tar_name = f"{addon.slug}.tar{'.gz' if self.compressed else ''}"
-            addon_file = SecureTarFile(
-                Path(self._tmp.name, tar_name), "w", key=self._key, gzip=self.compressed
-            )
+            addon = addon_list[index]
 
             # Take backup
             try:
-                await addon.backup(addon_file)
+                manifest = None
+                if self.incremental:
+                    manifest = DataManifest(await self._parent_manifest(addon.slug))
+                await addon.backup(addon_file, manifest)
             except AddonsError:
                 _LOGGER.error("Can't create backup for %s", addon.slug)
                 return
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Can't save Add-on %s: %s", addon.slug, err)
+                return
+            finally:
+                if on_progress:
+                    on_progress()
 
             # Store to config
-            self._data[ATTR_ADDONS].append(
-                {
-                    ATTR_SLUG: addon.slug,
-                    ATTR_NAME: addon.name,
-                    ATTR_VERSION: addon.version,
-                    ATTR_SIZE: addon_file.size,
-                }
-            )
+            manifests[index] = manifest
+            addons_data[index] = {
+                ATTR_SLUG: addon.slug,
+                ATTR_NAME: addon.name,
+                ATTR_VERSION: addon.version,
+                ATTR_SIZE: addon_file.size,
+            }
 
-        # Save Add-ons sequential
-        # avoid issue on slow IO
-        for addon in addon_list:
-            try:
-                await _addon_save(addon)
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't save Add-on %s: %s", addon.slug, err)
+        codecs = await self.sys_run_in_executor(
+            lambda: [self._inner_codec(addon.path_data) for addon in addon_list]
+        )
+        await self._store_inner_tars(
+            [
+                inner_tar_name(addon.slug, codec)
+                for addon, codec in zip(addon_list, codecs)
+            ],
+            _addon_save,
+            concurrency,
+        )
+
+        # Keep add-on order independent of completion order
+        self._data[ATTR_ADDONS].extend(data for data in addons_data if data)
+
+        def _write_manifests():
+            """Store add-on data manifests for the next incremental backup."""
+            for addon, manifest in zip(addon_list, manifests):
+                if manifest is None:
+                    continue
+                self._add_member(
+                    self._outer_tar,
+                    manifest_name(addon.slug),
+                    self._encrypt_data(manifest.dump()),
+                )
 
-    async def restore_addons(self, addon_list: list[str]):
+        if self.incremental:
+            await self.sys_run_in_executor(_write_manifests)
+
+        if self.parent and not self._parent_used:
+            # All data is in this backup, it doesn't need the parent on restore
+            _LOGGER.info(
+                "No add-on data of %s stored against parent backup %s",
+                self.slug,
+                self.parent,
+            )
+            self._data[ATTR_PARENT] = None
+
+    async def restore_addons(self, addon_list: list[str], concurrency: int = 1):
         """Restore a list add-on from backup."""
+        semaphore = asyncio.Semaphore(concurrency)
 
         async def _addon_restore(addon_slug: str):
             """Task to restore an add-on into backup."""
-            tar_name = f"{addon_slug}.tar{'.gz' if self.compressed else ''}"
-            addon_file = SecureTarFile(
-                Path(self._tmp.name, tar_name), "r", key=self._key, gzip=self.compressed
-            )
+            addon_file = self._inner_tar(addon_slug)
 
             # If exists inside backup
-            if not addon_file.path.exists():
+            if not addon_file:
                 _LOGGER.error("Can't find backup %s", addon_slug)
                 return
 
             # Perform a restore
             try:
-                await self.sys_addons.restore(addon_slug, addon_file)
+                if not self.incremental:
+                    await self.sys_addons.restore(addon_slug, addon_file)
+                    return
+
+                # Merge with data of parent backups first
+                with TemporaryDirectory(dir=self.sys_config.path_tmp) as temp:
+                    await self.sys_addons.restore(
+                        addon_slug,
+                        await self._merge_addon(
+                            addon_slug, addon_file, Path(temp, f"{addon_slug}.tar")
+                        ),
+                    )
             except AddonsError:
                 _LOGGER.error("Can't restore backup %s", addon_slug)
 
-        # Save Add-ons sequential
-        # avoid issue on slow IO
-        for slug in addon_list:
-            try:
-                await _addon_restore(slug)
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't restore Add-on %s: %s", slug, err)
-
-    async def store_folders(self, folder_list: list[str]):
+        async def _addon_restore_limited(addon_slug: str):
+            """Restore an add-on once a slot is free."""
+            async with semaphore:
+                try:
+                    await _addon_restore(addon_slug)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Can't restore Add-on %s: %s", addon_slug, err)
+
+        # Default concurrency of one restores sequential to avoid issue on slow IO
+        await asyncio.gather(*[_addon_restore_limited(slug) for slug in addon_list])
+
+    async def store_folders(
+        self,
+        folder_list: list[str],
+        concurrency: int = 1,
+        on_progress: Callable[[], None] | None = None,
+    ):
         """Backup Supervisor data into backup."""
+        stored: list[bool] = [False] * len(folder_list)
 
-        def _folder_save(name: str):
+        def _folder_save(name: str, folder_file: SecureTarFile) -> bool:
             """Take backup of a folder."""
-            slug_name = name.replace("/", "_")
-            tar_name = Path(
-                self._tmp.name, f"{slug_name}.tar{'.gz' if self.compressed else ''}"
-            )
             origin_dir = Path(self.sys_config.path_supervisor, name)
 
             # Check if exists
             if not origin_dir.is_dir():
                 _LOGGER.warning("Can't find backup folder %s", name)
-                return
+                return False
 
             # Take backup
             _LOGGER.info("Backing up folder %s", name)
-            with SecureTarFile(
-                tar_name, "w", key=self._key, gzip=self.compressed
-            ) as tar_file:
+            with folder_file as tar_file:
                 atomic_contents_add(
                     tar_file,
                     origin_dir,
@@ -415,31 +818,52 @@ class Backup(CoreSysAttributes):
                 )
 
             _LOGGER.info("Backup folder %s done", name)
-            self._data[ATTR_FOLDERS].append(name)
+            return True
 
-        # Save folder sequential
-        # avoid issue on slow IO
-        for folder in folder_list:
+        async def _folder_store(index: int, folder_file: SecureTarFile) -> None:
+            """Task to store a folder into backup."""
+            folder = folder_list[index]
             try:
-                await self.sys_run_in_executor(_folder_save, folder)
+                stored[index] = await self.sys_run_in_executor(
+                    _folder_save, folder, folder_file
+                )
             except (tarfile.TarError, OSError) as err:
                 raise BackupError(
                     f"Can't backup folder {folder}: {str(err)}", _LOGGER.error
                 ) from err
+            finally:
+                if on_progress:
+                    on_progress()
+
+        codecs = await self.sys_run_in_executor(
+            lambda: [
+                self._inner_codec(Path(self.sys_config.path_supervisor, name))
+                for name in folder_list
+            ]
+        )
+        await self._store_inner_tars(
+            [
+                inner_tar_name(name.replace("/", "_"), codec)
+                for name, codec in zip(folder_list, codecs)
+            ],
+            _folder_store,
+            concurrency,
+        )
+
+        self._data[ATTR_FOLDERS].extend(
+            name for name, done in zip(folder_list, stored) if done
+        )
 
-    async def restore_folders(self, folder_list: list[str]):
+    async def restore_folders(self, folder_list: list[str], concurrency: int = 1):
         """Backup Supervisor data into backup."""
+        semaphore = asyncio.Semaphore(concurrency)
 
         async def _folder_restore(name: str) -> None:
             """Intenal function to restore a folder."""
-            slug_name = name.replace("/", "_")
-            tar_name = Path(
-                self._tmp.name, f"{slug_name}.tar{'.gz' if self.compressed else ''}"
-            )
             origin_dir = Path(self.sys_config.path_supervisor, name)
 
             # Check if exists inside backup
-            if not tar_name.exists():
+            if not (folder_file := self._inner_tar(name.replace("/", "_"))):
                 _LOGGER.warning("Can't find restore folder %s", name)
                 return
 
@@ -451,9 +875,7 @@ class Backup(CoreSysAttributes):
             def _restore() -> None:
                 try:
                     _LOGGER.info("Restore folder %s", name)
-                    with SecureTarFile(
-                        tar_name, "r", key=self._key, gzip=self.compressed
-                    ) as tar_file:
+                    with folder_file as tar_file:
                         tar_file.extractall(path=origin_dir, members=tar_file)
                     _LOGGER.info("Restore folder %s done", name)
                 except (tarfile.TarError, OSError) as err:
@@ -461,24 +883,31 @@ class Backup(CoreSysAttributes):
 
             await self.sys_run_in_executor(_restore)
 
-        # Restore folder sequential
-        # avoid issue on slow IO
-        for folder in folder_list:
-            try:
-                await _folder_restore(folder)
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't restore folder %s: %s", folder, err)
+        async def _folder_restore_limited(name: str) -> None:
+            """Restore a folder once a slot is free."""
+            async with semaphore:
+                try:
+                    await _folder_restore(name)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Can't restore folder %s: %s", name, err)
+
+        # Default concurrency of one restores sequential to avoid issue on slow IO
+        await asyncio.gather(*[_folder_restore_limited(name) for name in folder_list])
 
     async def store_homeassistant(self):
         """Backup Home Assitant Core configuration folder."""
         self._data[ATTR_HOMEASSISTANT] = {ATTR_VERSION: self.sys_homeassistant.version}
 
         # Backup Home Assistant Core config directory
-        tar_name = Path(
-            self._tmp.name, f"homeassistant.tar{'.gz' if self.compressed else ''}"
+        codec = await self.sys_run_in_executor(
+            self._inner_codec, self.sys_config.path_homeassistant
         )
-        homeassistant_file = SecureTarFile(
-            tar_name, "w", key=self._key, gzip=self.compressed
+        homeassistant_file = InnerSecureTarFile(
+            self._outer_tar,
+            inner_tar_name("homeassistant", codec),
+            key=self._key,
+            codec=codec,
+            level=self.level,
         )
 
         await self.sys_homeassistant.backup(homeassistant_file)
@@ -491,12 +920,10 @@ class Backup(CoreSysAttributes):
         await self.sys_homeassistant.core.stop()
 
         # Restore Home Assistant Core config directory
-        tar_name = Path(
-            self._tmp.name, f"homeassistant.tar{'.gz' if self.compressed else ''}"
-        )
-        homeassistant_file = SecureTarFile(
-            tar_name, "r", key=self._key, gzip=self.compressed
-        )
+        if not (homeassistant_file := self._inner_tar("homeassistant")):
+            raise BackupError(
+                "Can't find Home Assistant Core data inside backup", _LOGGER.error
+            )
 
         await self.sys_homeassistant.restore(homeassistant_file)
 
@@ -0,0 +1,265 @@
+"""Compression codecs of inner backup tarfiles."""
+import heapq
+import os
+from pathlib import Path
+from typing import Callable
+import zlib
+
+from .const import BackupCodec
+
+CHUNK_SIZE = 64 * 1024
+
+SUFFIXES: dict[BackupCodec, str] = {
+    BackupCodec.GZIP: ".tar.gz",
+    BackupCodec.ZSTD: ".tar.zst",
+    BackupCodec.LZ4: ".tar.lz4",
+    BackupCodec.NONE: ".tar",
+}
+
+DEFAULT_LEVELS: dict[BackupCodec, int] = {
+    BackupCodec.GZIP: 6,
+    BackupCodec.ZSTD: 3,
+    BackupCodec.LZ4: 0,
+}
+
+LEVEL_RANGES: dict[BackupCodec, tuple[int, int]] = {
+    BackupCodec.GZIP: (1, 9),
+    BackupCodec.ZSTD: (1, 22),
+    BackupCodec.LZ4: (0, 16),
+}
+
+# Sample of a folder checked before compressing it, start, middle and end
+# of the largest files
+SAMPLE_FILES = 16
+SAMPLE_SIZE = 64 * 1024
+SAMPLE_POINTS = 3
+MIN_SAMPLE_SIZE = 4 * 1024
+MIN_RATIO = 0.9
+
+
+def inner_tar_name(name: str, codec: BackupCodec) -> str:
+    """Return name of an inner tarfile using codec."""
+    return f"{name}{SUFFIXES[codec]}"
+
+
+def codec_from_name(tar_name: str) -> BackupCodec:
+    """Return codec of an inner tarfile from its name."""
+    for codec, suffix in SUFFIXES.items():
+        if tar_name.endswith(suffix):
+            return codec
+    return BackupCodec.NONE
+
+
+def codec_level(codec: BackupCodec, level: int | None) -> int:
+    """Return level for codec, default or clamped into its range."""
+    if level is None:
+        return DEFAULT_LEVELS.get(codec, 0)
+    low, high = LEVEL_RANGES.get(codec, (0, 0))
+    return min(max(level, low), high)
+
+
+def _read_samples(file: str, size: int) -> list[bytes]:
+    """Return samples spread over a file."""
+    with open(file, "rb") as sample:
+        if size <= SAMPLE_SIZE * SAMPLE_POINTS:
+            return [sample.read()]
+
+        samples = []
+        step = (size - SAMPLE_SIZE) // (SAMPLE_POINTS - 1)
+        for point in range(SAMPLE_POINTS):
+            sample.seek(point * step)
+            samples.append(sample.read(SAMPLE_SIZE))
+        return samples
+
+
+def is_compressible(path: Path) -> bool:
+    """Return False if a sample of the largest files of a folder won't shrink."""
+    if not path.is_dir():
+        return True
+
+    files: list[tuple[int, str]] = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            file = os.path.join(root, name)
+            try:
+                if os.path.isfile(file) and not os.path.islink(file):
+                    files.append((os.path.getsize(file), file))
+            except OSError:
+                continue
+
+    sampled = 0
+    compressed = 0
+    for size, file in heapq.nlargest(SAMPLE_FILES, files):
+        try:
+            samples = _read_samples(file, size)
+        except OSError:
+            continue
+        for data in samples:
+            sampled += len(data)
+            compressed += len(zlib.compress(data, 1))
+
+    # Too little data to matter either way
+    return sampled < MIN_SAMPLE_SIZE or compressed < sampled * MIN_RATIO
+
+
+class _LZ4Compressor:
+    """LZ4 frame compressor with the interface of zlib."""
+
+    def __init__(self, level: int) -> None:
+        """Initialize compressor."""
+        # pylint: disable=import-outside-toplevel
+        import lz4.frame
+
+        self._compressor = lz4.frame.LZ4FrameCompressor(compression_level=level)
+        self._header: bytes = self._compressor.begin()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data."""
+        header, self._header = self._header, b""
+        return header + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Finish frame."""
+        header, self._header = self._header, b""
+        return header + self._compressor.flush()
+
+
+def _gzip_header_size(data: bytes) -> int | None:
+    """Return size of a gzip header, None if data is too short."""
+    if len(data) < 10:
+        return None
+    if data[:3] != b"\x1f\x8b\x08":
+        raise zlib.error("Not a gzip compressed stream")
+
+    flags = data[3]
+    offset = 10
+    if flags & 4:  # FEXTRA
+        if len(data) < offset + 2:
+            return None
+        offset += 2 + int.from_bytes(data[offset : offset + 2], "little")
+    for flag in (8, 16):  # FNAME, FCOMMENT
+        if flags & flag:
+            if (end := data.find(b"\x00", offset)) == -1:
+                return None
+            offset = end + 1
+    if flags & 2:  # FHCRC
+        offset += 2
+
+    return offset if len(data) >= offset else None
+
+
+class _GzipDecompressor:
+    """Gzip decompressor reading the deflate stream only.
+
+    Like tarfile the trailer is ignored, tarfile writes it after the padding
+    of the encrypted data in protected backups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize decompressor."""
+        self._header: bytes = b""
+        self._decompressor = None
+
+    @property
+    def eof(self) -> bool:
+        """Return True at the end of the deflate stream."""
+        return self._decompressor is not None and self._decompressor.eof
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress data."""
+        if self._decompressor is None:
+            self._header += data
+            if (offset := _gzip_header_size(self._header)) is None:
+                return b""
+            data, self._header = self._header[offset:], b""
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        return self._decompressor.decompress(data)
+
+
+def _compressor(codec: BackupCodec, level: int):
+    """Return compressor object for codec.
+
+    zstd and lz4 are only imported once a backup uses them.
+    """
+    # pylint: disable=import-outside-toplevel
+    if codec == BackupCodec.GZIP:
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if codec == BackupCodec.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    if codec == BackupCodec.LZ4:
+        return _LZ4Compressor(level)
+    raise ValueError(f"No compressor for {codec}")
+
+
+def _decompressor(codec: BackupCodec):
+    """Return decompressor object for codec."""
+    # pylint: disable=import-outside-toplevel
+    if codec == BackupCodec.GZIP:
+        return _GzipDecompressor()
+    if codec == BackupCodec.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj()
+    if codec == BackupCodec.LZ4:
+        import lz4.frame
+
+        return lz4.frame.LZ4FrameDecompressor()
+    raise ValueError(f"No decompressor for {codec}")
+
+
+class CompressWriter:
+    """File object compressing a tar stream.
+
+    Compressed data is passed on in whole chunks, only the last one may be
+    smaller. Encryption pads every chunk which isn't a full block.
+    """
+
+    def __init__(
+        self, sink: Callable[[bytes], None], codec: BackupCodec, level: int | None
+    ) -> None:
+        """Initialize writer."""
+        self._sink: Callable[[bytes], None] = sink
+        self._compressor = _compressor(codec, codec_level(codec, level))
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        """Compress data."""
+        self._buffer += self._compressor.compress(data)
+        if len(self._buffer) < CHUNK_SIZE:
+            return
+
+        size = len(self._buffer) - len(self._buffer) % CHUNK_SIZE
+        self._sink(bytes(self._buffer[:size]))
+        del self._buffer[:size]
+
+    def close(self) -> None:
+        """Finish compressed stream."""
+        self._buffer += self._compressor.flush()
+        if self._buffer:
+            self._sink(bytes(self._buffer))
+        self._buffer.clear()
+
+
+class DecompressReader:
+    """File object decompressing a tar stream.
+
+    Data following the compressed stream, like padding of encryption, is
+    ignored.
+    """
+
+    def __init__(self, source: Callable[[int], bytes], codec: BackupCodec) -> None:
+        """Initialize reader."""
+        self._source: Callable[[int], bytes] = source
+        self._decompressor = _decompressor(codec)
+
+    def read(self, size: int = CHUNK_SIZE) -> bytes:
+        """Return decompressed data, empty at the end of the stream."""
+        while not self._decompressor.eof:
+            if not (data := self._source(max(size, CHUNK_SIZE))):
+                break
+            if result := self._decompressor.decompress(data):
+                return result
+        return b""
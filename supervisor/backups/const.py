@@ -1,9 +1,20 @@
 """Backup consts."""
 from enum import Enum
 
+MAX_CONCURRENCY = 4
+
 
 class BackupType(str, Enum):
     """Backup type enum."""
 
     FULL = "full"
     PARTIAL = "partial"
+
+
+class BackupCodec(str, Enum):
+    """Compression codec of inner tarfiles."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
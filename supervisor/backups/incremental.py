@@ -0,0 +1,150 @@
+"""Incremental backup of add-on data against a parent backup."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import copy
+import hashlib
+import json
+from pathlib import Path, PurePath
+import stat
+import tarfile
+from typing import NamedTuple
+
+from securetar import SecureTarFile, _is_excluded_by_filter
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class FileState(NamedTuple):
+    """State of a regular file inside add-on data."""
+
+    size: int
+    mtime: int
+    sha256: str
+    stored: bool
+
+
+def manifest_name(addon_slug: str) -> str:
+    """Return name of the manifest member of an add-on."""
+    return f"{addon_slug}.manifest.json"
+
+
+def _file_hash(path: Path) -> str:
+    """Return sha256 of a file content."""
+    sha256 = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class DataManifest:
+    """Per-file hashes of add-on data, compared against the parent backup.
+
+    Only new or changed regular files are stored, everything else (folders,
+    links, devices) is always stored as it is just a header. Files with the
+    same size and mtime as in the parent are not read again.
+    """
+
+    def __init__(self, parent: dict[str, FileState] | None = None) -> None:
+        """Initialize manifest."""
+        self.parent: dict[str, FileState] = parent or {}
+        self.files: dict[str, FileState] = {}
+
+    @classmethod
+    def load(cls, raw: str) -> DataManifest:
+        """Return manifest read from a backup."""
+        manifest = cls()
+        manifest.files = {
+            name: FileState(*state) for name, state in json.loads(raw).items()
+        }
+        return manifest
+
+    def dump(self) -> str:
+        """Return manifest to store into a backup."""
+        return json.dumps(self.files)
+
+    def add_contents(
+        self,
+        tar_file: tarfile.TarFile,
+        origin_path: Path,
+        excludes: list[str],
+        arcname: str = ".",
+    ) -> None:
+        """Append changed contents of a folder to a tarfile.
+
+        Works like securetar.atomic_contents_add and fills the manifest.
+        """
+        if _is_excluded_by_filter(origin_path, excludes):
+            return
+        tar_file.add(origin_path.as_posix(), arcname=arcname, recursive=False)
+
+        for directory_item in origin_path.iterdir():
+            if _is_excluded_by_filter(directory_item, excludes):
+                continue
+
+            arcpath = PurePath(arcname, directory_item.name).as_posix()
+            if directory_item.is_dir() and not directory_item.is_symlink():
+                self.add_contents(tar_file, directory_item, excludes, arcpath)
+                continue
+
+            item_stat = directory_item.lstat()
+            if not stat.S_ISREG(item_stat.st_mode):
+                tar_file.add(
+                    directory_item.as_posix(), arcname=arcpath, recursive=False
+                )
+                continue
+
+            previous = self.parent.get(arcpath)
+            if (
+                previous
+                and previous.size == item_stat.st_size
+                and previous.mtime == item_stat.st_mtime_ns
+            ):
+                sha256 = previous.sha256
+            else:
+                sha256 = _file_hash(directory_item)
+
+            stored = previous is None or previous.sha256 != sha256
+            if stored:
+                tar_file.add(
+                    directory_item.as_posix(), arcname=arcpath, recursive=False
+                )
+
+            self.files[arcpath] = FileState(
+                item_stat.st_size, item_stat.st_mtime_ns, sha256, stored
+            )
+
+
+def merge_layers(
+    output: tarfile.TarFile, layers: Iterable[SecureTarFile], manifest: DataManifest
+) -> set[str]:
+    """Write an add-on inner tarfile merged with the files it references.
+
+    Layers are ordered newest first. The first one is copied entirely, older
+    layers only add manifest files not found in a newer layer. Return the
+    names of manifest files which are still missing.
+    """
+    missing = set(manifest.files)
+
+    for index, layer in enumerate(layers):
+        with layer as tar:
+            for member in tar:
+                name = PurePath(member.name).as_posix()
+                if name in missing:
+                    missing.remove(name)
+                    if index > 0:
+                        # Unchanged content, changed mtime only
+                        member = copy.copy(member)
+                        member.mtime = manifest.files[name].mtime // 1_000_000_000
+                elif index > 0:
+                    continue
+
+                output.addfile(
+                    member, tar.extractfile(member) if member.isfile() else None
+                )
+
+        if not missing:
+            break
+
+    return missing
@@ -0,0 +1,50 @@
+"""Persistent index of backup metadata."""
+import os
+from pathlib import Path
+from typing import Any
+
+from ..const import (
+    ATTR_BACKUPS,
+    ATTR_DATA,
+    ATTR_MTIME,
+    ATTR_SIZE,
+    FILE_HASSIO_BACKUPS_INDEX,
+)
+from ..utils.common import FileConfiguration
+from .validate import SCHEMA_BACKUPS_INDEX
+
+
+class BackupIndex(FileConfiguration):
+    """Cache backup.json of backup tarfiles, keyed by path, mtime and size."""
+
+    def __init__(self):
+        """Initialize backup index."""
+        super().__init__(FILE_HASSIO_BACKUPS_INDEX, SCHEMA_BACKUPS_INDEX)
+
+    @property
+    def paths(self) -> set[Path]:
+        """Return paths of all indexed tarfiles."""
+        return {Path(path) for path in self._data[ATTR_BACKUPS]}
+
+    def get(self, tar_file: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Return metadata of a tarfile if it did not change since indexed."""
+        entry = self._data[ATTR_BACKUPS].get(str(tar_file))
+        if (
+            entry is None
+            or entry[ATTR_MTIME] != stat.st_mtime
+            or entry[ATTR_SIZE] != stat.st_size
+        ):
+            return None
+        return entry[ATTR_DATA]
+
+    def set(self, tar_file: Path, stat: os.stat_result, data: dict[str, Any]) -> None:
+        """Index metadata of a tarfile."""
+        self._data[ATTR_BACKUPS][str(tar_file)] = {
+            ATTR_MTIME: stat.st_mtime,
+            ATTR_SIZE: stat.st_size,
+            ATTR_DATA: data,
+        }
+
+    def remove(self, tar_file: Path) -> None:
+        """Remove a tarfile from index."""
+        self._data[ATTR_BACKUPS].pop(str(tar_file), None)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 
 from ..addons.addon import Addon
@@ -13,13 +14,15 @@ from ..const import (
     CoreState,
 )
 from ..coresys import CoreSysAttributes
-from ..exceptions import AddonsError
+from ..exceptions import AddonsError, BackupError
+from ..jobs import SupervisorJob
 from ..jobs.decorator import Job, JobCondition
 from ..utils.common import FileConfiguration
 from ..utils.dt import utcnow
 from .backup import Backup
-from .const import BackupType
-from .utils import create_slug
+from .const import MAX_CONCURRENCY, BackupCodec, BackupType
+from .index import BackupIndex
+from .utils import create_slug, key_digest, password_to_key
 from .validate import ALL_FOLDERS, SCHEMA_BACKUPS_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -33,6 +36,8 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         super().__init__(FILE_HASSIO_BACKUPS, SCHEMA_BACKUPS_CONFIG)
         self.coresys = coresys
         self._backups = {}
+        self._index: BackupIndex = BackupIndex()
+        self._default_concurrency: int = 1
         self.lock = asyncio.Lock()
 
     @property
@@ -50,6 +55,21 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         """Set days until backup is considered stale."""
         self._data[ATTR_DAYS_UNTIL_STALE] = value
 
+    @property
+    def default_concurrency(self) -> int:
+        """Return default number of add-ons/folders handled at once."""
+        return self._default_concurrency
+
+    def _disk_concurrency(self) -> int:
+        """Return number of add-ons/folders the data disk handles at once.
+
+        Need run inside executor.
+        """
+        # SD cards, eMMC and spinning disks do better sequential
+        if not self.sys_hardware.disk.is_fast_disk(self.sys_config.path_supervisor):
+            return 1
+        return min(os.cpu_count() or 1, MAX_CONCURRENCY)
+
     def get(self, slug):
         """Return backup object."""
         return self._backups.get(slug)
@@ -60,49 +80,130 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         sys_type: BackupType,
         password: str | None,
         compressed: bool = True,
+        incremental: bool = False,
+        codec: BackupCodec | None = None,
+        level: int | None = None,
     ) -> Backup:
         """Initialize a new backup object from name."""
         date_str = utcnow().isoformat()
         slug = create_slug(name, date_str)
         tar_file = Path(self.sys_config.path_backup, f"{slug}.tar")
 
+        parent = None
+        if incremental and (parent_backup := self._incremental_parent(password)):
+            parent = parent_backup.slug
+
         # init object
         backup = Backup(self.coresys, tar_file)
-        backup.new(slug, name, date_str, sys_type, password, compressed)
+        backup.new(
+            slug,
+            name,
+            date_str,
+            sys_type,
+            password,
+            compressed,
+            incremental,
+            parent,
+            codec,
+            level,
+        )
 
         backup.store_repositories()
         backup.store_dockerconfig()
 
         return backup
 
-    def load(self):
-        """Load exists backups data.
+    def _incremental_parent(self, password: str | None) -> Backup | None:
+        """Return newest incremental backup a new one can build on."""
+        digest = key_digest(password_to_key(password)) if password else None
+        candidates = [
+            backup
+            for backup in self.list_backups
+            if backup.incremental
+            and backup.protected == bool(password)
+            and backup.key_digest == digest
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda backup: backup.date)
 
-        Return a coroutine.
-        """
-        return self.reload()
+    async def load(self):
+        """Load exists backups data."""
+        self._default_concurrency = await self.sys_run_in_executor(
+            self._disk_concurrency
+        )
+        await self.reload()
 
     async def reload(self):
         """Load exists backups."""
         self._backups = {}
 
-        async def _load_backup(tar_file):
+        def _stat_backups() -> dict[Path, os.stat_result]:
+            """Return stat of all backup files."""
+            tar_files = {}
+            for tar_file in self.sys_config.path_backup.glob("*.tar"):
+                try:
+                    tar_files[tar_file] = tar_file.stat()
+                except OSError as err:
+                    _LOGGER.warning("Can't read backup file %s: %s", tar_file, err)
+            return tar_files
+
+        async def _load_backup(tar_file: Path, stat: os.stat_result):
             """Load the backup."""
             backup = Backup(self.coresys, tar_file)
             if await backup.load():
                 self._backups[backup.slug] = backup
+                self._index.set(tar_file, stat, backup.data)
 
-        tasks = [
-            _load_backup(tar_file)
-            for tar_file in self.sys_config.path_backup.glob("*.tar")
-        ]
+        tar_files = await self.sys_run_in_executor(_stat_backups)
+
+        # Only read backup.json of new or changed backup files
+        tasks = []
+        for tar_file, stat in tar_files.items():
+            backup = Backup(self.coresys, tar_file)
+            if (data := self._index.get(tar_file, stat)) and backup.load_data(data):
+                self._backups[backup.slug] = backup
+                continue
+            tasks.append(_load_backup(tar_file, stat))
+
+        removed = self._index.paths - tar_files.keys()
+        for tar_file in removed:
+            self._index.remove(tar_file)
 
-        _LOGGER.info("Found %d backup files", len(tasks))
+        _LOGGER.info(
+            "Found %d backup files, %d read from disk", len(tar_files), len(tasks)
+        )
         if tasks:
-            await asyncio.wait(tasks)
+            await asyncio.gather(*tasks)
+
+        if tasks or removed:
+            self._index.save_data()
+
+    def _index_backup(self, backup: Backup) -> None:
+        """Add a backup to the backup index."""
+        try:
+            stat = backup.tarfile.stat()
+        except OSError as err:
+            _LOGGER.warning("Can't index backup %s: %s", backup.slug, err)
+            return
+
+        self._index.set(backup.tarfile, stat, backup.data)
+        self._index.save_data()
+
+    async def remove(self, backup):
+        """Remove a backup.
+
+        Incremental backups built on it get its add-on data folded in first.
+        """
+        for child in self.list_backups:
+            if not child.incremental or child.parent != backup.slug:
+                continue
+            try:
+                await child.rebase(backup)
+            except BackupError:
+                return False
+            self._index_backup(child)
 
-    def remove(self, backup):
-        """Remove a backup."""
         try:
             backup.tarfile.unlink()
             self._backups.pop(backup.slug, None)
@@ -112,6 +213,8 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
             _LOGGER.error("Can't remove backup %s: %s", backup.slug, err)
             return False
 
+        self._index.remove(backup.tarfile)
+        self._index.save_data()
         return True
 
     async def import_backup(self, tar_file):
@@ -125,7 +228,7 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         # Already exists?
         if backup.slug in self._backups:
             _LOGGER.warning("Backup %s already exists! overwriting", backup.slug)
-            self.remove(self.get(backup.slug))
+            await self.remove(self.get(backup.slug))
 
         # Move backup to backup
         tar_origin = Path(self.sys_config.path_backup, f"{backup.slug}.tar")
@@ -143,6 +246,7 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         _LOGGER.info("Successfully imported %s", backup.slug)
 
         self._backups[backup.slug] = backup
+        self._index_backup(backup)
         return backup
 
     async def _do_backup(
@@ -151,7 +255,18 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         addon_list: list[Addon],
         folder_list: list[str],
         homeassistant: bool,
+        concurrency: int,
+        job: SupervisorJob,
     ):
+        steps_total = len(addon_list) + len(folder_list) + int(homeassistant)
+        steps_done = 0
+
+        def _step_done() -> None:
+            """Report progress of a finished add-on/folder/core backup."""
+            nonlocal steps_done
+            steps_done += 1
+            job.update(progress=steps_done / steps_total * 100)
+
         try:
             self.sys_core.state = CoreState.FREEZE
 
@@ -159,16 +274,20 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
                 # Backup add-ons
                 if addon_list:
                     _LOGGER.info("Backing up %s store Add-ons", backup.slug)
-                    await backup.store_addons(addon_list)
+                    job.update(stage="addons")
+                    await backup.store_addons(addon_list, concurrency, _step_done)
 
                 # HomeAssistant Folder is for v1
                 if homeassistant:
+                    job.update(stage="home_assistant")
                     await backup.store_homeassistant()
+                    _step_done()
 
                 # Backup folders
                 if folder_list:
                     _LOGGER.info("Backing up %s store folders", backup.slug)
-                    await backup.store_folders(folder_list)
+                    job.update(stage="folders")
+                    await backup.store_folders(folder_list, concurrency, _step_done)
 
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.exception("Backup %s error", backup.slug)
@@ -176,29 +295,52 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
             return None
         else:
             self._backups[backup.slug] = backup
+            self._index_backup(backup)
             return backup
         finally:
             self.sys_core.state = CoreState.RUNNING
 
-    @Job(conditions=[JobCondition.FREE_SPACE, JobCondition.RUNNING])
-    async def do_backup_full(self, name="", password=None, compressed=True):
+    @Job(
+        name="backup_manager_full_backup",
+        conditions=[JobCondition.FREE_SPACE, JobCondition.RUNNING],
+    )
+    async def do_backup_full(
+        self,
+        name="",
+        password=None,
+        compressed=True,
+        concurrency: int | None = None,
+        incremental: bool = False,
+        codec: BackupCodec | None = None,
+        level: int | None = None,
+    ):
         """Create a full backup."""
         if self.lock.locked():
             _LOGGER.error("A backup/restore process is already running")
             return None
 
-        backup = self._create_backup(name, BackupType.FULL, password, compressed)
+        backup = self._create_backup(
+            name, BackupType.FULL, password, compressed, incremental, codec, level
+        )
 
         _LOGGER.info("Creating new full backup with slug %s", backup.slug)
         async with self.lock:
             backup = await self._do_backup(
-                backup, self.sys_addons.installed, ALL_FOLDERS, True
+                backup,
+                self.sys_addons.installed,
+                ALL_FOLDERS,
+                True,
+                concurrency or self.default_concurrency,
+                self.sys_jobs.get_job("backup_manager_full_backup"),
             )
             if backup:
                 _LOGGER.info("Creating full backup with slug %s completed", backup.slug)
             return backup
 
-    @Job(conditions=[JobCondition.FREE_SPACE, JobCondition.RUNNING])
+    @Job(
+        name="backup_manager_partial_backup",
+        conditions=[JobCondition.FREE_SPACE, JobCondition.RUNNING],
+    )
     async def do_backup_partial(
         self,
         name: str = "",
@@ -207,6 +349,10 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         password: str | None = None,
         homeassistant: bool = False,
         compressed: bool = True,
+        concurrency: int | None = None,
+        incremental: bool = False,
+        codec: BackupCodec | None = None,
+        level: int | None = None,
     ):
         """Create a partial backup."""
         if self.lock.locked():
@@ -224,7 +370,9 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
         if len(addons) == 0 and len(folders) == 0 and not homeassistant:
             _LOGGER.error("Nothing to create backup for")
 
-        backup = self._create_backup(name, BackupType.PARTIAL, password, compressed)
+        backup = self._create_backup(
+            name, BackupType.PARTIAL, password, compressed, incremental, codec, level
+        )
 
         _LOGGER.info("Creating new partial backup with slug %s", backup.slug)
         async with self.lock:
@@ -236,7 +384,14 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
                     continue
                 _LOGGER.warning("Add-on %s not found/installed", addon_slug)
 
-            backup = await self._do_backup(backup, addon_list, folders, homeassistant)
+            backup = await self._do_backup(
+                backup,
+                addon_list,
+                folders,
+                homeassistant,
+                concurrency or self.default_concurrency,
+                self.sys_jobs.get_job("backup_manager_partial_backup"),
+            )
             if backup:
                 _LOGGER.info(
                     "Creating partial backup with slug %s completed", backup.slug
@@ -261,7 +416,7 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
                 # Process folders
                 if folder_list:
                     _LOGGER.info("Restoring %s folders", backup.slug)
-                    await backup.restore_folders(folder_list)
+                    await backup.restore_folders(folder_list, self.default_concurrency)
 
                 # Process Home-Assistant
                 if homeassistant:
@@ -287,7 +442,7 @@ class BackupManager(FileConfiguration, CoreSysAttributes):
                     await backup.restore_repositories(replace)
 
                     _LOGGER.info("Restoring %s Add-ons", backup.slug)
-                    await backup.restore_addons(addon_list)
+                    await backup.restore_addons(addon_list, self.default_concurrency)
 
                 # Wait for Home Assistant Core update/downgrade
                 if task_hass:
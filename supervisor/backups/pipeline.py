@@ -0,0 +1,100 @@
+"""Worker thread stages of the backup stream pipeline."""
+import queue
+import threading
+from typing import Callable
+
+# Chunks buffered between two stages
+PIPELINE_DEPTH = 8
+
+
+class WriteStage:
+    """Pass written chunks to a sink in a worker thread.
+
+    The bounded queue blocks the writer once the worker falls behind. An error
+    of the sink is raised on the next write or on close.
+    """
+
+    def __init__(self, sink: Callable[[bytes], None], name: str) -> None:
+        """Initialize stage and start worker."""
+        self._sink: Callable[[bytes], None] = sink
+        self._queue: queue.Queue[bytes | None] = queue.Queue(PIPELINE_DEPTH)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Pass chunks to the sink until closed."""
+        while (data := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                self._sink(data)
+            except Exception as err:  # pylint: disable=broad-except
+                self._error = err
+
+    def write(self, data: bytes) -> None:
+        """Queue data for the sink."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(data)
+
+    def close(self) -> None:
+        """Wait until all data is passed to the sink."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+class ReadStage:
+    """Read chunks from a source ahead in a worker thread."""
+
+    def __init__(
+        self, source: Callable[[int], bytes], name: str, chunk_size: int
+    ) -> None:
+        """Initialize stage and start worker."""
+        self._source: Callable[[int], bytes] = source
+        self._chunk_size: int = chunk_size
+        self._queue: queue.Queue[bytes | Exception] = queue.Queue(PIPELINE_DEPTH)
+        self._closed = threading.Event()
+        self._eof: bool = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Read chunks until the end of the source or closed."""
+        try:
+            while True:
+                data = self._source(self._chunk_size)
+                if not self._put(data) or not data:
+                    return
+        except Exception as err:  # pylint: disable=broad-except
+            self._put(err)
+
+    def _put(self, item: bytes | Exception) -> bool:
+        """Queue an item, return False if the stage got closed."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def read(self, size: int = 0) -> bytes:  # pylint: disable=unused-argument
+        """Return next chunk, empty at the end of the source."""
+        if self._eof:
+            return b""
+
+        item = self._queue.get()
+        if isinstance(item, Exception):
+            self._eof = True
+            raise item
+        if not item:
+            self._eof = True
+        return item
+
+    def close(self) -> None:
+        """Stop reading ahead."""
+        self._closed.set()
+        self._thread.join()
@@ -0,0 +1,373 @@
+"""Stream inner tarfiles into and out of the outer backup tarfile."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+import tarfile
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+import time
+from typing import BinaryIO, Callable
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from securetar import BLOCK_SIZE, BLOCK_SIZE_BITS, SecureTarFile, _generate_iv
+
+from .codec import CHUNK_SIZE, CompressWriter, DecompressReader
+from .const import BackupCodec
+from .pipeline import ReadStage, WriteStage
+
+# Spooled inner tarfiles larger than this move from memory to a file
+SPOOL_MEMORY_SIZE = 16 * 1024 * 1024
+
+
+class BackupTarFile(SecureTarFile):
+    """SecureTarFile with a selectable compression codec.
+
+    Data is compressed before it is encrypted, gzip compressed tarfiles keep
+    the file format of SecureTarFile. Building the tar stream, compression and
+    encryption run in their own threads with bounded buffers in between.
+    """
+
+    def __init__(
+        self,
+        name: Path,
+        mode: str,
+        key: bytes | None = None,
+        codec: BackupCodec = BackupCodec.GZIP,
+        level: int | None = None,
+    ) -> None:
+        """Initialize tarfile handler."""
+        super().__init__(name, mode, key=key, gzip=False)
+        self._codec: BackupCodec = codec
+        self._level: int | None = level
+        self._closers: list[Callable[[], None]] = []
+        self._raw: BinaryIO | None = None
+
+    def __enter__(self) -> tarfile.TarFile:
+        """Start context manager tarfile."""
+        reading = self._mode.startswith("r")
+        self._open()
+
+        if self._key:
+            if reading:
+                cbc_rand = self._read_raw(16)
+            else:
+                cbc_rand = os.urandom(16)
+                self._write_raw(cbc_rand)
+
+            self._aes = Cipher(
+                algorithms.AES(self._key),
+                modes.CBC(_generate_iv(self._key, cbc_rand)),
+                backend=default_backend(),
+            )
+            self._decrypt = self._aes.decryptor()
+            self._encrypt = self._aes.encryptor()
+
+        if reading:
+            fileobj = self._reader()
+        else:
+            fileobj = self._writer()
+
+        self._tar = tarfile.open(
+            fileobj=fileobj, mode=self._tar_mode, bufsize=CHUNK_SIZE, dereference=False
+        )
+        return self._tar
+
+    def _writer(self):
+        """Return file object for tarfile, chained through worker stages."""
+        writer = self
+        if self._key:
+            encrypt_stage = WriteStage(self.write, f"encrypt {self._name.name}")
+            self._closers.append(encrypt_stage.close)
+            writer = encrypt_stage
+
+        if self._codec != BackupCodec.NONE:
+            compress_writer = CompressWriter(writer.write, self._codec, self._level)
+            compress_stage = WriteStage(
+                compress_writer.write, f"compress {self._name.name}"
+            )
+            # Closed in order, compressed data has to pass the encrypt stage
+            self._closers[0:0] = [compress_stage.close, compress_writer.close]
+            writer = compress_stage
+
+        return writer
+
+    def _reader(self):
+        """Return file object for tarfile, decrypted ahead in a worker stage."""
+        reader = self
+        if self._key:
+            decrypt_stage = ReadStage(
+                self.read, f"decrypt {self._name.name}", CHUNK_SIZE
+            )
+            self._closers.append(decrypt_stage.close)
+            reader = decrypt_stage
+
+        if self._codec != BackupCodec.NONE:
+            reader = DecompressReader(reader.read, self._codec)
+
+        return reader
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close file."""
+        try:
+            self._close_stream()
+        finally:
+            self._close()
+
+    def _open(self) -> None:
+        """Open raw file."""
+        self._raw = self._name.open("rb" if self._mode.startswith("r") else "wb")
+
+    def _close(self) -> None:
+        """Close raw file."""
+        if self._raw:
+            self._raw.close()
+            self._raw = None
+
+    def _close_stream(self) -> None:
+        """Close tarfile and stop all worker stages."""
+        closers, self._closers = self._closers, []
+        error: Exception | None = None
+        try:
+            if self._tar:
+                self._tar.close()
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+        finally:
+            self._tar = None
+
+        # Every worker has to stop, raise the first error afterwards
+        for close in closers:
+            try:
+                close()
+            except Exception as err:  # pylint: disable=broad-except
+                error = error or err
+
+        if error is not None:
+            raise error
+
+    def _read_raw(self, size: int) -> bytes:
+        """Read raw data."""
+        return self._raw.read(size)
+
+    def _write_raw(self, data: bytes) -> None:
+        """Write raw data."""
+        self._raw.write(data)
+
+    def write(self, data: bytes) -> None:
+        """Write data."""
+        if self._encrypt:
+            if len(data) % BLOCK_SIZE != 0:
+                padder = padding.PKCS7(BLOCK_SIZE_BITS).padder()
+                data = padder.update(data) + padder.finalize()
+            data = self._encrypt.update(data)
+
+        self._write_raw(data)
+
+    def read(self, size: int = 0) -> bytes:
+        """Read data."""
+        data = self._read_raw(size)
+        if self._decrypt:
+            return self._decrypt.update(data)
+        return data
+
+
+class InnerSecureTarFile(BackupTarFile):
+    """Tarfile written directly as a member of an outer tarfile.
+
+    The member header is written with a placeholder size, the (encrypted)
+    stream follows and the header is rewritten with the real size on close.
+    Only one inner tarfile can be open on an outer tarfile at a time.
+    """
+
+    def __init__(
+        self,
+        outer_tar: tarfile.TarFile,
+        name: str,
+        key: bytes | None = None,
+        codec: BackupCodec = BackupCodec.GZIP,
+        level: int | None = None,
+    ) -> None:
+        """Initialize inner tarfile handler."""
+        super().__init__(Path(name), "w", key=key, codec=codec, level=level)
+        self._outer_tar: tarfile.TarFile = outer_tar
+        self._tar_info: tarfile.TarInfo = tarfile.TarInfo(name=f"./{name}")
+        self._header_offset: int = 0
+        self._bytes_written: int = 0
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close inner tarfile and finish the outer tarfile member."""
+        self._finish(exc_type)
+
+    def _finish(self, exc_type) -> None:
+        """Close streams and write the final member header."""
+        fileobj = self._outer_tar.fileobj
+        try:
+            self._close_stream()
+        except Exception:
+            self._discard()
+            raise
+
+        # Drop incomplete member on error
+        if exc_type is not None:
+            self._discard()
+            return
+
+        remainder = self._bytes_written % tarfile.BLOCKSIZE
+        if remainder > 0:
+            fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+
+        # Rewrite header with final size
+        end_offset = fileobj.tell()
+        self._tar_info.size = self._bytes_written
+        fileobj.seek(self._header_offset)
+        fileobj.write(self._header())
+        fileobj.seek(end_offset)
+
+        self._tar_info.offset = self._header_offset
+        self._tar_info.offset_data = self._header_offset + tarfile.BLOCKSIZE
+        self._outer_tar.offset = end_offset
+        self._outer_tar.members.append(self._tar_info)
+
+    def _open(self) -> None:
+        """Write placeholder member header."""
+        self._header_offset = self._outer_tar.offset
+        self._bytes_written = 0
+        self._tar_info.mtime = int(time.time())
+        self._outer_tar.fileobj.write(self._header())
+
+    def _discard(self) -> None:
+        """Remove the incomplete member from the outer tarfile."""
+        self._outer_tar.fileobj.seek(self._header_offset)
+        self._outer_tar.fileobj.truncate()
+        self._bytes_written = 0
+
+    def _header(self) -> bytes:
+        """Return outer tarfile header for this member."""
+        return self._tar_info.tobuf(
+            self._outer_tar.format, self._outer_tar.encoding, self._outer_tar.errors
+        )
+
+    def _write_raw(self, data: bytes) -> None:
+        """Write raw data into the outer tarfile."""
+        self._outer_tar.fileobj.write(data)
+        self._bytes_written += len(data)
+
+    @property
+    def size(self) -> float:
+        """Return backup size."""
+        return round(self._bytes_written / 1_048_576, 2)  # calc mbyte
+
+
+class SpooledInnerSecureTarFile(InnerSecureTarFile):
+    """Inner tarfile built in a spool and appended to the outer tarfile.
+
+    Building, compression and encryption don't touch the outer tarfile, so
+    any number of them can run at once. The lock is only held to append the
+    finished member.
+    """
+
+    def __init__(
+        self,
+        outer_tar: tarfile.TarFile,
+        name: str,
+        lock: Lock,
+        key: bytes | None = None,
+        codec: BackupCodec = BackupCodec.GZIP,
+        level: int | None = None,
+        spool_dir: Path | None = None,
+    ) -> None:
+        """Initialize spooled inner tarfile handler."""
+        super().__init__(outer_tar, name, key=key, codec=codec, level=level)
+        self._lock: Lock = lock
+        self._spool_dir: Path | None = spool_dir
+        self._spool: SpooledTemporaryFile | None = None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close inner tarfile and append it to the outer tarfile."""
+        try:
+            self._close_stream()
+            if exc_type is None:
+                self._append()
+        finally:
+            self._close()
+
+    def _open(self) -> None:
+        """Open spool of the member data."""
+        self._bytes_written = 0
+        self._tar_info.mtime = int(time.time())
+        self._spool = SpooledTemporaryFile(
+            max_size=SPOOL_MEMORY_SIZE, dir=self._spool_dir
+        )
+
+    def _close(self) -> None:
+        """Drop spool."""
+        if self._spool:
+            self._spool.close()
+            self._spool = None
+
+    def _append(self) -> None:
+        """Write header and spooled data as member of the outer tarfile."""
+        self._tar_info.size = self._bytes_written
+        self._spool.seek(0)
+
+        with self._lock:
+            fileobj = self._outer_tar.fileobj
+            self._header_offset = self._outer_tar.offset
+            fileobj.write(self._header())
+            shutil.copyfileobj(self._spool, fileobj, CHUNK_SIZE)
+
+            remainder = self._bytes_written % tarfile.BLOCKSIZE
+            if remainder > 0:
+                fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+
+            self._tar_info.offset = self._header_offset
+            self._tar_info.offset_data = self._header_offset + tarfile.BLOCKSIZE
+            self._outer_tar.offset = fileobj.tell()
+            self._outer_tar.members.append(self._tar_info)
+
+    def _write_raw(self, data: bytes) -> None:
+        """Write raw data into the spool."""
+        self._spool.write(data)
+        self._bytes_written += len(data)
+
+
+class InnerSecureTarReader(BackupTarFile):
+    """Tarfile read directly from a member of an outer tarfile.
+
+    Every reader opens its own handle on the outer tarfile and only reads the
+    bytes of its member, nothing is extracted to disk first.
+    """
+
+    def __init__(
+        self,
+        outer_path: Path,
+        member: tarfile.TarInfo,
+        key: bytes | None = None,
+        codec: BackupCodec = BackupCodec.GZIP,
+    ) -> None:
+        """Initialize inner tarfile handler."""
+        super().__init__(Path(member.name), "r", key=key, codec=codec)
+        self._outer_path: Path = outer_path
+        self._member: tarfile.TarInfo = member
+        self._remaining: int = 0
+
+    def _open(self) -> None:
+        """Open outer tarfile at the member data."""
+        self._raw = self._outer_path.open("rb")
+        self._raw.seek(self._member.offset_data)
+        self._remaining = self._member.size
+
+    def _read_raw(self, size: int) -> bytes:
+        """Read raw member data."""
+        data = self._raw.read(min(size, self._remaining))
+        self._remaining -= len(data)
+        return data
+
+    @property
+    def size(self) -> float:
+        """Return backup size."""
+        return round(self._member.size / 1_048_576, 2)  # calc mbyte
@@ -20,6 +20,11 @@ def key_to_iv(key: bytes) -> bytes:
     return key[:16]
 
 
+def key_digest(key: bytes) -> str:
+    """Generate a digest to compare keys without storing them."""
+    return hashlib.sha256(b"backup-key:" + key).hexdigest()[:16]
+
+
 def create_slug(name: str, date_str: str) -> str:
     """Generate a hash from repository."""
     key = f"{date_str} - {name}".lower().encode()
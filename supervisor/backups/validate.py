@@ -6,17 +6,26 @@ from typing import Any
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
 
-from ..backups.const import BackupType
+from ..backups.const import BackupCodec, BackupType
 from ..const import (
     ATTR_ADDONS,
+    ATTR_BACKUPS,
+    ATTR_CODEC,
     ATTR_COMPRESSED,
     ATTR_CRYPTO,
+    ATTR_DATA,
     ATTR_DATE,
     ATTR_DAYS_UNTIL_STALE,
     ATTR_DOCKER,
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
+    ATTR_INCREMENTAL,
+    ATTR_KEY_DIGEST,
+    ATTR_LAYERS,
+    ATTR_LEVEL,
+    ATTR_MTIME,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PROTECTED,
     ATTR_REPOSITORIES,
     ATTR_SIZE,
@@ -92,6 +101,8 @@ SCHEMA_BACKUP = vol.Schema(
         vol.Required(ATTR_NAME): str,
         vol.Required(ATTR_DATE): str,
         vol.Optional(ATTR_COMPRESSED, default=True): vol.Boolean(),
+        vol.Optional(ATTR_CODEC, default=None): vol.Maybe(vol.Coerce(BackupCodec)),
+        vol.Optional(ATTR_LEVEL, default=None): vol.Maybe(vol.Coerce(int)),
         vol.Optional(ATTR_PROTECTED, default=False): vol.All(
             v1_protected, vol.Boolean()
         ),
@@ -127,6 +138,10 @@ SCHEMA_BACKUP = vol.Schema(
             unique_addons,
         ),
         vol.Optional(ATTR_REPOSITORIES, default=list): repositories,
+        vol.Optional(ATTR_INCREMENTAL, default=False): vol.Boolean(),
+        vol.Optional(ATTR_PARENT, default=None): vol.Maybe(str),
+        vol.Optional(ATTR_LAYERS, default=list): [str],
+        vol.Optional(ATTR_KEY_DIGEST, default=None): vol.Maybe(str),
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -137,3 +152,21 @@ SCHEMA_BACKUPS_CONFIG = vol.Schema(
     },
     extra=vol.REMOVE_EXTRA,
 )
+
+SCHEMA_BACKUPS_INDEX = vol.Schema(
+    {
+        vol.Optional(ATTR_BACKUPS, default=dict): vol.Schema(
+            {
+                str: vol.Schema(
+                    {
+                        vol.Required(ATTR_MTIME): float,
+                        vol.Required(ATTR_SIZE): int,
+                        vol.Required(ATTR_DATA): dict,
+                    },
+                    extra=vol.REMOVE_EXTRA,
+                )
+            }
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
@@ -8,6 +8,7 @@ from awesomeversion import AwesomeVersion
 
 from .const import (
     ATTR_ADDONS_CUSTOM_LIST,
+    ATTR_API_COMPRESSION,
     ATTR_DEBUG,
     ATTR_DEBUG_BLOCK,
     ATTR_DIAGNOSTICS,
@@ -17,6 +18,7 @@ from .const import (
     ATTR_TIMEZONE,
     ATTR_VERSION,
     ATTR_WAIT_BOOT,
+    ATTR_WEBSOCKET_MULTIPLEX,
     ENV_SUPERVISOR_SHARE,
     FILE_HASSIO_CONFIG,
     SUPERVISOR_DATA,
@@ -137,6 +139,26 @@ class CoreConfig(FileConfiguration):
         """Set diagnostics settings."""
         self._data[ATTR_DIAGNOSTICS] = value
 
+    @property
+    def websocket_multiplex(self) -> bool:
+        """Return True if add-ons share one websocket to Home Assistant."""
+        return self._data[ATTR_WEBSOCKET_MULTIPLEX]
+
+    @websocket_multiplex.setter
+    def websocket_multiplex(self, value: bool) -> None:
+        """Set sharing one websocket to Home Assistant."""
+        self._data[ATTR_WEBSOCKET_MULTIPLEX] = value
+
+    @property
+    def api_compression(self) -> bool:
+        """Return True if API responses are compressed for clients."""
+        return self._data[ATTR_API_COMPRESSION]
+
+    @api_compression.setter
+    def api_compression(self, value: bool) -> None:
+        """Set compression of API responses."""
+        self._data[ATTR_API_COMPRESSION] = value
+
     @property
     def logging(self) -> LogLevel:
         """Return log level of system."""
@@ -18,6 +18,7 @@ SUPERVISOR_DATA = Path("/data")
 FILE_HASSIO_ADDONS = Path(SUPERVISOR_DATA, "addons.json")
 FILE_HASSIO_AUTH = Path(SUPERVISOR_DATA, "auth.json")
 FILE_HASSIO_BACKUPS = Path(SUPERVISOR_DATA, "backups.json")
+FILE_HASSIO_BACKUPS_INDEX = Path(SUPERVISOR_DATA, "backups_index.json")
 FILE_HASSIO_CONFIG = Path(SUPERVISOR_DATA, "config.json")
 FILE_HASSIO_DISCOVERY = Path(SUPERVISOR_DATA, "discovery.json")
 FILE_HASSIO_DOCKER = Path(SUPERVISOR_DATA, "docker.json")
@@ -89,6 +90,7 @@ ATTR_ADDRESS = "address"
 ATTR_ADDRESS_DATA = "address-data"
 ATTR_ADMIN = "admin"
 ATTR_ADVANCED = "advanced"
+ATTR_API_COMPRESSION = "api_compression"
 ATTR_APPARMOR = "apparmor"
 ATTR_APPLICATION = "application"
 ATTR_ARCH = "arch"
@@ -119,6 +121,7 @@ ATTR_CHANNEL = "channel"
 ATTR_CHASSIS = "chassis"
 ATTR_CHECKS = "checks"
 ATTR_CLI = "cli"
+ATTR_CODEC = "codec"
 ATTR_COMPRESSED = "compressed"
 ATTR_CONFIG = "config"
 ATTR_CONFIGURATION = "configuration"
@@ -183,6 +186,7 @@ ATTR_ICON = "icon"
 ATTR_ID = "id"
 ATTR_IMAGE = "image"
 ATTR_IMAGES = "images"
+ATTR_INCREMENTAL = "incremental"
 ATTR_INDEX = "index"
 ATTR_INGRESS = "ingress"
 ATTR_INGRESS_ENTRY = "ingress_entry"
@@ -204,9 +208,12 @@ ATTR_ISSUES = "issues"
 ATTR_JOURNALD = "journald"
 ATTR_KERNEL = "kernel"
 ATTR_KERNEL_MODULES = "kernel_modules"
+ATTR_KEY_DIGEST = "key_digest"
 ATTR_LABELS = "labels"
 ATTR_LAST_BOOT = "last_boot"
+ATTR_LAYERS = "layers"
 ATTR_LEGACY = "legacy"
+ATTR_LEVEL = "level"
 ATTR_LOCALS = "locals"
 ATTR_LOCATON = "location"
 ATTR_LOGGING = "logging"
@@ -222,6 +229,7 @@ ATTR_MEMORY_USAGE = "memory_usage"
 ATTR_MESSAGE = "message"
 ATTR_METHOD = "method"
 ATTR_MODE = "mode"
+ATTR_MTIME = "mtime"
 ATTR_MULTICAST = "multicast"
 ATTR_NAME = "name"
 ATTR_NAMESERVERS = "nameservers"
@@ -316,6 +324,7 @@ ATTR_VOLUME = "volume"
 ATTR_VPN = "vpn"
 ATTR_WAIT_BOOT = "wait_boot"
 ATTR_WATCHDOG = "watchdog"
+ATTR_WEBSOCKET_MULTIPLEX = "websocket_multiplex"
 ATTR_WEBUI = "webui"
 ATTR_WIFI = "wifi"
 
@@ -0,0 +1,126 @@
+"""Collect stats of running containers from streams of dockerd."""
+import asyncio
+from collections import deque
+import logging
+
+from ..const import BusEvent
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import DockerError
+from .const import LABEL_MANAGED, RUNNING_STATES
+from .monitor import DockerContainerStateEvent
+from .stats import DockerStats
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Dockerd sends a sample every second
+STATS_HISTORY = 60
+
+# Time to wait for the first sample of a new stream
+STATS_TIMEOUT = 10
+
+
+class DockerStatsCollector(CoreSysAttributes):
+    """Keep one stats stream per running container.
+
+    The last samples of every stream are kept, so stats are answered without
+    asking dockerd for a new sample.
+    """
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize stats collector."""
+        self.coresys: CoreSys = coresys
+        self._samples: dict[str, deque[DockerStats]] = {}
+        self._streams: dict[str, asyncio.Task] = {}
+        self._sampled: dict[str, asyncio.Event] = {}
+
+    async def load(self) -> None:
+        """Subscribe to stats of running managed containers."""
+        self.sys_bus.register_event(
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.container_state_changed
+        )
+
+        try:
+            containers = await self.sys_docker.engine.containers_list()
+        except DockerError as err:
+            _LOGGER.warning("Can't subscribe to stats of containers: %s", err)
+            return
+
+        for container in containers:
+            if container["State"] != "running" or LABEL_MANAGED not in (
+                container.get("Labels") or {}
+            ):
+                continue
+            for name in container.get("Names", []):
+                self.subscribe(name.lstrip("/"))
+
+    async def unload(self) -> None:
+        """Stop all stats streams."""
+        for name in list(self._streams):
+            self.unsubscribe(name)
+
+    async def container_state_changed(self, event: DockerContainerStateEvent) -> None:
+        """Follow start and stop of managed containers."""
+        if event.state in RUNNING_STATES:
+            self.subscribe(event.name)
+        else:
+            self.unsubscribe(event.name)
+
+    def subscribe(self, name: str) -> None:
+        """Start stats stream of a container, if not running yet."""
+        if name in self._streams:
+            return
+
+        self._samples[name] = deque(maxlen=STATS_HISTORY)
+        self._sampled[name] = asyncio.Event()
+        self._streams[name] = self.sys_create_task(self._collect(name))
+
+    def unsubscribe(self, name: str) -> None:
+        """Stop stats stream of a container and drop its samples."""
+        if task := self._streams.pop(name, None):
+            task.cancel()
+        self._samples.pop(name, None)
+        if sampled := self._sampled.pop(name, None):
+            # Wake up anyone waiting for a sample that won't come
+            sampled.set()
+
+    async def _collect(self, name: str) -> None:
+        """Read stats stream of a container until it ends."""
+        samples = self._samples[name]
+        sampled = self._sampled[name]
+        try:
+            async for stats in self.sys_docker.engine.container_stats_stream(name):
+                # First sample of a stream has no previous CPU usage to compare
+                if "system_cpu_usage" not in stats.get("precpu_stats", {}):
+                    continue
+                samples.append(DockerStats(stats))
+                sampled.set()
+        except DockerError as err:
+            _LOGGER.debug("Stats stream of %s ended: %s", name, err)
+        finally:
+            sampled.set()
+            if self._streams.get(name) is asyncio.current_task():
+                del self._streams[name]
+
+    async def stats(self, name: str) -> DockerStats:
+        """Return last stats sample of a running container."""
+        self.subscribe(name)
+        if not self._samples[name]:
+            try:
+                await asyncio.wait_for(self._sampled[name].wait(), STATS_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+
+        if not (samples := self._samples.get(name)):
+            self.unsubscribe(name)
+            raise DockerError(f"Can't read stats from {name}", _LOGGER.error)
+        return samples[-1]
+
+    def history(self, name: str, window: int = STATS_HISTORY) -> list[DockerStats]:
+        """Return samples of the last seconds of a container, oldest first."""
+        if window <= 0:
+            return []
+        return list(self._samples.get(name, ()))[-window:]
+
+    def sweep(self) -> dict[str, DockerStats]:
+        """Return last stats sample of every container with a stream."""
+        return {name: samples[-1] for name, samples in self._samples.items() if samples}
@@ -28,6 +28,12 @@ class ContainerState(str, Enum):
     UNKNOWN = "unknown"
 
 
+RUNNING_STATES = (
+    ContainerState.RUNNING,
+    ContainerState.HEALTHY,
+    ContainerState.UNHEALTHY,
+)
+
 DBUS_PATH = "/run/dbus"
 DBUS_VOLUME = {"bind": DBUS_PATH, "mode": "ro"}
 
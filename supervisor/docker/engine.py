@@ -0,0 +1,190 @@
+"""Async client of the Docker Engine API."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import json
+from pathlib import Path
+import struct
+from typing import Any
+
+import aiohttp
+
+from ..const import SOCKET_DOCKER
+from ..exceptions import DockerAPIError, DockerNotFound, DockerRequestError
+
+# Requests to dockerd running at the same time, streams are not limited
+DOCKER_CONNECTIONS = 16
+DOCKER_KEEPALIVE = 60
+
+# Timeout of requests, stop and restart add the timeout of the container
+DOCKER_REQUEST_TIMEOUT = 30
+
+# Header of a frame of a multiplexed stdout/stderr stream
+LOG_FRAME_HEADER = struct.Struct(">BxxxL")
+
+
+class DockerEngineClient:
+    """Client of the Docker Engine API on the local socket.
+
+    Requests share a pool of keep-alive connections and run on the event loop,
+    no executor thread is needed. Streams like stats and followed logs stay
+    open as long as they are read, they use their own connections so they
+    can't take all connections of the pool.
+    """
+
+    def __init__(self, socket: Path = SOCKET_DOCKER) -> None:
+        """Initialize client."""
+        self._socket: Path = socket
+        self._session: aiohttp.ClientSession | None = None
+        self._stream_session: aiohttp.ClientSession | None = None
+
+    def _create_session(self, limit: int) -> aiohttp.ClientSession:
+        """Return new session on the socket, limit 0 has no limit."""
+        return aiohttp.ClientSession(
+            base_url="http://localhost",
+            connector=aiohttp.UnixConnector(
+                path=str(self._socket),
+                limit=limit,
+                keepalive_timeout=DOCKER_KEEPALIVE,
+            ),
+            timeout=aiohttp.ClientTimeout(total=DOCKER_REQUEST_TIMEOUT),
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return session of requests, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session(DOCKER_CONNECTIONS)
+        return self._session
+
+    @property
+    def stream_session(self) -> aiohttp.ClientSession:
+        """Return session of streams, created on first use."""
+        if self._stream_session is None or self._stream_session.closed:
+            self._stream_session = self._create_session(0)
+        return self._stream_session
+
+    async def close(self) -> None:
+        """Close all connections."""
+        for session in (self._session, self._stream_session):
+            if session:
+                await session.close()
+        self._session = None
+        self._stream_session = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: int = DOCKER_REQUEST_TIMEOUT,
+    ) -> Any:
+        """Send a request and return decoded JSON result, if any."""
+        try:
+            async with self.session.request(
+                method,
+                path,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                await self._check_response(resp, path)
+                if resp.content_type == "application/json":
+                    return await resp.json()
+                return await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as err:
+            raise DockerRequestError(
+                f"Dockerd connection issue for {path}: {err!s}"
+            ) from err
+
+    @asynccontextmanager
+    async def stream(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[aiohttp.StreamReader]:
+        """Send a GET request and return a reader of the body without timeout."""
+        try:
+            async with self.stream_session.get(
+                path,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10),
+            ) as resp:
+                await self._check_response(resp, path)
+                yield resp.content
+        except (aiohttp.ClientError, OSError) as err:
+            raise DockerRequestError(
+                f"Dockerd connection issue for {path}: {err!s}"
+            ) from err
+
+    @staticmethod
+    async def _check_response(resp: aiohttp.ClientResponse, path: str) -> None:
+        """Raise if dockerd answered with an error."""
+        if resp.status < 400:
+            return
+
+        try:
+            message = (await resp.json(content_type=None)).get("message")
+        except (ValueError, AttributeError, aiohttp.ClientError):
+            message = resp.reason
+
+        if resp.status == 404:
+            raise DockerNotFound(f"{path} not found: {message}")
+        raise DockerAPIError(f"Docker API error {resp.status} on {path}: {message}")
+
+    async def containers_list(self) -> list[dict[str, Any]]:
+        """Return summary of all containers, running or not."""
+        return await self.request("GET", "/containers/json", params={"all": "true"})
+
+    async def container_inspect(self, name: str) -> dict[str, Any]:
+        """Return attributes of a container."""
+        return await self.request("GET", f"/containers/{name}/json")
+
+    async def container_start(self, name: str) -> None:
+        """Start a container."""
+        await self.request("POST", f"/containers/{name}/start")
+
+    async def container_restart(self, name: str, timeout: int) -> None:
+        """Restart a container, kill it after timeout."""
+        await self.request(
+            "POST",
+            f"/containers/{name}/restart",
+            params={"t": timeout},
+            timeout=timeout + DOCKER_REQUEST_TIMEOUT,
+        )
+
+    async def container_stats(self, name: str) -> dict[str, Any]:
+        """Return one sample of resource usage of a container."""
+        return await self.request(
+            "GET", f"/containers/{name}/stats", params={"stream": "false"}
+        )
+
+    async def container_stats_stream(self, name: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield samples of resource usage of a running container."""
+        async with self.stream(
+            f"/containers/{name}/stats", params={"stream": "true"}
+        ) as content:
+            while line := await content.readline():
+                yield json.loads(line)
+
+    async def container_logs(
+        self, name: str, tty: bool = False, **params: Any
+    ) -> AsyncIterator[bytes]:
+        """Yield output of a container.
+
+        Output of containers without TTY is a multiplexed stream, only the
+        payload of its frames is passed on.
+        """
+        params = {"stdout": "true", "stderr": "true", **params}
+        async with self.stream(f"/containers/{name}/logs", params=params) as content:
+            if tty:
+                async for chunk in content.iter_any():
+                    yield chunk
+                return
+
+            while True:
+                try:
+                    header = await content.readexactly(LOG_FRAME_HEADER.size)
+                    _, size = LOG_FRAME_HEADER.unpack(header)
+                    yield await content.readexactly(size)
+                except asyncio.IncompleteReadError:
+                    return
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from contextlib import suppress
 import logging
 import re
@@ -35,7 +36,7 @@ from ..exceptions import (
 )
 from ..resolution.const import ContextType, IssueType, SuggestionType
 from ..utils import process_lock
-from .const import ContainerState
+from .const import RUNNING_STATES, ContainerState
 from .manager import CommandReturn
 from .monitor import DockerContainerStateEvent
 from .stats import DockerStats
@@ -54,23 +55,28 @@ MAP_ARCH = {
 }
 
 
-def _container_state_from_model(docker_container: Container) -> ContainerState:
-    """Get container state from model."""
-    if docker_container.status == "running":
-        if "Health" in docker_container.attrs["State"]:
+def _container_state_from_attrs(attrs: dict[str, Any]) -> ContainerState:
+    """Get container state from attributes of container."""
+    if attrs["State"]["Status"] == "running":
+        if "Health" in attrs["State"]:
             return (
                 ContainerState.HEALTHY
-                if docker_container.attrs["State"]["Health"]["Status"] == "healthy"
+                if attrs["State"]["Health"]["Status"] == "healthy"
                 else ContainerState.UNHEALTHY
             )
         return ContainerState.RUNNING
 
-    if docker_container.attrs["State"]["ExitCode"] > 0:
+    if attrs["State"]["ExitCode"] > 0:
         return ContainerState.FAILED
 
     return ContainerState.STOPPED
 
 
+def _container_state_from_model(docker_container: Container) -> ContainerState:
+    """Get container state from model."""
+    return _container_state_from_attrs(docker_container.attrs)
+
+
 class DockerInterface(CoreSysAttributes):
     """Docker Supervisor interface."""
 
@@ -280,12 +286,17 @@ class DockerInterface(CoreSysAttributes):
             return True
         return False
 
-    def is_running(self) -> Awaitable[bool]:
-        """Return True if Docker is running.
+    async def is_running(self) -> bool:
+        """Return True if Docker is running."""
+        if state := self.sys_docker.monitor.container_state(self.name):
+            return state in RUNNING_STATES
 
-        Return a Future.
-        """
-        return self.sys_run_in_executor(self._is_running)
+        try:
+            attrs = await self.sys_docker.engine.container_inspect(self.name)
+        except DockerNotFound:
+            return False
+
+        return attrs["State"]["Status"] == "running"
 
     def _is_running(self) -> bool:
         """Return True if Docker is running.
@@ -303,28 +314,17 @@ class DockerInterface(CoreSysAttributes):
 
         return docker_container.status == "running"
 
-    def current_state(self) -> Awaitable[ContainerState]:
-        """Return current state of container.
-
-        Return a Future.
-        """
-        return self.sys_run_in_executor(self._current_state)
+    async def current_state(self) -> ContainerState:
+        """Return current state of container."""
+        if state := self.sys_docker.monitor.container_state(self.name):
+            return state
 
-    def _current_state(self) -> ContainerState:
-        """Return current state of container.
-
-        Need run inside executor.
-        """
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
-        except docker.errors.NotFound:
+            attrs = await self.sys_docker.engine.container_inspect(self.name)
+        except DockerNotFound:
             return ContainerState.UNKNOWN
-        except docker.errors.DockerException as err:
-            raise DockerAPIError() from err
-        except requests.RequestException as err:
-            raise DockerRequestError() from err
 
-        return _container_state_from_model(docker_container)
+        return _container_state_from_attrs(attrs)
 
     @process_lock
     def attach(
@@ -410,26 +410,19 @@ class DockerInterface(CoreSysAttributes):
                 docker_container.remove(force=True)
 
     @process_lock
-    def start(self) -> Awaitable[None]:
+    async def start(self) -> None:
         """Start Docker container."""
-        return self.sys_run_in_executor(self._start)
-
-    def _start(self) -> None:
-        """Start docker container.
-
-        Need run inside executor.
-        """
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
-        except (docker.errors.DockerException, requests.RequestException) as err:
+            await self.sys_docker.engine.container_inspect(self.name)
+        except DockerError as err:
             raise DockerError(
                 f"{self.name} not found for starting up", _LOGGER.error
             ) from err
 
         _LOGGER.info("Starting %s", self.name)
         try:
-            docker_container.start()
-        except (docker.errors.DockerException, requests.RequestException) as err:
+            await self.sys_docker.engine.container_start(self.name)
+        except DockerError as err:
             raise DockerError(f"Can't start {self.name}: {err}", _LOGGER.error) from err
 
     @process_lock
@@ -491,30 +484,41 @@ class DockerInterface(CoreSysAttributes):
         with suppress(DockerError):
             self._stop()
 
-    def logs(self) -> Awaitable[bytes]:
-        """Return Docker logs of container.
-
-        Return a Future.
-        """
-        return self.sys_run_in_executor(self._logs)
-
-    def _logs(self) -> bytes:
-        """Return Docker logs of container.
-
-        Need run inside executor.
-        """
+    async def logs(self) -> bytes:
+        """Return Docker logs of container."""
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
-        except (docker.errors.DockerException, requests.RequestException):
-            return b""
-
-        try:
-            return docker_container.logs(tail=100, stdout=True, stderr=True)
-        except (docker.errors.DockerException, requests.RequestException) as err:
+            return b"".join([chunk async for chunk in await self.logs_stream()])
+        except DockerError as err:
             _LOGGER.warning("Can't grep logs from %s: %s", self.image, err)
 
         return b""
 
+    async def logs_stream(
+        self,
+        follow: bool = False,
+        tail: int | str = 100,
+        since: str | None = None,
+        timestamps: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Return stream of Docker logs of container.
+
+        Since is a Docker timestamp, seconds and nanoseconds of unix time. The
+        stream is only opened on first read.
+        """
+        attrs = await self.sys_docker.engine.container_inspect(self.name)
+
+        params: dict[str, str] = {"tail": str(tail)}
+        if follow:
+            params["follow"] = "true"
+        if since:
+            params["since"] = since
+        if timestamps:
+            params["timestamps"] = "true"
+
+        return self.sys_docker.engine.container_logs(
+            self.name, tty=attrs["Config"].get("Tty", False), **params
+        )
+
     @process_lock
     def cleanup(self, old_image: str | None = None) -> Awaitable[None]:
         """Check if old version exists and cleanup."""
@@ -568,24 +572,14 @@ class DockerInterface(CoreSysAttributes):
                 self.sys_docker.images.remove(image.id, force=True)
 
     @process_lock
-    def restart(self) -> Awaitable[None]:
+    async def restart(self) -> None:
         """Restart docker container."""
-        return self.sys_loop.run_in_executor(None, self._restart)
-
-    def _restart(self) -> None:
-        """Restart docker container.
-
-        Need run inside executor.
-        """
-        try:
-            container = self.sys_docker.containers.get(self.name)
-        except (docker.errors.DockerException, requests.RequestException) as err:
-            raise DockerError() from err
+        await self.sys_docker.engine.container_inspect(self.name)
 
         _LOGGER.info("Restarting %s", self.image)
         try:
-            container.restart(timeout=self.timeout)
-        except (docker.errors.DockerException, requests.RequestException) as err:
+            await self.sys_docker.engine.container_restart(self.name, self.timeout)
+        except DockerError as err:
             raise DockerError(
                 f"Can't restart {self.image}: {err}", _LOGGER.warning
             ) from err
@@ -602,57 +596,33 @@ class DockerInterface(CoreSysAttributes):
         """
         raise NotImplementedError()
 
-    def stats(self) -> Awaitable[DockerStats]:
-        """Read and return stats from container."""
-        return self.sys_run_in_executor(self._stats)
-
-    def _stats(self) -> DockerStats:
-        """Create a temporary container and run command.
-
-        Need run inside executor.
-        """
-        try:
-            docker_container = self.sys_docker.containers.get(self.name)
-        except (docker.errors.DockerException, requests.RequestException) as err:
-            raise DockerError() from err
-
-        # container is not running
-        if docker_container.status != "running":
+    async def stats(self) -> DockerStats:
+        """Return last stats sample of container."""
+        if not await self.is_running():
             raise DockerError(f"Container {self.name} is not running", _LOGGER.error)
 
-        try:
-            stats = docker_container.stats(stream=False)
-            return DockerStats(stats)
-        except (docker.errors.DockerException, requests.RequestException) as err:
-            raise DockerError(
-                f"Can't read stats from {self.name}: {err}", _LOGGER.error
-            ) from err
-
-    def is_failed(self) -> Awaitable[bool]:
-        """Return True if Docker is failing state.
+        return await self.sys_docker.collector.stats(self.name)
 
-        Return a Future.
-        """
-        return self.sys_run_in_executor(self._is_failed)
+    def stats_history(self, window: int) -> list[DockerStats]:
+        """Return stats samples of the last seconds, oldest first."""
+        return self.sys_docker.collector.history(self.name, window)
 
-    def _is_failed(self) -> bool:
-        """Return True if Docker is failing state.
+    async def is_failed(self) -> bool:
+        """Return True if Docker is failing state."""
+        if state := self.sys_docker.monitor.container_state(self.name):
+            return state == ContainerState.FAILED
 
-        Need run inside executor.
-        """
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
-        except docker.errors.NotFound:
+            attrs = await self.sys_docker.engine.container_inspect(self.name)
+        except DockerNotFound:
             return False
-        except (docker.errors.DockerException, requests.RequestException) as err:
-            raise DockerError() from err
 
         # container is not running
-        if docker_container.status != "exited":
+        if attrs["State"]["Status"] != "exited":
             return False
 
         # Check return value
-        return int(docker_container.attrs["State"]["ExitCode"]) != 0
+        return int(attrs["State"]["ExitCode"]) != 0
 
     def get_latest_version(self) -> Awaitable[AwesomeVersion]:
         """Return latest version of local image."""
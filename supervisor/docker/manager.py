@@ -29,7 +29,9 @@ from ..coresys import CoreSys
 from ..exceptions import DockerAPIError, DockerError, DockerNotFound, DockerRequestError
 from ..utils.common import FileConfiguration
 from ..validate import SCHEMA_DOCKER_CONFIG
+from .collector import DockerStatsCollector
 from .const import LABEL_MANAGED
+from .engine import DockerEngineClient
 from .monitor import DockerMonitor
 from .network import DockerNetwork
 
@@ -106,10 +108,12 @@ class DockerAPI:
         self.docker: DockerClient = DockerClient(
             base_url=f"unix:/{str(SOCKET_DOCKER)}", version="auto", timeout=900
         )
+        self.engine: DockerEngineClient = DockerEngineClient()
         self.network: DockerNetwork = DockerNetwork(self.docker)
         self._info: DockerInfo = DockerInfo.new(self.docker.info())
         self.config: DockerConfig = DockerConfig()
         self._monitor: DockerMonitor = DockerMonitor(coresys)
+        self._collector: DockerStatsCollector = DockerStatsCollector(coresys)
 
     @property
     def images(self) -> ImageCollection:
@@ -141,13 +145,21 @@ class DockerAPI:
         """Return docker events monitor."""
         return self._monitor
 
+    @property
+    def collector(self) -> DockerStatsCollector:
+        """Return stats collector of containers."""
+        return self._collector
+
     async def load(self) -> None:
-        """Start docker events monitor."""
+        """Start docker events monitor and stats collector."""
         await self.monitor.load()
+        await self.collector.load()
 
     async def unload(self) -> None:
-        """Stop docker events monitor."""
+        """Stop docker events monitor and stats collector."""
+        await self.collector.unload()
         await self.monitor.unload()
+        await self.engine.close()
 
     def run(
         self,
@@ -1,17 +1,22 @@
 """Supervisor docker monitor based on events."""
 from dataclasses import dataclass
 import logging
+import re
 from threading import Thread
+from typing import Any
 
 from docker.models.containers import Container
 from docker.types.daemon import CancellableStream
 
 from ..const import BusEvent
 from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import DockerError
 from .const import LABEL_MANAGED, ContainerState
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+RE_EXIT_CODE = re.compile(r"^Exited \((\d+)\)")
+
 
 @dataclass
 class DockerContainerStateEvent:
@@ -23,8 +28,28 @@ class DockerContainerStateEvent:
     time: int
 
 
+def _container_state_from_summary(summary: dict[str, Any]) -> ContainerState:
+    """Get container state from a container of the container list."""
+    status: str = summary.get("Status", "")
+    if summary["State"] == "running":
+        if status.endswith("(healthy)"):
+            return ContainerState.HEALTHY
+        if status.endswith("(unhealthy)"):
+            return ContainerState.UNHEALTHY
+        return ContainerState.RUNNING
+
+    if (exit_code := RE_EXIT_CODE.match(status)) and int(exit_code.group(1)) > 0:
+        return ContainerState.FAILED
+
+    return ContainerState.STOPPED
+
+
 class DockerMonitor(CoreSysAttributes, Thread):
-    """Docker monitor for supervisor."""
+    """Docker monitor for supervisor.
+
+    Keeps the state of all containers, loaded once and updated from the event
+    stream. Events are applied on the event loop in the order they arrive.
+    """
 
     def __init__(self, coresys: CoreSys):
         """Initialize Docker monitor object."""
@@ -32,6 +57,50 @@ class DockerMonitor(CoreSysAttributes, Thread):
         self.coresys = coresys
         self._events: CancellableStream | None = None
         self._unlabeled_managed_containers: list[str] = []
+        self._states: dict[str, ContainerState] = {}
+        self._states_loaded: bool = False
+        # Events applied while a reload waits for the container list
+        self._reload_changes: list[dict[str, ContainerState | None]] = []
+
+    def container_state(self, name: str) -> ContainerState | None:
+        """Return state of a container, None if states are not known."""
+        if not self._states_loaded:
+            return None
+        return self._states.get(name, ContainerState.UNKNOWN)
+
+    def _set_state(self, name: str, state: ContainerState | None) -> None:
+        """Update state of a container, None if it got removed."""
+        for changes in self._reload_changes:
+            changes[name] = state
+
+        if state is None:
+            self._states.pop(name, None)
+        else:
+            self._states[name] = state
+
+    async def reload(self) -> None:
+        """Load state of all containers, corrects events missed by the stream."""
+        changes: dict[str, ContainerState | None] = {}
+        self._reload_changes.append(changes)
+        try:
+            containers = await self.sys_docker.engine.containers_list()
+        except DockerError as err:
+            _LOGGER.warning("Can't load state of containers: %s", err)
+            self._states_loaded = False
+            return
+        finally:
+            self._reload_changes.remove(changes)
+
+        self._states = {
+            name.lstrip("/"): _container_state_from_summary(container)
+            for container in containers
+            for name in container.get("Names", [])
+        }
+
+        # The list can be older than events that arrived in the meantime
+        for name, state in changes.items():
+            self._set_state(name, state)
+        self._states_loaded = self.is_alive()
 
     def watch_container(self, container: Container):
         """If container is missing the managed label, add name to list."""
@@ -44,6 +113,8 @@ class DockerMonitor(CoreSysAttributes, Thread):
         Thread.start(self)
         _LOGGER.info("Started docker events monitor")
 
+        await self.reload()
+
     async def unload(self):
         """Stop docker events monitor."""
         self._events.close()
@@ -56,13 +127,18 @@ class DockerMonitor(CoreSysAttributes, Thread):
 
     def run(self):
         """Monitor and process docker events."""
+        try:
+            self._process_events()
+        finally:
+            # States can't be kept current anymore
+            self._states_loaded = False
+
+    def _process_events(self):
+        """Update states and fire events of managed containers."""
         for event in self._events:
             attributes: dict[str, str] = event.get("Actor", {}).get("Attributes", {})
 
-            if event["Type"] == "container" and (
-                LABEL_MANAGED in attributes
-                or attributes.get("name") in self._unlabeled_managed_containers
-            ):
+            if event["Type"] == "container":
                 container_state: ContainerState | None = None
                 action: str = event["Action"]
 
@@ -71,7 +147,7 @@ class DockerMonitor(CoreSysAttributes, Thread):
                 elif action == "die":
                     container_state = (
                         ContainerState.STOPPED
-                        if int(event["Actor"]["Attributes"]["exitCode"]) == 0
+                        if int(attributes.get("exitCode", 0)) == 0
                         else ContainerState.FAILED
                     )
                 elif action == "health_status: healthy":
@@ -79,7 +155,20 @@ class DockerMonitor(CoreSysAttributes, Thread):
                 elif action == "health_status: unhealthy":
                     container_state = ContainerState.UNHEALTHY
 
-                if container_state:
+                # Created containers didn't start yet, destroyed ones are gone
+                if action == "create":
+                    self.sys_loop.call_soon_threadsafe(
+                        self._set_state, attributes["name"], ContainerState.STOPPED
+                    )
+                elif container_state or action == "destroy":
+                    self.sys_loop.call_soon_threadsafe(
+                        self._set_state, attributes["name"], container_state
+                    )
+
+                if container_state and (
+                    LABEL_MANAGED in attributes
+                    or attributes.get("name") in self._unlabeled_managed_containers
+                ):
                     self.sys_loop.call_soon_threadsafe(
                         self.sys_bus.fire_event,
                         BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
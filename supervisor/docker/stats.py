@@ -5,6 +5,17 @@ from contextlib import suppress
 class DockerStats:
     """Hold stats data from container inside."""
 
+    __slots__ = (
+        "_cpu",
+        "_network_rx",
+        "_network_tx",
+        "_blk_read",
+        "_blk_write",
+        "_memory_usage",
+        "_memory_limit",
+        "_memory_percent",
+    )
+
     def __init__(self, stats):
         """Initialize Docker stats."""
         self._cpu = 0.0
@@ -13,6 +13,7 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 _MOUNTINFO: Path = Path("/proc/self/mountinfo")
 _BLOCK_DEVICE_CLASS = "/sys/class/block/{}"
 _BLOCK_DEVICE_EMMC_LIFE_TIME = "/sys/block/{}/device/life_time"
+_BLOCK_DEVICE_ROTATIONAL = "/sys/block/{}/queue/rotational"
 
 
 class HwDisk(CoreSysAttributes):
@@ -111,10 +112,10 @@ class HwDisk(CoreSysAttributes):
         # Return the pessimistic estimate (0x02 -> 10%-20%, return 20%)
         return life_time_value * 10.0
 
-    def get_disk_life_time(self, path: str | Path) -> float:
-        """Return life time estimate of the underlying SSD drive."""
+    def _get_mount_source_device_name(self, path: str | Path) -> str | None:
+        """Return name of the block device holding path."""
         mount_source = self._get_mount_source(str(path))
-        if mount_source == "overlay":
+        if mount_source is None or mount_source == "overlay":
             return None
 
         mount_source_path = Path(mount_source)
@@ -130,7 +131,25 @@ class HwDisk(CoreSysAttributes):
         )
 
         # ... resolve symlink and get parent device from that path.
-        mount_source_device_name = mount_source_device_part.resolve().parts[-2]
+        return mount_source_device_part.resolve().parts[-2]
+
+    def get_disk_life_time(self, path: str | Path) -> float:
+        """Return life time estimate of the underlying SSD drive."""
+        mount_source_device_name = self._get_mount_source_device_name(path)
+        if mount_source_device_name is None:
+            return None
 
         # Currently only eMMC block devices supported
         return self._try_get_emmc_life_time(mount_source_device_name)
+
+    def is_fast_disk(self, path: str | Path) -> bool:
+        """Return True if path is on a non-rotational disk other than SD/eMMC."""
+        device_name = self._get_mount_source_device_name(path)
+        if device_name is None or device_name.startswith("mmcblk"):
+            return False
+
+        rotational_path = Path(_BLOCK_DEVICE_ROTATIONAL.format(device_name))
+        try:
+            return rotational_path.read_text(encoding="utf-8").strip() == "0"
+        except OSError:
+            return False
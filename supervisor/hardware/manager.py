@@ -23,6 +23,7 @@ class HardwareManager(CoreSysAttributes):
         """Initialize Hardware Monitor object."""
         self.coresys: CoreSys = coresys
         self._devices: dict[str, Device] = {}
+        self.generation: int = 0
         self._udev = pyudev.Context()
 
         self._montior: HwMonitor = HwMonitor(coresys)
@@ -76,10 +77,12 @@ class HardwareManager(CoreSysAttributes):
     def update_device(self, device: Device) -> None:
         """Update or add a (new) Device."""
         self._devices[device.name] = device
+        self.generation += 1
 
     def delete_device(self, device: Device) -> None:
         """Remove a device from the list."""
         self._devices.pop(device.name, None)
+        self.generation += 1
 
     def exists_device_node(self, device_node: Path) -> bool:
         """Check if device exists on Host."""
@@ -99,6 +102,7 @@ class HardwareManager(CoreSysAttributes):
     def _import_devices(self) -> None:
         """Import fresh from udev database."""
         self._devices.clear()
+        self.generation += 1
 
         # Exctract all devices
         for device in self._udev.list_devices():
@@ -9,11 +9,13 @@ import aiohttp
 from aiohttp import hdrs
 
 from ..coresys import CoreSys, CoreSysAttributes
+from ..docker.const import ContainerState
+from ..docker.monitor import DockerContainerStateEvent
 from ..exceptions import HomeAssistantAPIError, HomeAssistantAuthError
 from ..jobs.const import JobExecutionLimit
 from ..jobs.decorator import Job
 from ..utils import check_port
-from .const import LANDINGPAGE
+from .const import API_STATE_FAILED_TTL, API_STATE_TTL, LANDINGPAGE
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -29,6 +31,10 @@ class HomeAssistantAPI(CoreSysAttributes):
         self.access_token: str | None = None
         self._access_token_expires: datetime | None = None
 
+        # Last known API state, refreshed by checks, websocket and container events
+        self._api_state: bool | None = None
+        self._api_state_expires: datetime | None = None
+
     @Job(limit=JobExecutionLimit.SINGLE_WAIT)
     async def ensure_access_token(self) -> None:
         """Ensure there is an access token."""
@@ -115,6 +121,36 @@ class HomeAssistantAPI(CoreSysAttributes):
                 _LOGGER.debug("Home Assistant API return: %d", resp.status)
         raise HomeAssistantAPIError()
 
+    def set_api_state(self, state: bool | None) -> None:
+        """Record the Home Assistant API state, None forces a new check.
+
+        A failed check is kept shortly, Core can be up a moment later.
+        """
+        self._api_state = state
+        if state is None:
+            self._api_state_expires = None
+        else:
+            self._api_state_expires = datetime.utcnow() + (
+                API_STATE_TTL if state else API_STATE_FAILED_TTL
+            )
+
+    async def container_state_changed(self, event: DockerContainerStateEvent) -> None:
+        """Invalidate API state when the Home Assistant container changes."""
+        if event.name != self.sys_homeassistant.core.instance.name:
+            return
+
+        if event.state in (ContainerState.RUNNING, ContainerState.HEALTHY):
+            # Container is up but the API may still be starting, check again
+            self.set_api_state(None)
+        else:
+            self.set_api_state(False)
+
+    async def get_api_state(self) -> bool:
+        """Return True if Home Assistant up and running, using last known state."""
+        if self._api_state is not None and self._api_state_expires > datetime.utcnow():
+            return self._api_state
+        return await self.check_api_state()
+
     async def check_api_state(self) -> bool:
         """Return True if Home Assistant up and running."""
         # Skip check on landingpage
@@ -122,6 +158,7 @@ class HomeAssistantAPI(CoreSysAttributes):
             self.sys_homeassistant.version is None
             or self.sys_homeassistant.version == LANDINGPAGE
         ):
+            self.set_api_state(False)
             return False
 
         # Check if port is up
@@ -130,6 +167,7 @@ class HomeAssistantAPI(CoreSysAttributes):
             self.sys_homeassistant.ip_address,
             self.sys_homeassistant.api_port,
         ):
+            self.set_api_state(False)
             return False
 
         # Check if API is up
@@ -137,5 +175,8 @@ class HomeAssistantAPI(CoreSysAttributes):
             data = await self.get_config()
             # Older versions of home assistant does not expose the state
             if data and data.get("state", "RUNNING") == "RUNNING":
+                self.set_api_state(True)
                 return True
+
+        self.set_api_state(False)
         return False
@@ -11,6 +11,8 @@ WATCHDOG_RETRY_SECONDS = 10
 WATCHDOG_MAX_ATTEMPTS = 5
 WATCHDOG_THROTTLE_PERIOD = timedelta(minutes=30)
 WATCHDOG_THROTTLE_MAX_CALLS = 10
+API_STATE_TTL = timedelta(seconds=30)
+API_STATE_FAILED_TTL = timedelta(seconds=5)
 
 CLOSING_STATES = [
     CoreState.SHUTDOWN,
@@ -262,6 +262,9 @@ class HomeAssistant(FileConfiguration, CoreSysAttributes):
 
         # Register for events
         self.sys_bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, self._hardware_events)
+        self.sys_bus.register_event(
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.api.container_state_changed
+        )
 
     def write_pulse(self):
         """Write asound config to file and return True on success."""
@@ -24,6 +24,13 @@ MIN_VERSION = {
     WSType.BACKUP_START: "2022.1.0",
     WSType.BACKUP_END: "2022.1.0",
 }
+MIN_VERSION_BATCH = AwesomeVersion("2023.2.0")
+
+# Keys with a pending update, the oldest is dropped for a new one if full
+MAX_QUEUED_UPDATE_EVENTS = 64
+
+# Updates arriving within this time are merged before they are sent
+UPDATE_EVENTS_DELAY = 0.05
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -85,6 +92,32 @@ class WSClient:
         finally:
             self._futures.pop(message["id"])
 
+    async def async_send_commands(
+        self, messages: list[dict[str, Any]]
+    ) -> list[dict | None | Exception]:
+        """Send websocket messages in one frame, and return the responses."""
+        for message in messages:
+            self._message_id += 1
+            message["id"] = self._message_id
+            self._futures[message["id"]] = self._loop.create_future()
+        _LOGGER.debug("Sending: %s", messages)
+
+        try:
+            await self._client.send_json(messages)
+        except ConnectionError as err:
+            for message in messages:
+                self._futures.pop(message["id"])
+            raise HomeAssistantWSConnectionError(err) from err
+
+        try:
+            return await asyncio.gather(
+                *[self._futures[message["id"]] for message in messages],
+                return_exceptions=True,
+            )
+        finally:
+            for message in messages:
+                self._futures.pop(message["id"])
+
     async def start_listener(self) -> None:
         """Start listening to the websocket."""
         if not self.connected:
@@ -172,6 +205,8 @@ class HomeAssistantWebSocket(CoreSysAttributes):
         self.coresys: CoreSys = coresys
         self._client: WSClient | None = None
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._queue: dict[str, dict[str, Any]] = {}
+        self._queue_task: asyncio.Task | None = None
 
     async def _get_ws_client(self) -> WSClient:
         """Return a websocket client."""
@@ -187,6 +222,9 @@ class HomeAssistantWebSocket(CoreSysAttributes):
                 self.sys_homeassistant.api.access_token,
             )
 
+            # An authenticated connection means the API is up
+            self.sys_homeassistant.api.set_api_state(True)
+
             self.sys_create_task(client.start_listener())
             return client
 
@@ -194,14 +232,11 @@ class HomeAssistantWebSocket(CoreSysAttributes):
         """Determine if we can use WebSocket messages."""
         if self.sys_core.state in CLOSING_STATES:
             return False
-        if not await self.sys_homeassistant.api.check_api_state():
-            # No core access, don't try.
-            return False
-
-        if not self._client:
-            self._client = await self._get_ws_client()
 
-        if not self._client.connected:
+        if not self._client or not self._client.connected:
+            if not await self.sys_homeassistant.api.get_api_state():
+                # No core access, don't try.
+                return False
             self._client = await self._get_ws_client()
 
         message_type = message.get("type")
@@ -229,6 +264,7 @@ class HomeAssistantWebSocket(CoreSysAttributes):
         except HomeAssistantWSConnectionError:
             await self._client.close()
             self._client = None
+            self.sys_homeassistant.api.set_api_state(None)
 
     async def async_send_command(self, message: dict[str, Any]) -> dict[str, Any]:
         """Send a command with the WS client and wait for the response."""
@@ -240,8 +276,51 @@ class HomeAssistantWebSocket(CoreSysAttributes):
         except HomeAssistantWSConnectionError:
             await self._client.close()
             self._client = None
+            self.sys_homeassistant.api.set_api_state(None)
             raise
 
+    async def async_send_messages(self, messages: list[dict[str, Any]]) -> None:
+        """Send commands with the WS client, batched in one frame if supported."""
+        if len(messages) == 1:
+            await self.async_send_message(messages[0])
+            return
+
+        if not await self._can_send(messages[0]):
+            return
+
+        if self._client.ha_version < MIN_VERSION_BATCH:
+            for message in messages:
+                await self.async_send_message(message)
+            return
+
+        try:
+            results = await self._client.async_send_commands(messages)
+        except HomeAssistantWSConnectionError:
+            await self._client.close()
+            self._client = None
+            self.sys_homeassistant.api.set_api_state(None)
+            return
+
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Could not send message to Home Assistant due to %s", result
+                )
+
+    @staticmethod
+    def _supervisor_update_message(
+        key: str, data: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Return a supervisor/event update message."""
+        return {
+            ATTR_TYPE: WSType.SUPERVISOR_EVENT,
+            ATTR_DATA: {
+                ATTR_EVENT: WSEvent.SUPERVISOR_UPDATE,
+                ATTR_UPDATE_KEY: key,
+                ATTR_DATA: data or {},
+            },
+        }
+
     async def async_supervisor_update_event(
         self,
         key: str,
@@ -249,30 +328,51 @@ class HomeAssistantWebSocket(CoreSysAttributes):
     ) -> None:
         """Send a supervisor/event command."""
         try:
-            await self.async_send_message(
-                {
-                    ATTR_TYPE: WSType.SUPERVISOR_EVENT,
-                    ATTR_DATA: {
-                        ATTR_EVENT: WSEvent.SUPERVISOR_UPDATE,
-                        ATTR_UPDATE_KEY: key,
-                        ATTR_DATA: data or {},
-                    },
-                }
-            )
+            await self.async_send_message(self._supervisor_update_message(key, data))
         except HomeAssistantWSNotSupported:
             pass
         except HomeAssistantWSError as err:
             _LOGGER.error("Could not send message to Home Assistant due to %s", err)
 
+    async def _process_update_events(self) -> None:
+        """Send queued supervisor/event updates until the queue is empty."""
+        while self._queue:
+            # Updates queued while waiting or sending are merged into a round
+            await asyncio.sleep(UPDATE_EVENTS_DELAY)
+            queue, self._queue = self._queue, {}
+            try:
+                await self.async_send_messages(
+                    [
+                        self._supervisor_update_message(key, data)
+                        for key, data in queue.items()
+                    ]
+                )
+            except HomeAssistantWSNotSupported:
+                pass
+            except HomeAssistantWSError as err:
+                _LOGGER.error("Could not send message to Home Assistant due to %s", err)
+
     def supervisor_update_event(
         self,
         key: str,
         data: dict[str, Any] | None = None,
     ) -> None:
-        """Send a supervisor/event command."""
+        """Queue a supervisor/event command, merged into a pending one for key."""
         if self.sys_core.state in CLOSING_STATES:
             return
-        self.sys_create_task(self.async_supervisor_update_event(key, data))
+
+        if key not in self._queue and len(self._queue) >= MAX_QUEUED_UPDATE_EVENTS:
+            dropped = next(iter(self._queue))
+            del self._queue[dropped]
+            _LOGGER.warning(
+                "Too many pending updates for Home Assistant, dropped %s", dropped
+            )
+
+        # Different sources update different fields of the same key
+        self._queue.setdefault(key, {}).update(data or {})
+
+        if self._queue_task is None or self._queue_task.done():
+            self._queue_task = self.sys_create_task(self._process_update_events())
 
     def send_message(self, message: dict[str, Any]) -> None:
         """Send a supervisor/event command."""
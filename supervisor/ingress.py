@@ -1,19 +1,212 @@
 """Fetch last versions from webserver."""
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable, Iterator, MutableMapping
+import heapq
 import logging
 import random
 import secrets
+import time
+from types import SimpleNamespace
+
+import aiohttp
 
 from .addons.addon import Addon
 from .const import ATTR_PORTS, ATTR_SESSION, FILE_HASSIO_INGRESS
 from .coresys import CoreSys, CoreSysAttributes
 from .utils import check_port
 from .utils.common import FileConfiguration
-from .utils.dt import utc_from_timestamp, utcnow
 from .validate import SCHEMA_INGRESS_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Connections kept open to the ingress port of an add-on
+INGRESS_CONNECTIONS_PER_ADDON = 32
+INGRESS_KEEPALIVE = 60
+INGRESS_READ_BUFSIZE = 256 * 1024
+
+# Sessions are valid for 15 minutes after the last request
+SESSION_TIMEOUT = 15 * 60 * 1_000_000_000
+SESSION_SAVE_DELAY = 60
+
+
+class IngressSessions(MutableMapping):
+    """Ingress sessions expiring on the monotonic clock.
+
+    Sessions map to their expiry in nanoseconds of time.monotonic_ns, a heap
+    orders them by expiry for cleanup. Extending a session only updates the
+    map, heap entries which are outdated get pushed again once they come up.
+    As a mapping, expiry is a timestamp of the wall clock for storing it.
+    """
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        """Initialize sessions."""
+        self._on_change: Callable[[], None] = on_change
+        self._expires: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def __getitem__(self, session: str) -> float:
+        """Return expiry of session as timestamp."""
+        return time.time() + (self._expires[session] - time.monotonic_ns()) / 1e9
+
+    def __setitem__(self, session: str, valid: float) -> None:
+        """Set expiry of session from a timestamp."""
+        self._set(session, valid)
+        self._on_change()
+
+    def __delitem__(self, session: str) -> None:
+        """Remove session, its heap entries are dropped on cleanup."""
+        del self._expires[session]
+        self._on_change()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over sessions."""
+        return iter(self._expires)
+
+    def __len__(self) -> int:
+        """Return number of sessions."""
+        return len(self._expires)
+
+    def _set(self, session: str, valid: float) -> None:
+        """Set expiry of session from a timestamp."""
+        expires = time.monotonic_ns() + int((valid - time.time()) * 1e9)
+        self._expires[session] = expires
+        heapq.heappush(self._heap, (expires, session))
+
+    def create(self) -> str:
+        """Create new session."""
+        session = secrets.token_hex(64)
+        expires = time.monotonic_ns() + SESSION_TIMEOUT
+
+        self._expires[session] = expires
+        heapq.heappush(self._heap, (expires, session))
+        self._on_change()
+        return session
+
+    def validate(self, session: str) -> bool:
+        """Return True if session valid and make it longer valid."""
+        now = time.monotonic_ns()
+        expires = self._expires.get(session)
+        if expires is None or expires < now:
+            return False
+
+        self._expires[session] = now + SESSION_TIMEOUT
+        self._on_change()
+        return True
+
+    def expire(self) -> int:
+        """Remove expired sessions, return how many."""
+        now = time.monotonic_ns()
+        removed = 0
+
+        while self._heap and self._heap[0][0] < now:
+            _, session = heapq.heappop(self._heap)
+            if (expires := self._expires.get(session)) is None:
+                continue
+            if expires < now:
+                del self._expires[session]
+                removed += 1
+            else:
+                # Extended since pushed
+                heapq.heappush(self._heap, (expires, session))
+
+        if removed:
+            self._on_change()
+        return removed
+
+    def load(self, sessions: dict[str, float]) -> None:
+        """Load sessions stored with timestamps."""
+        for session, valid in sessions.items():
+            # check if timestamp valid, to avoid crash on malformed timestamp
+            try:
+                self._set(session, valid)
+            except (OverflowError, ValueError):
+                _LOGGER.warning("Session timestamp %f is invalid!", valid)
+
+    def dump(self) -> dict[str, float]:
+        """Return sessions with timestamps to store."""
+        now = time.monotonic_ns()
+        wall = time.time()
+        return {
+            session: wall + (expires - now) / 1e9
+            for session, expires in self._expires.items()
+            if expires >= now
+        }
+
+
+class IngressPool:
+    """Keep-alive connections to the ingress port of one add-on.
+
+    Idle connections are closed by the connector after the keep-alive timeout.
+    A pool belongs to an add-on address, it is replaced once the address of
+    the add-on changes.
+    """
+
+    def __init__(self, slug: str, host: str) -> None:
+        """Initialize pool."""
+        self.slug: str = slug
+        self.host: str = host
+        self.requests: int = 0
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.queued: int = 0
+        self.connect_time: float = 0
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_queued_start.append(self._on_queued)
+        trace.on_connection_create_start.append(self._on_create_start)
+        trace.on_connection_create_end.append(self._on_create_end)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+
+        self.session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=INGRESS_CONNECTIONS_PER_ADDON,
+                keepalive_timeout=INGRESS_KEEPALIVE,
+            ),
+            # Cookies belong to the browser session of the user
+            cookie_jar=aiohttp.DummyCookieJar(),
+            timeout=aiohttp.ClientTimeout(total=None),
+            # Bodies are passed on as they are
+            auto_decompress=False,
+            read_bufsize=INGRESS_READ_BUFSIZE,
+            trace_configs=[trace],
+        )
+
+    async def close(self) -> None:
+        """Close all connections."""
+        await self.session.close()
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count request."""
+        self.requests += 1
+
+    async def _on_queued(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count request waiting for a free connection."""
+        self.queued += 1
+
+    async def _on_create_start(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Start timing new connection."""
+        context.connect_start = time.monotonic()
+
+    async def _on_create_end(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count new connection."""
+        self.connections_created += 1
+        self.connect_time += time.monotonic() - context.connect_start
+
+    async def _on_reuse(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params
+    ) -> None:
+        """Count reused keep-alive connection."""
+        self.connections_reused += 1
+
 
 class Ingress(FileConfiguration, CoreSysAttributes):
     """Fetch last versions from version.json."""
@@ -23,6 +216,10 @@ class Ingress(FileConfiguration, CoreSysAttributes):
         super().__init__(FILE_HASSIO_INGRESS, SCHEMA_INGRESS_CONFIG)
         self.coresys: CoreSys = coresys
         self.tokens: dict[str, str] = {}
+        self.pools: dict[str, IngressPool] = {}
+        self._save_handle: asyncio.TimerHandle | None = None
+        self._sessions: IngressSessions = IngressSessions(self._schedule_save)
+        self._sessions.load(self._data[ATTR_SESSION])
 
     def get(self, token: str) -> Addon | None:
         """Return addon they have this ingress token."""
@@ -31,9 +228,9 @@ class Ingress(FileConfiguration, CoreSysAttributes):
         return self.sys_addons.get(self.tokens[token], local_only=True)
 
     @property
-    def sessions(self) -> dict[str, float]:
+    def sessions(self) -> IngressSessions:
         """Return sessions."""
-        return self._data[ATTR_SESSION]
+        return self._sessions
 
     @property
     def ports(self) -> dict[str, int]:
@@ -53,41 +250,60 @@ class Ingress(FileConfiguration, CoreSysAttributes):
     async def load(self) -> None:
         """Update internal data."""
         self._update_token_list()
-        self._cleanup_sessions()
+        self.sessions.expire()
 
         _LOGGER.info("Loaded %d ingress sessions", len(self.sessions))
 
     async def reload(self) -> None:
         """Reload/Validate sessions."""
-        self._cleanup_sessions()
+        self.sessions.expire()
         self._update_token_list()
 
+        # Drop pools of add-ons without ingress
+        for slug in set(self.pools) - set(self.tokens.values()):
+            await self.pools.pop(slug).close()
+
     async def unload(self) -> None:
         """Shutdown sessions."""
+        if self._save_handle:
+            self._save_handle.cancel()
+            self._save_handle = None
         self.save_data()
 
-    def _cleanup_sessions(self) -> None:
-        """Remove not used sessions."""
-        now = utcnow()
-
-        sessions = {}
-        for session, valid in self.sessions.items():
-            # check if timestamp valid, to avoid crash on malformed timestamp
-            try:
-                valid_dt = utc_from_timestamp(valid)
-            except OverflowError:
-                _LOGGER.warning("Session timestamp %f is invalid!", valid)
-                continue
-
-            if valid_dt < now:
-                continue
-
-            # Is valid
-            sessions[session] = valid
-
-        # Write back
-        self.sessions.clear()
-        self.sessions.update(sessions)
+        for pool in self.pools.values():
+            await pool.close()
+        self.pools.clear()
+
+    async def get_pool(self, addon: Addon) -> IngressPool:
+        """Return connection pool to the ingress port of an add-on."""
+        stale = self.pools.get(addon.slug)
+        if stale and stale.host == str(addon.ip_address):
+            return stale
+
+        # Replace before closing, requests meanwhile have to get the new pool
+        pool = self.pools[addon.slug] = IngressPool(addon.slug, str(addon.ip_address))
+
+        # Add-on got a new address, connections are stale
+        if stale:
+            await stale.close()
+        return pool
+
+    def save_data(self) -> None:
+        """Store sessions and dynamic ports."""
+        self._data[ATTR_SESSION] = self.sessions.dump()
+        super().save_data()
+
+    def _schedule_save(self) -> None:
+        """Store changed sessions with the next batch."""
+        if self._save_handle is None:
+            self._save_handle = self.sys_loop.call_later(
+                SESSION_SAVE_DELAY, self._save_sessions
+            )
+
+    def _save_sessions(self) -> None:
+        """Store batch of changed sessions."""
+        self._save_handle = None
+        self.save_data()
 
     def _update_token_list(self) -> None:
         """Regenerate token <-> Add-on map."""
@@ -99,34 +315,13 @@ class Ingress(FileConfiguration, CoreSysAttributes):
 
     def create_session(self) -> str:
         """Create new session."""
-        session = secrets.token_hex(64)
-        valid = utcnow() + timedelta(minutes=15)
-
-        self.sessions[session] = valid.timestamp()
-        return session
+        return self.sessions.create()
 
     def validate_session(self, session: str) -> bool:
         """Return True if session valid and make it longer valid."""
-        if session not in self.sessions:
-            _LOGGER.debug("Session %s is not known", session)
-            return False
-
-        # check if timestamp valid, to avoid crash on malformed timestamp
-        try:
-            valid_until = utc_from_timestamp(self.sessions[session])
-        except OverflowError:
-            self.sessions[session] = utcnow() + timedelta(minutes=15)
-            return True
-
-        # Is still valid?
-        if valid_until < utcnow():
-            _LOGGER.debug("Session is no longer valid (%f/%f)", valid_until, utcnow())
+        if not self.sessions.validate(session):
+            _LOGGER.debug("Session %s is not known or no longer valid", session)
             return False
-
-        # Update time
-        valid_until = valid_until + timedelta(minutes=15)
-        self.sessions[session] = valid_until.timestamp()
-
         return True
 
     def get_dynamic_port(self, addon_slug: str) -> int:
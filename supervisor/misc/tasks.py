@@ -25,6 +25,7 @@ RUN_RELOAD_BACKUPS = 72000
 RUN_RELOAD_HOST = 7600
 RUN_RELOAD_UPDATER = 7200
 RUN_RELOAD_INGRESS = 930
+RUN_RELOAD_CONTAINERS = 300
 
 RUN_WATCHDOG_HOMEASSISTANT_API = 120
 
@@ -61,6 +62,9 @@ class Tasks(CoreSysAttributes):
         self.sys_scheduler.register_task(self.sys_backups.reload, RUN_RELOAD_BACKUPS)
         self.sys_scheduler.register_task(self.sys_host.reload, RUN_RELOAD_HOST)
         self.sys_scheduler.register_task(self.sys_ingress.reload, RUN_RELOAD_INGRESS)
+        self.sys_scheduler.register_task(
+            self.sys_docker.monitor.reload, RUN_RELOAD_CONTAINERS
+        )
 
         # Watchdog
         self.sys_scheduler.register_task(
@@ -30,7 +30,7 @@ class FixupSystemClearFullBackup(FixupBase):
         for backup in sorted(full_backups, key=lambda x: x.date)[
             : -1 * MINIMUM_FULL_BACKUPS
         ]:
-            self.sys_backups.remove(backup)
+            await self.sys_backups.remove(backup)
 
     @property
     def suggestion(self) -> SuggestionType:
@@ -268,3 +268,5 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         # remove
         for slug in del_addons:
             self.sys_addons.store.pop(slug)
+
+        self.sys_addons.bump_generation()
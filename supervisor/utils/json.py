@@ -9,9 +9,26 @@ from atomicwrites import atomic_write
 
 from ..exceptions import JsonFileError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Supervisor special objects."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, Path):
+        return obj.as_posix()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Supervisor objects."""
 
@@ -20,21 +37,48 @@ class JSONEncoder(json.JSONEncoder):
 
         Hand other objects to the original method.
         """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if isinstance(o, Path):
-            return o.as_posix()
+        if isinstance(o, (datetime, set, Path)):
+            return json_encoder_default(o)
 
         return super().default(o)
 
 
+if orjson:
+
+    def json_bytes(data: Any, indent: bool = False) -> bytes:
+        """Return compact or indented JSON, encoded natively by orjson."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=json_encoder_default, option=option)
+
+    json_loads = orjson.loads
+
+else:
+
+    def json_bytes(data: Any, indent: bool = False) -> bytes:
+        """Return compact or indented JSON."""
+        return json.dumps(
+            data,
+            cls=JSONEncoder,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+        ).encode("utf-8")
+
+    json_loads = json.loads
+
+
+def json_dumps(data: Any, indent: bool = False) -> str:
+    """Return compact or indented JSON as string."""
+    return json_bytes(data, indent).decode("utf-8")
+
+
 def write_json_file(jsonfile: Path, data: Any) -> None:
     """Write a JSON file."""
     try:
-        with atomic_write(jsonfile, overwrite=True) as fp:
-            fp.write(json.dumps(data, indent=2, cls=JSONEncoder))
+        with atomic_write(jsonfile, mode="wb", overwrite=True) as fp:
+            fp.write(json_bytes(data, indent=True))
         jsonfile.chmod(0o600)
     except (OSError, ValueError, TypeError) as err:
         raise JsonFileError(
@@ -45,7 +89,7 @@ def write_json_file(jsonfile: Path, data: Any) -> None:
 def read_json_file(jsonfile: Path) -> Any:
     """Read a JSON file and return a dict."""
     try:
-        return json.loads(jsonfile.read_text())
+        return json_loads(jsonfile.read_bytes())
     except (OSError, ValueError, TypeError, UnicodeDecodeError) as err:
         raise JsonFileError(
             f"Can't read json from {jsonfile!s}: {err!s}", _LOGGER.error
@@ -7,6 +7,7 @@ import voluptuous as vol
 
 from .const import (
     ATTR_ADDONS_CUSTOM_LIST,
+    ATTR_API_COMPRESSION,
     ATTR_AUDIO,
     ATTR_AUTO_UPDATE,
     ATTR_CHANNEL,
@@ -35,6 +36,7 @@ from .const import (
     ATTR_USERNAME,
     ATTR_VERSION,
     ATTR_WAIT_BOOT,
+    ATTR_WEBSOCKET_MULTIPLEX,
     SUPERVISOR_VERSION,
     LogLevel,
     UpdateChannel,
@@ -155,6 +157,8 @@ SCHEMA_SUPERVISOR_CONFIG = vol.Schema(
         vol.Optional(ATTR_DEBUG, default=False): vol.Boolean(),
         vol.Optional(ATTR_DEBUG_BLOCK, default=False): vol.Boolean(),
         vol.Optional(ATTR_DIAGNOSTICS, default=None): vol.Maybe(vol.Boolean()),
+        vol.Optional(ATTR_WEBSOCKET_MULTIPLEX, default=False): vol.Boolean(),
+        vol.Optional(ATTR_API_COMPRESSION, default=False): vol.Boolean(),
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -33,11 +33,6 @@ def _fire_test_event(coresys: CoreSys, name: str, state: ContainerState):
     )
 
 
-async def mock_current_state(state: ContainerState) -> ContainerState:
-    """Mock for current state method."""
-    return state
-
-
 async def mock_stop() -> None:
     """Mock for stop method."""
 
@@ -136,7 +131,7 @@ async def test_addon_watchdog(coresys: CoreSys, install_addon_ssh: Addon) -> Non
         Addon, "start"
     ) as start, patch.object(DockerAddon, "current_state") as current_state:
         # Restart if it becomes unhealthy
-        current_state.return_value = mock_current_state(ContainerState.UNHEALTHY)
+        current_state.return_value = ContainerState.UNHEALTHY
         _fire_test_event(coresys, f"addon_{TEST_ADDON_SLUG}", ContainerState.UNHEALTHY)
         await asyncio.sleep(0)
         restart.assert_called_once()
@@ -145,7 +140,7 @@ async def test_addon_watchdog(coresys: CoreSys, install_addon_ssh: Addon) -> Non
         restart.reset_mock()
 
         # Rebuild if it failed
-        current_state.return_value = mock_current_state(ContainerState.FAILED)
+        current_state.return_value = ContainerState.FAILED
         with patch.object(DockerAddon, "stop", return_value=mock_stop()) as stop:
             _fire_test_event(coresys, f"addon_{TEST_ADDON_SLUG}", ContainerState.FAILED)
             await asyncio.sleep(0)
@@ -156,14 +151,14 @@ async def test_addon_watchdog(coresys: CoreSys, install_addon_ssh: Addon) -> Non
         start.reset_mock()
 
         # Do not process event if container state has changed since fired
-        current_state.return_value = mock_current_state(ContainerState.HEALTHY)
+        current_state.return_value = ContainerState.HEALTHY
         _fire_test_event(coresys, f"addon_{TEST_ADDON_SLUG}", ContainerState.FAILED)
         await asyncio.sleep(0)
         restart.assert_not_called()
         start.assert_not_called()
 
         # Other addons ignored
-        current_state.return_value = mock_current_state(ContainerState.UNHEALTHY)
+        current_state.return_value = ContainerState.UNHEALTHY
         _fire_test_event(coresys, "addon_local_non_installed", ContainerState.UNHEALTHY)
         await asyncio.sleep(0)
         restart.assert_not_called()
@@ -180,7 +175,7 @@ async def test_watchdog_on_stop(coresys: CoreSys, install_addon_ssh: Addon) -> N
     with patch.object(Addon, "restart") as restart, patch.object(
         DockerAddon,
         "current_state",
-        return_value=mock_current_state(ContainerState.STOPPED),
+        return_value=ContainerState.STOPPED,
     ), patch.object(DockerAddon, "stop", return_value=mock_stop()):
         # Do not restart when addon stopped by user
         _fire_test_event(coresys, f"addon_{TEST_ADDON_SLUG}", ContainerState.RUNNING)
@@ -242,7 +237,7 @@ async def test_watchdog_during_attach(
     ), patch.object(DockerAddon, "attach"), patch.object(
         DockerAddon,
         "current_state",
-        return_value=mock_current_state(ContainerState.STOPPED),
+        return_value=ContainerState.STOPPED,
     ):
         coresys.config.last_boot = coresys.hardware.helper.last_boot + boot_timedelta
         addon = Addon(coresys, store.slug)
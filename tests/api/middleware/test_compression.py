@@ -0,0 +1,101 @@
+"""Test API compression layer."""
+from unittest.mock import AsyncMock
+
+from aiohttp import web
+import pytest
+
+from supervisor.api import RestAPI
+from supervisor.const import REQUEST_FROM
+from supervisor.coresys import CoreSys
+from supervisor.store.addon import AddonStore
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+async def api_compression(aiohttp_client, coresys: CoreSys):
+    """Fixture for RestAPI client with compression."""
+
+    @web.middleware
+    async def _security_middleware(request: web.Request, handler: web.RequestHandler):
+        """Make request are from Core."""
+        request[REQUEST_FROM] = coresys.homeassistant
+        return await handler(request)
+
+    api = RestAPI(coresys)
+    api.webapp = web.Application(
+        middlewares=[api.compression.compression, _security_middleware]
+    )
+    api.start = AsyncMock()
+    await api.load()
+
+    coresys.config.api_compression = True
+    client = await aiohttp_client(api.webapp)
+    client.compression = api.compression
+    yield client
+
+
+async def test_api_compression_disabled(
+    api_compression, coresys: CoreSys, store_addon: AddonStore
+):
+    """Test responses are not compressed unless enabled."""
+    coresys.config.api_compression = False
+
+    resp = await api_compression.get("/store", headers={"Accept-Encoding": "gzip"})
+    assert resp.status == 200
+    assert "Content-Encoding" not in resp.headers
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,coding",
+    [("gzip", "gzip"), ("gzip, deflate, br", "br"), ("gzip, br;q=0", "gzip")],
+)
+async def test_api_compression(
+    api_compression, store_addon: AddonStore, accept_encoding: str, coding: str
+):
+    """Test JSON responses are compressed with the best accepted coding."""
+    resp = await api_compression.get(
+        "/store", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == coding
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["ETag"].startswith("W/")
+    result = await resp.json()
+    assert result["data"]["addons"][-1]["slug"] == store_addon.slug
+
+    # Tagged bodies are compressed once
+    resp = await api_compression.get(
+        "/store", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.headers["Content-Encoding"] == coding
+    assert api_compression.compression.cache.hits == 1
+
+    resp = await api_compression.get(
+        "/store?unused=1", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.headers["Content-Encoding"] == coding
+    assert api_compression.compression.cache.hits == 2
+    assert len(api_compression.compression.cache) == 1
+
+    resp = await api_compression.get(
+        "/store",
+        headers={
+            "Accept-Encoding": accept_encoding,
+            "If-None-Match": resp.headers["ETag"],
+        },
+    )
+    assert resp.status == 304
+
+
+async def test_api_compression_skipped(api_compression):
+    """Test small or unaccepted responses are sent as they are."""
+    resp = await api_compression.get(
+        "/supervisor/ping", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == 200
+    assert "Content-Encoding" not in resp.headers
+
+    resp = await api_compression.get("/store", headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    assert "Content-Encoding" not in resp.headers
@@ -1,10 +1,13 @@
 """Test API security layer."""
+from unittest.mock import PropertyMock, patch
 
 from aiohttp import web
 import pytest
 
+from supervisor.addons.addon import Addon
 from supervisor.api import RestAPI
-from supervisor.const import CoreState
+from supervisor.api.middleware.security import role_access, route_decision
+from supervisor.const import ATTR_ACCESS_TOKEN, CoreState
 from supervisor.coresys import CoreSys
 
 # pylint: disable=redefined-outer-name
@@ -59,3 +62,39 @@ async def test_api_security_system_startup(api_system, coresys: CoreSys):
 
     resp = await api_system.get("/supervisor/ping")
     assert resp.status == 200
+
+
+async def test_api_security_addon_token(
+    aiohttp_client, run_dir, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test add-on found by token and role access decided by path."""
+    api = RestAPI(coresys)
+    api.webapp = web.Application()
+    await api.load()
+    api.webapp.middlewares.append(api.security.token_validation)
+    client = await aiohttp_client(api.webapp)
+
+    install_addon_ssh.persist[ATTR_ACCESS_TOKEN] = "abc123"
+    assert coresys.addons.from_token("abc123") is None
+    coresys.addons.update_tokens()
+    assert coresys.addons.from_token("abc123") is install_addon_ssh
+
+    headers = {"Authorization": "Bearer abc123"}
+    with patch.object(
+        type(install_addon_ssh),
+        "access_hassio_api",
+        new=PropertyMock(return_value=True),
+    ), patch.object(
+        type(install_addon_ssh), "hassio_role", new=PropertyMock(return_value="default")
+    ):
+        resp = await client.get("/info", headers=headers)
+        assert resp.status == 200
+        resp = await client.post("/backups/new/full", headers=headers)
+        assert resp.status == 403
+        resp = await client.get("/info", headers={"Authorization": "Bearer x"})
+        assert resp.status == 403
+
+    assert route_decision("/supervisor/info").observer
+    assert route_decision("/core/api/hassio/test").blacklisted
+    assert role_access("backup", "/backups/new/full")
+    assert not role_access("default", "/backups/new/full")
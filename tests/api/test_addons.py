@@ -1,10 +1,17 @@
 """Test addons api."""
 
+from typing import Any
+from unittest.mock import patch
+
 from supervisor.addons.addon import Addon
+from supervisor.api.utils import LOG_LINE_MAX
 from supervisor.const import AddonState
 from supervisor.coresys import CoreSys
+from supervisor.docker.stats import DockerStats
+from supervisor.exceptions import DockerNotFound
 from supervisor.store.repository import Repository
 
+from ..common import load_json_fixture
 from ..const import TEST_ADDON_SLUG
 
 
@@ -42,3 +49,162 @@ async def test_addons_info_not_installed(
         "password": "",
         "server": {"tcp_forwarding": False},
     }
+
+
+async def test_api_addon_stats(api_client, coresys: CoreSys, install_addon_ssh: Addon):
+    """Test stats of an add-on with history."""
+    stats = DockerStats(load_json_fixture("container_stats.json"))
+    with patch.object(
+        type(install_addon_ssh.instance), "is_running", return_value=True
+    ), patch.object(
+        coresys.docker.collector, "stats", return_value=stats
+    ), patch.object(
+        coresys.docker.collector, "history", return_value=[stats, stats]
+    ) as history:
+        resp = await api_client.get(f"/addons/{TEST_ADDON_SLUG}/stats")
+        result = await resp.json()
+        assert result["data"]["cpu_percent"] == 90.0
+        assert "history" not in result["data"]
+
+        resp = await api_client.get(f"/addons/{TEST_ADDON_SLUG}/stats?history=30")
+        result = await resp.json()
+        assert len(result["data"]["history"]) == 2
+        assert result["data"]["history"][0]["memory_usage"] == stats.memory_usage
+        history.assert_called_once_with(install_addon_ssh.instance.name, 30)
+
+        resp = await api_client.get(f"/addons/{TEST_ADDON_SLUG}/stats?history=3600")
+        assert resp.status == 400
+
+
+async def test_api_addon_logs(api_client, coresys: CoreSys, install_addon_ssh: Addon):
+    """Test logs of an add-on are streamed with options."""
+    params: dict[str, Any] = {}
+
+    async def _logs(name: str, tty: bool = False, **kwargs):
+        params.update(kwargs)
+        yield b"first line\nsecond "
+        yield b"line\nthird line"
+
+    with patch.object(
+        coresys.docker.engine,
+        "container_inspect",
+        return_value={"Config": {"Tty": False}},
+    ), patch.object(coresys.docker.engine, "container_logs", new=_logs):
+        resp = await api_client.get(f"/addons/{TEST_ADDON_SLUG}/logs")
+        assert await resp.read() == b"first line\nsecond line\nthird line"
+        assert params == {"tail": "100"}
+
+        params.clear()
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs",
+            params={
+                "follow": "true",
+                "tail": "all",
+                "since": "2022-10-04T08:32:15.123456789Z",
+                "filter": "ond",
+            },
+        )
+        assert await resp.read() == b"second line\n"
+        assert params == {
+            "tail": "all",
+            "follow": "true",
+            "since": "1664872335.123456000",
+        }
+
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs", params={"since": "yesterday"}
+        )
+        assert b"since" in await resp.read()
+
+
+async def test_api_addon_logs_filter_long_line(
+    api_client, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test overlong lines are cut once and keep their end of line."""
+    start = b"long line " + b"x" * LOG_LINE_MAX
+
+    async def _logs(name: str, tty: bool = False, **kwargs):
+        yield start
+        yield b"x" * 10 + b" line end\nshort line\nother\n"
+
+    with patch.object(
+        coresys.docker.engine,
+        "container_inspect",
+        return_value={"Config": {"Tty": False}},
+    ), patch.object(coresys.docker.engine, "container_logs", new=_logs):
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs", params={"filter": "line"}
+        )
+        assert await resp.read() == (start[:LOG_LINE_MAX] + b"\n" + b"short line\n")
+
+
+async def test_api_addon_logs_compressed(
+    api_client, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test logs are compressed if the client accepts it."""
+    coresys.config.api_compression = True
+
+    async def _logs(name: str, tty: bool = False, **kwargs):
+        for index in range(100):
+            yield f"line {index}\n".encode()
+
+    with patch.object(
+        coresys.docker.engine,
+        "container_inspect",
+        return_value={"Config": {"Tty": False}},
+    ), patch.object(coresys.docker.engine, "container_logs", new=_logs):
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs", headers={"Accept-Encoding": "gzip"}
+        )
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        body = await resp.read()
+        assert body.startswith(b"line 0\n") and body.endswith(b"line 99\n")
+
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs",
+            headers={"Accept-Encoding": "gzip;q=0"},
+        )
+        assert "Content-Encoding" not in resp.headers
+
+
+async def test_api_addon_logs_disconnect(
+    api_client, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test the request to Docker ends once the client is gone."""
+    closed = []
+
+    async def _logs(name: str, tty: bool = False, **kwargs):
+        try:
+            while True:
+                yield b"line\n"
+        finally:
+            closed.append(name)
+
+    with patch.object(
+        coresys.docker.engine,
+        "container_inspect",
+        return_value={"Config": {"Tty": False}},
+    ), patch.object(coresys.docker.engine, "container_logs", new=_logs), patch(
+        "supervisor.api.utils.web.StreamResponse.write",
+        side_effect=ConnectionResetError,
+    ):
+        resp = await api_client.get(
+            f"/addons/{TEST_ADDON_SLUG}/logs",
+            params={"follow": "true", "filter": "line"},
+        )
+        await resp.read()
+        assert closed == ["addon_local_ssh"]
+
+
+async def test_api_addon_logs_not_found(
+    api_client, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test logs of a missing container."""
+    with patch.object(
+        coresys.docker.engine,
+        "container_inspect",
+        side_effect=DockerNotFound("addon_local_ssh not found"),
+    ):
+        resp = await api_client.get(f"/addons/{TEST_ADDON_SLUG}/logs")
+        assert b"not found" in await resp.read()
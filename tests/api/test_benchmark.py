@@ -0,0 +1,64 @@
+"""Benchmark encoding of the largest API responses.
+
+Skipped by default, run with:
+pytest tests/api/test_benchmark.py --benchmark [--benchmark-scale=0.5]
+"""
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp.test_utils import TestClient
+import pytest
+
+from supervisor.addons.addon import Addon
+from supervisor.api import utils as api_utils
+from supervisor.store.addon import AddonStore
+from supervisor.utils.json import JSONEncoder, json_bytes
+
+pytestmark = pytest.mark.benchmark
+
+
+async def _response_data(api_client: TestClient, path: str) -> dict[str, Any]:
+    """Return data of an API response as the handler returned it."""
+    with patch.object(
+        api_utils, "api_return_ok", wraps=api_utils.api_return_ok
+    ) as return_ok:
+        resp = await api_client.get(path)
+        assert resp.status == 200
+
+    return {"result": "ok", "data": return_ok.call_args.kwargs["data"]}
+
+
+@pytest.mark.parametrize("path", ["/store", "/addons/local_ssh/info", "/network/info"])
+async def test_benchmark_json_encoding(
+    api_client: TestClient,
+    install_addon_ssh: Addon,
+    store_addon: AddonStore,
+    request: pytest.FixtureRequest,
+    capsys,
+    path: str,
+):
+    """Benchmark the API encoder against stdlib json with JSONEncoder."""
+    install_addon_ssh.protected = True
+    install_addon_ssh.ingress_panel = False
+    install_addon_ssh.watchdog = False
+    data = await _response_data(api_client, path)
+    count = int(2_000 * request.config.getoption("--benchmark-scale"))
+
+    start = time.perf_counter()
+    for _ in range(count):
+        json.dumps(data, cls=JSONEncoder).encode("utf-8")
+    stdlib = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(count):
+        json_bytes(data)
+    api = time.perf_counter() - start
+
+    assert json.loads(json_bytes(data)) == json.loads(json.dumps(data, cls=JSONEncoder))
+    with capsys.disabled():
+        print(
+            f"\n{path:30} {len(json_bytes(data)):8} bytes "
+            f"stdlib {count / stdlib:8.0f}/s api {count / api:8.0f}/s"
+        )
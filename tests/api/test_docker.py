@@ -1,6 +1,13 @@
 """Test Docker API."""
+from unittest.mock import patch
+
 import pytest
 
+from supervisor.coresys import CoreSys
+from supervisor.docker.stats import DockerStats
+
+from tests.common import load_json_fixture
+
 
 @pytest.mark.asyncio
 async def test_api_docker_info(api_client):
@@ -11,3 +18,31 @@ async def test_api_docker_info(api_client):
     assert result["data"]["logging"] == "journald"
     assert result["data"]["storage"] == "overlay2"
     assert result["data"]["version"] == "1.0.0"
+
+
+async def test_api_docker_stats(api_client, coresys: CoreSys):
+    """Test stats of all containers in columns."""
+    stats = load_json_fixture("container_stats.json")
+    busy = DockerStats(stats)
+    stats["cpu_stats"]["cpu_usage"]["total_usage"] = 110
+    idle = DockerStats(stats)
+
+    with patch.object(
+        coresys.docker.collector,
+        "sweep",
+        return_value={"addon_local_ssh": idle, "homeassistant": busy},
+    ):
+        resp = await api_client.get("/docker/stats")
+        result = await resp.json()
+        assert result["data"]["containers"] == ["homeassistant", "addon_local_ssh"]
+        assert result["data"]["cpu_percent"] == [90.0, 10.0]
+        assert result["data"]["memory_usage"] == [59700000, 59700000]
+        assert result["data"]["total"]["memory_usage"] == 119400000
+        assert "memory_limit" not in result["data"]["total"]
+
+        resp = await api_client.get("/docker/stats?sort=memory_usage")
+        result = await resp.json()
+        assert result["data"]["containers"] == ["addon_local_ssh", "homeassistant"]
+
+        resp = await api_client.get("/docker/stats?sort=name")
+        assert resp.status == 400
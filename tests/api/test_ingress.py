@@ -1,6 +1,8 @@
 """Test ingress API."""
-from unittest.mock import patch
+from ipaddress import IPv4Address
+from unittest.mock import MagicMock, patch
 
+from aiohttp import hdrs, web
 import pytest
 
 # pylint: disable=redefined-outer-name
@@ -38,3 +40,62 @@ async def test_validate_session(api_client, coresys):
         assert await resp.json() == {"result": "ok", "data": {}}
 
         assert coresys.ingress.sessions[session] > valid_time
+
+
+@pytest.fixture
+async def ingress_addon(coresys, aiohttp_server):
+    """Return add-on with ingress served by a test server."""
+    received = {}
+
+    async def upload(request: web.Request):
+        received["headers"] = request.headers
+        received["size"] = len(await request.read())
+        return web.Response(text="ok")
+
+    async def download(request: web.Request):
+        response = web.StreamResponse()
+        response.content_length = 5 * 1024 * 1024
+        await response.prepare(request)
+        for _ in range(5):
+            await response.write(b"x" * 1024 * 1024)
+        return response
+
+    app = web.Application(client_max_size=16 * 1024 * 1024)
+    app.router.add_post("/upload", upload)
+    app.router.add_get("/download", download)
+    server = await aiohttp_server(app)
+
+    addon = MagicMock(
+        slug="test",
+        ip_address=IPv4Address("127.0.0.1"),
+        ingress_port=server.port,
+        ingress_stream=False,
+    )
+    addon.received = received
+    with patch.object(type(coresys.ingress), "get", return_value=addon), patch.object(
+        type(coresys.ingress), "validate_session", return_value=True
+    ):
+        yield addon
+
+
+async def test_ingress_stream_bodies(api_client, coresys, ingress_addon):
+    """Test request and response bodies are streamed with their size."""
+    with patch(
+        "aiohttp.web_request.BaseRequest.__getitem__",
+        return_value=coresys.homeassistant,
+    ):
+        resp = await api_client.post(
+            "/ingress/token/upload", data=b"x" * 5 * 1024 * 1024
+        )
+        assert resp.status == 200
+        assert await resp.text() == "ok"
+
+        headers = ingress_addon.received["headers"]
+        assert headers[hdrs.CONTENT_LENGTH] == str(5 * 1024 * 1024)
+        assert hdrs.TRANSFER_ENCODING not in headers
+        assert ingress_addon.received["size"] == 5 * 1024 * 1024
+
+        resp = await api_client.get("/ingress/token/download")
+        assert resp.status == 200
+        assert resp.headers[hdrs.CONTENT_LENGTH] == str(5 * 1024 * 1024)
+        assert len(await resp.read()) == 5 * 1024 * 1024
@@ -0,0 +1,287 @@
+"""Test Home Assistant websocket proxy."""
+# pylint: disable=redefined-outer-name
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from aiohttp import WSMsgType, web
+import pytest
+
+from supervisor.api.multiplexer import WebSocketMultiplexer
+from supervisor.api.proxy import APIProxy
+from supervisor.coresys import CoreSys
+
+EVENT = '{"id": 1, "type": "event", "event": {"event_type": "state_changed"}}'
+
+
+@pytest.fixture
+async def proxy_client(api_client, coresys: CoreSys, aiohttp_client):
+    """Return websocket connected through the proxy to a fake Core."""
+    core_closed = asyncio.Event()
+
+    async def core_websocket(request: web.Request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        async for msg in websocket:
+            if msg.type == WSMsgType.TEXT and msg.data.startswith("events "):
+                for _ in range(int(msg.data.split()[1])):
+                    await websocket.send_str(EVENT)
+            elif msg.type == WSMsgType.TEXT:
+                await websocket.send_str(msg.data)
+            elif msg.type == WSMsgType.BINARY:
+                await websocket.send_bytes(msg.data[::-1])
+        core_closed.set()
+        return websocket
+
+    app = web.Application()
+    app.router.add_get("/api/websocket", core_websocket)
+    core = await aiohttp_client(app)
+
+    async def websocket_client(_):
+        return await core.ws_connect("/api/websocket")
+
+    addon = MagicMock(slug="test", access_homeassistant_api=True)
+    with patch.object(
+        type(coresys.homeassistant.api), "check_api_state", return_value=True
+    ), patch.object(
+        type(coresys.homeassistant),
+        "version",
+        new=PropertyMock(return_value="2022.7.0"),
+    ), patch.object(
+        type(coresys.addons), "from_token", return_value=addon
+    ), patch.object(
+        APIProxy, "_websocket_client", new=websocket_client
+    ):
+        websocket = await api_client.ws_connect("/core/websocket")
+        assert (await websocket.receive_json())["type"] == "auth_required"
+        await websocket.send_json({"type": "auth", "access_token": "abc"})
+        assert (await websocket.receive_json())["type"] == "auth_ok"
+        websocket.core_closed = core_closed
+        yield websocket
+        await websocket.close()
+
+
+async def test_websocket_relay(proxy_client):
+    """Test text and binary frames are relayed in both directions."""
+    await proxy_client.send_str("hello")
+    assert await proxy_client.receive_str() == "hello"
+
+    await proxy_client.send_bytes(b"\x00\x01\x02")
+    assert await proxy_client.receive_bytes() == b"\x02\x01\x00"
+
+
+@pytest.mark.benchmark
+async def test_benchmark_websocket_relay(proxy_client, request, capsys):
+    """Benchmark events relayed from Core to an add-on."""
+    count = int(20_000 * request.config.getoption("--benchmark-scale"))
+
+    start = time.perf_counter()
+    await proxy_client.send_str(f"events {count}")
+    for _ in range(count):
+        assert await proxy_client.receive_str() == EVENT
+    seconds = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(f"\nwebsocket relay {count / seconds:10.0f} messages/s")
+
+
+async def test_websocket_relay_close(proxy_client):
+    """Test close of the add-on closes the Core connection."""
+    await proxy_client.close()
+    await asyncio.wait_for(proxy_client.core_closed.wait(), 5)
+
+
+@pytest.fixture
+async def multiplexed_core(api_client, coresys: CoreSys, aiohttp_client):
+    """Return fake Core and connect function for multiplexed add-on websockets."""
+    core = MagicMock(connections=0, subscribes=[], unsubscribes=[])
+
+    async def core_websocket(request: web.Request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        core.connections += 1
+        subscriptions = set()
+        async for msg in websocket:
+            message = msg.json()
+            if message["type"] == "subscribe_events":
+                core.subscribes.append(message)
+                subscriptions.add(message["id"])
+            elif message["type"] == "unsubscribe_events":
+                core.unsubscribes.append(message)
+                subscriptions.discard(message["subscription"])
+            await websocket.send_json(
+                {"id": message["id"], "type": "result", "success": True}
+            )
+            if message["type"] == "fire_event":
+                for subscription in subscriptions:
+                    await websocket.send_json(
+                        {"id": subscription, "type": "event", "event": "fired"}
+                    )
+        return websocket
+
+    app = web.Application()
+    app.router.add_get("/api/websocket", core_websocket)
+    core_client = await aiohttp_client(app)
+
+    async def websocket_client(_):
+        return await core_client.ws_connect("/api/websocket")
+
+    addons = {
+        token: MagicMock(slug=token, access_homeassistant_api=True)
+        for token in ("addon1", "addon2")
+    }
+
+    async def connect(token: str):
+        websocket = await api_client.ws_connect("/core/websocket")
+        assert (await websocket.receive_json())["type"] == "auth_required"
+        await websocket.send_json({"type": "auth", "access_token": token})
+        assert (await websocket.receive_json())["type"] == "auth_ok"
+        return websocket
+
+    core.connect = connect
+    core.addons = addons
+    coresys.config.websocket_multiplex = True
+    with patch.object(
+        type(coresys.homeassistant.api), "check_api_state", return_value=True
+    ), patch.object(
+        type(coresys.homeassistant),
+        "version",
+        new=PropertyMock(return_value="2022.7.0"),
+    ), patch.object(
+        type(coresys.addons), "from_token", side_effect=addons.get
+    ), patch.object(
+        APIProxy, "_websocket_client", new=websocket_client
+    ):
+        yield core
+
+
+async def test_websocket_multiplex(multiplexed_core):
+    """Test add-ons share connection and subscriptions with their own ids."""
+    addon1 = await multiplexed_core.connect("addon1")
+    addon2 = await multiplexed_core.connect("addon2")
+
+    subscribe = {"type": "subscribe_events", "event_type": "test"}
+    await addon1.send_json({"id": 1, **subscribe})
+    assert (await addon1.receive_json())["id"] == 1
+    await addon2.send_json({"id": 7, **subscribe})
+    assert (await addon2.receive_json()) == {
+        "id": 7,
+        "type": "result",
+        "success": True,
+        "result": None,
+    }
+
+    assert multiplexed_core.connections == 1
+    assert len(multiplexed_core.subscribes) == 1
+
+    # Events are fanned out with the id of every add-on
+    await addon1.send_json({"id": 2, "type": "fire_event", "event_type": "test"})
+    assert await addon1.receive_json() == {"id": 2, "type": "result", "success": True}
+    assert await addon1.receive_json() == {"id": 1, "type": "event", "event": "fired"}
+    assert await addon2.receive_json() == {"id": 7, "type": "event", "event": "fired"}
+
+    # Ping is answered without Core
+    await addon2.send_json({"id": 8, "type": "ping"})
+    assert await addon2.receive_json() == {"id": 8, "type": "pong"}
+
+    # Core subscription is kept until the last add-on unsubscribes
+    await addon1.send_json({"id": 3, "type": "unsubscribe_events", "subscription": 1})
+    assert (await addon1.receive_json())["success"]
+    assert not multiplexed_core.unsubscribes
+
+    await addon2.close()
+    for _ in range(100):
+        if multiplexed_core.unsubscribes:
+            break
+        await asyncio.sleep(0.01)
+    assert multiplexed_core.unsubscribes[0]["subscription"] == (
+        multiplexed_core.subscribes[0]["id"]
+    )
+    await addon1.close()
+
+
+class FakeWebSocket:
+    """Websocket fed from a queue, close is held until released."""
+
+    def __init__(self) -> None:
+        """Initialize fake websocket."""
+        self.closed = False
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.sent: asyncio.Queue = asyncio.Queue()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def send_json(self, data: dict) -> None:
+        """Record sent message."""
+        self.sent.put_nowait(data)
+
+    async def close(self) -> None:
+        """Close websocket once released."""
+        self.closed = True
+        self.messages.put_nowait(None)
+        await self.release.wait()
+
+    def receive(self, data: dict) -> None:
+        """Queue a message for the reader."""
+        self.messages.put_nowait(MagicMock(type=WSMsgType.TEXT, data=json.dumps(data)))
+
+    async def __aiter__(self):
+        """Yield queued messages until closed."""
+        while (msg := await self.messages.get()) is not None:
+            yield msg
+
+
+async def test_websocket_multiplex_upstream_teardown(coresys: CoreSys):
+    """Test teardown of a lost Core connection keeps state of the new one."""
+    clients: list[FakeWebSocket] = []
+
+    async def connect():
+        clients.append(FakeWebSocket())
+        return clients[-1]
+
+    multiplexer = WebSocketMultiplexer(coresys, connect)
+    addon = MagicMock(slug="test", access_homeassistant_api=True)
+
+    server1 = FakeWebSocket()
+    server1.release.clear()
+    handle1 = asyncio.create_task(multiplexer.handle(server1, addon))
+    await asyncio.sleep(0)
+
+    # Core goes away, teardown hangs on closing the old add-on websocket
+    clients[0].messages.put_nowait(None)
+    await asyncio.sleep(0)
+    assert server1.closed
+
+    server2 = FakeWebSocket()
+    handle2 = asyncio.create_task(multiplexer.handle(server2, addon))
+    await asyncio.sleep(0)
+    server2.receive({"id": 5, "type": "subscribe_events", "event_type": "a"})
+    subscribe = await asyncio.wait_for(clients[1].sent.get(), 1)
+    clients[1].receive({"id": subscribe["id"], "type": "result", "success": True})
+    assert (await asyncio.wait_for(server2.sent.get(), 1))["id"] == 5
+
+    server1.release.set()
+    await handle1
+
+    clients[1].receive({"id": subscribe["id"], "type": "event", "event": "fired"})
+    assert await asyncio.wait_for(server2.sent.get(), 1) == {
+        "id": 5,
+        "type": "event",
+        "event": "fired",
+    }
+    assert multiplexer.sessions == 1
+
+    await server2.close()
+    await handle2
+    assert clients[1].closed
+
+
+async def test_websocket_multiplex_access(multiplexed_core):
+    """Test add-on losing API access is disconnected."""
+    addon1 = await multiplexed_core.connect("addon1")
+    multiplexed_core.addons["addon1"].access_homeassistant_api = False
+
+    await addon1.send_json({"id": 1, "type": "ping"})
+    msg = await addon1.receive()
+    assert msg.type == WSMsgType.CLOSE
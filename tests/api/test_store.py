@@ -1,10 +1,14 @@
 """Test Store API."""
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
 
 from aiohttp.test_utils import TestClient
 import pytest
 
+from supervisor.api.store import APIStore
+from supervisor.api.utils import ResponseCache
 from supervisor.coresys import CoreSys
+from supervisor.hardware.data import Device
 from supervisor.store.addon import AddonStore
 from supervisor.store.repository import Repository
 
@@ -95,3 +99,119 @@ async def test_api_store_remove_repository(
     assert response.status == 200
     assert repository.source not in coresys.store.repository_urls
     assert repository.slug not in coresys.store.repositories
+
+
+async def test_api_store_not_modified(
+    api_client: TestClient, coresys: CoreSys, store_addon: AddonStore
+):
+    """Test /store is answered with 304 until add-on data changes."""
+    resp = await api_client.get("/store")
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+    assert resp.headers["Cache-Control"] == "private, no-cache"
+
+    resp = await api_client.get("/store", headers={"If-None-Match": etag})
+    assert resp.status == 304
+
+    coresys.addons.bump_generation()
+    resp = await api_client.get("/store", headers={"If-None-Match": etag})
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+    etag = resp.headers["ETag"]
+
+    # Devices and schema of add-ons follow hardware
+    coresys.hardware.update_device(
+        Device(
+            "ttyACM0",
+            Path("/dev/ttyACM0"),
+            Path("/sys/bus/usb/001"),
+            "tty",
+            None,
+            [],
+            {},
+            [],
+        )
+    )
+    resp = await api_client.get("/store", headers={"If-None-Match": etag})
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+
+
+async def test_api_store_response_cache(
+    api_client: TestClient, coresys: CoreSys, store_addon: AddonStore
+):
+    """Test store add-ons are serialized again only once add-on data changes."""
+    with patch.object(
+        APIStore,
+        "_generate_addon_information",
+        autospec=True,
+        side_effect=APIStore._generate_addon_information,
+    ) as generate:
+        resp = await api_client.get("/store/addons")
+        assert resp.status == 200
+        body = await resp.read()
+        calls = generate.call_count
+        assert calls > 0
+
+        resp = await api_client.get("/store/addons")
+        assert resp.status == 200
+        assert await resp.read() == body
+        assert resp.content_type == "application/json"
+        assert generate.call_count == calls
+
+        # Query parameters the handler doesn't read share the entry
+        resp = await api_client.get("/store/addons?unused=1")
+        assert await resp.read() == body
+        assert generate.call_count == calls
+
+        coresys.addons.bump_generation()
+        resp = await api_client.get("/store/addons")
+        assert resp.status == 200
+        assert generate.call_count == calls * 2
+
+    resp = await api_client.get("/supervisor/cache")
+    result = await resp.json()
+    assert result["data"] == {"entries": 1, "hits": 2, "misses": 2}
+
+
+def test_response_cache_size():
+    """Test least recently used responses are dropped first."""
+    cache = ResponseCache(size=2)
+    cache.set("/a", "1", b"a")
+    cache.set("/b", "1", b"b")
+    assert cache.get("/a", "1") == b"a"
+
+    cache.set("/c", "1", b"c")
+    assert len(cache) == 2
+    assert cache.get("/b", "1") is None
+    assert cache.get("/a", "1") == b"a"
+    assert cache.get("/c", "1") == b"c"
+
+
+async def test_api_store_addon_icon_not_modified(
+    api_client: TestClient, store_addon: AddonStore, tmp_path
+):
+    """Test icon is answered with 304 without reading it again."""
+    icon = tmp_path / "icon.png"
+    icon.write_bytes(b"png")
+
+    with patch.object(
+        type(store_addon), "path_icon", new=PropertyMock(return_value=icon)
+    ):
+        resp = await api_client.get(f"/addons/{store_addon.slug}/icon")
+        assert resp.status == 200
+        assert await resp.read() == b"png"
+        assert "Last-Modified" in resp.headers
+        etag = resp.headers["ETag"]
+
+        with patch.object(Path, "open") as path_open:
+            resp = await api_client.get(
+                f"/addons/{store_addon.slug}/icon", headers={"If-None-Match": etag}
+            )
+            assert resp.status == 304
+            resp = await api_client.get(
+                f"/addons/{store_addon.slug}/icon",
+                headers={"If-Modified-Since": resp.headers["Last-Modified"]},
+            )
+            assert resp.status == 304
+            path_open.assert_not_called()
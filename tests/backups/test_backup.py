@@ -0,0 +1,434 @@
+"""Test Backup class."""
+import os
+from pathlib import Path
+import shutil
+import tarfile
+from threading import Barrier
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+from securetar import SecureTarFile, atomic_contents_add
+
+from supervisor.backups.backup import Backup
+from supervisor.backups.codec import inner_tar_name, is_compressible
+from supervisor.backups.const import BackupCodec, BackupType
+from supervisor.backups.stream import BackupTarFile, InnerSecureTarFile
+from supervisor.const import ATTR_FOLDERS
+from supervisor.coresys import CoreSys
+from supervisor.utils.dt import utcnow
+from supervisor.utils.json import write_json_file
+
+
+@pytest.fixture(name="supervisor_data")
+def fixture_supervisor_data(coresys: CoreSys, tmp_path: Path) -> Path:
+    """Use temporary supervisor data and tmp folders."""
+    data = tmp_path.joinpath("data")
+    share = data.joinpath("share")
+    share.mkdir(parents=True)
+    share.joinpath("small.txt").write_text("small file")
+    share.joinpath("large.bin").write_bytes(bytes(range(256)) * 4096)
+    tmp = tmp_path.joinpath("tmp")
+    tmp.mkdir()
+
+    with patch.object(
+        type(coresys.config), "path_supervisor", new=PropertyMock(return_value=data)
+    ), patch.object(
+        type(coresys.config), "path_tmp", new=PropertyMock(return_value=tmp)
+    ):
+        yield data
+
+
+@pytest.mark.parametrize(
+    "password,compressed", [(None, True), (None, False), ("test", True)]
+)
+async def test_store_restore_folders(
+    coresys: CoreSys,
+    tmp_path: Path,
+    supervisor_data: Path,
+    password: str | None,
+    compressed: bool,
+):
+    """Test folders are streamed into the backup tar and restored."""
+    tar_path = tmp_path.joinpath("test.tar")
+    backup = Backup(coresys, tar_path)
+    backup.new(
+        "test", "Test", utcnow().isoformat(), BackupType.PARTIAL, password, compressed
+    )
+
+    async with backup:
+        await backup.store_folders(["share"])
+
+    with tarfile.open(tar_path, "r:") as tar:
+        members = {member.name: member for member in tar.getmembers()}
+    inner_name = f"./share.tar{'.gz' if compressed else ''}"
+    assert list(members) == [inner_name, "./backup.json"]
+    assert members[inner_name].size > 0
+    assert not list(coresys.config.path_tmp.iterdir())
+
+    share = supervisor_data.joinpath("share")
+    for item in share.iterdir():
+        item.unlink()
+
+    restore = Backup(coresys, tar_path)
+    assert await restore.load()
+    assert restore.folders == ["share"]
+    restore.set_password(password)
+
+    async with restore:
+        await restore.restore_folders(["share"])
+
+    assert share.joinpath("small.txt").read_text() == "small file"
+    assert share.joinpath("large.bin").read_bytes() == bytes(range(256)) * 4096
+
+
+async def test_store_folders_error(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path
+):
+    """Test an incomplete backup is removed."""
+    tar_path = tmp_path.joinpath("test.tar")
+    backup = Backup(coresys, tar_path)
+    backup.new("test", "Test", utcnow().isoformat(), BackupType.PARTIAL)
+
+    with pytest.raises(RuntimeError):
+        async with backup:
+            await backup.store_folders(["share"])
+            raise RuntimeError()
+
+    assert not tar_path.exists()
+
+
+def test_inner_tar_discarded_on_error(tmp_path: Path):
+    """Test a failing inner tarfile leaves no member in the outer tarfile."""
+    tar_path = tmp_path.joinpath("test.tar")
+    with tarfile.open(tar_path, "w:", format=tarfile.GNU_FORMAT) as outer:
+        with InnerSecureTarFile(outer, "good.tar.gz") as inner:
+            inner.add(__file__, arcname="test.py")
+
+        with pytest.raises(RuntimeError), InnerSecureTarFile(
+            outer, "bad.tar.gz"
+        ) as inner:
+            inner.add(__file__, arcname="test.py")
+            raise RuntimeError()
+
+    with tarfile.open(tar_path, "r:") as outer:
+        assert outer.getnames() == ["./good.tar.gz"]
+        with tarfile.open(
+            fileobj=outer.extractfile("./good.tar.gz"), mode="r:gz"
+        ) as inner:
+            assert inner.getnames() == ["test.py"]
+
+
+async def test_restore_folders_legacy_layout(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path
+):
+    """Test restoring a backup built from an extracted temporary directory."""
+    legacy = tmp_path.joinpath("legacy")
+    legacy.mkdir()
+    with SecureTarFile(legacy.joinpath("share.tar.gz"), "w") as tar_file:
+        atomic_contents_add(tar_file, supervisor_data.joinpath("share"), [], ".")
+
+    backup = Backup(coresys, tmp_path.joinpath("test.tar"))
+    backup.new("test", "Test", utcnow().isoformat(), BackupType.PARTIAL)
+    backup._data[ATTR_FOLDERS] = ["share"]  # pylint: disable=protected-access
+    write_json_file(legacy.joinpath("backup.json"), backup._data)
+    with tarfile.open(backup.tarfile, "w:") as tar:
+        tar.add(legacy, arcname=".")
+
+    share = supervisor_data.joinpath("share")
+    for item in share.iterdir():
+        item.unlink()
+
+    restore = Backup(coresys, backup.tarfile)
+    assert await restore.load()
+    async with restore:
+        await restore.restore_folders(["share"])
+
+    assert share.joinpath("small.txt").read_text() == "small file"
+    assert not list(coresys.config.path_tmp.iterdir())
+
+
+async def test_store_folders_concurrent(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path
+):
+    """Test concurrent folder backups keep folder order."""
+    for folder in ("ssl", "media"):
+        supervisor_data.joinpath(folder).mkdir()
+        supervisor_data.joinpath(folder, "file.txt").write_text(folder)
+
+    tar_path = tmp_path.joinpath("test.tar")
+    backup = Backup(coresys, tar_path)
+    backup.new("test", "Test", utcnow().isoformat(), BackupType.PARTIAL)
+    progress = []
+
+    async with backup:
+        await backup.store_folders(
+            ["share", "ssl", "addons", "media"], 3, lambda: progress.append(True)
+        )
+
+    assert len(progress) == 4
+    assert backup.folders == ["share", "ssl", "media"]
+    with tarfile.open(tar_path, "r:") as tar:
+        # Appended to the backup in order of completion
+        assert sorted(tar.getnames()[:-1]) == [
+            "./media.tar.gz",
+            "./share.tar.gz",
+            "./ssl.tar.gz",
+        ]
+        assert tar.getnames()[-1] == "./backup.json"
+    assert not list(coresys.config.path_tmp.iterdir())
+
+    for folder in ("ssl", "media"):
+        supervisor_data.joinpath(folder, "file.txt").unlink()
+
+    restore = Backup(coresys, tar_path)
+    assert await restore.load()
+    async with restore:
+        await restore.restore_folders(["ssl", "media"], 2)
+
+    for folder in ("ssl", "media"):
+        assert supervisor_data.joinpath(folder, "file.txt").read_text() == folder
+
+
+async def test_store_inner_tars_overlap(coresys: CoreSys, tmp_path: Path):
+    """Test concurrent inner tarfiles are built at the same time."""
+    tar_path = tmp_path.joinpath("test.tar")
+    backup = Backup(coresys, tar_path)
+    backup.new("test", "Test", utcnow().isoformat(), BackupType.PARTIAL)
+    both_open = Barrier(2, timeout=5)
+
+    def _build(tar_file: SecureTarFile) -> None:
+        with tar_file as inner:
+            inner.add(__file__, arcname="test.py")
+            # Fails unless the other tarfile is built at the same time
+            both_open.wait()
+
+    async def _store(index: int, tar_file: SecureTarFile) -> None:
+        await coresys.run_in_executor(_build, tar_file)
+
+    async with backup:
+        await backup._store_inner_tars(  # pylint: disable=protected-access
+            ["one.tar.gz", "two.tar.gz"], _store, 2
+        )
+
+    with tarfile.open(tar_path, "r:") as tar:
+        assert sorted(tar.getnames()[:-1]) == ["./one.tar.gz", "./two.tar.gz"]
+        for name in ("./one.tar.gz", "./two.tar.gz"):
+            with tarfile.open(fileobj=tar.extractfile(name), mode="r:gz") as inner:
+                assert inner.getnames() == ["test.py"]
+
+
+@pytest.mark.parametrize("password", [None, "test"])
+async def test_incremental_addon_chain(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path, password: str | None
+):
+    """Test incremental add-on backups, restore from chain and parent removal."""
+    addon_data = tmp_path.joinpath("addon_data")
+    addon_data.mkdir()
+    addon_data.joinpath("config.txt").write_text("one")
+    database = os.urandom(1024 * 1024)
+    addon_data.joinpath("database.bin").write_bytes(database)
+    sizes = {}
+
+    async def mock_backup(tar_file, manifest):
+        with tar_file as tar:
+            manifest.add_contents(tar, addon_data, [], "data")
+
+    addon = MagicMock(slug="local_db", version="1.0.0")
+    addon.name = "Database"
+    addon.backup = AsyncMock(side_effect=mock_backup)
+
+    async def create_backup(slug: str) -> Backup:
+        parent = (
+            coresys.backups._incremental_parent(  # pylint: disable=protected-access
+                password
+            )
+        )
+        backup = Backup(coresys, tmp_path.joinpath(f"{slug}.tar"))
+        backup.new(
+            slug,
+            slug,
+            utcnow().isoformat(),
+            BackupType.PARTIAL,
+            password,
+            incremental=True,
+            parent=parent.slug if parent else None,
+        )
+        async with backup:
+            await backup.store_addons([addon])
+        coresys.backups._backups[slug] = backup  # pylint: disable=protected-access
+        return backup
+
+    base = await create_backup("base")
+    assert base.parent is None
+
+    addon_data.joinpath("config.txt").write_text("two")
+    addon_data.joinpath("new.txt").write_text("new")
+    increment = await create_backup("increment")
+    assert increment.parent == "base"
+    for backup in (base, increment):
+        with tarfile.open(backup.tarfile, "r:") as tar:
+            sizes[backup.slug] = tar.getmember("./local_db.tar.gz").size
+    assert sizes["increment"] < sizes["base"] // 10
+
+    restored = tmp_path.joinpath("restored")
+
+    async def mock_restore(slug, tar_file):
+        assert slug == "local_db"
+        with tar_file as tar:
+            tar.extractall(restored)
+
+    async def restore_increment():
+        restore = Backup(coresys, increment.tarfile)
+        assert await restore.load()
+        restore.set_password(password)
+        async with restore:
+            await restore.restore_addons(["local_db"])
+
+    with patch.object(
+        coresys.addons, "restore", new=AsyncMock(side_effect=mock_restore)
+    ):
+        await restore_increment()
+        assert restored.joinpath("data", "config.txt").read_text() == "two"
+        assert restored.joinpath("data", "new.txt").read_text() == "new"
+        assert restored.joinpath("data", "database.bin").read_bytes() == database
+
+        # Removing the parent keeps the chain restorable
+        assert await coresys.backups.remove(base)
+        assert not base.tarfile.exists()
+        assert increment.parent is None
+        assert increment.layers == ["base"]
+
+        shutil.rmtree(restored)
+        await restore_increment()
+        assert restored.joinpath("data", "config.txt").read_text() == "two"
+        assert restored.joinpath("data", "database.bin").read_bytes() == database
+
+    assert not list(coresys.config.path_tmp.iterdir())
+
+
+async def test_incremental_parent_key(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path
+):
+    """Test only parents with the same key are used."""
+    addon_data = tmp_path.joinpath("addon_data")
+    addon_data.mkdir()
+    addon_data.joinpath("config.txt").write_text("one")
+
+    async def mock_backup(tar_file, manifest):
+        with tar_file as tar:
+            manifest.add_contents(tar, addon_data, [], "data")
+
+    addon = MagicMock(slug="local_db", version="1.0.0")
+    addon.name = "Database"
+    addon.backup = AsyncMock(side_effect=mock_backup)
+
+    async def create_backup(slug: str, password: str, parent: str | None) -> Backup:
+        backup = Backup(coresys, tmp_path.joinpath(f"{slug}.tar"))
+        backup.new(
+            slug,
+            slug,
+            utcnow().isoformat(),
+            BackupType.PARTIAL,
+            password,
+            incremental=True,
+            parent=parent,
+        )
+        async with backup:
+            await backup.store_addons([addon])
+        coresys.backups._backups[slug] = backup  # pylint: disable=protected-access
+        return backup
+
+    base = await create_backup("base", "test", None)
+    assert base.key_digest
+    # pylint: disable=protected-access
+    assert coresys.backups._incremental_parent("test") is base
+    assert coresys.backups._incremental_parent("other") is None
+    assert coresys.backups._incremental_parent(None) is None
+
+    # A parent which can't be used is not recorded
+    other = await create_backup("other", "other", "base")
+    assert other.parent is None
+    missing = await create_backup("missing", "test", "removed")
+    assert missing.parent is None
+
+
+@pytest.mark.parametrize(
+    "codec", [BackupCodec.GZIP, BackupCodec.ZSTD, BackupCodec.LZ4, BackupCodec.NONE]
+)
+async def test_store_restore_codec(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path, codec: BackupCodec
+):
+    """Test folders are stored and restored with each codec."""
+    if codec == BackupCodec.ZSTD:
+        pytest.importorskip("zstandard")
+    if codec == BackupCodec.LZ4:
+        pytest.importorskip("lz4")
+
+    tar_path = tmp_path.joinpath("test.tar")
+    backup = Backup(coresys, tar_path)
+    backup.new(
+        "test", "Test", utcnow().isoformat(), BackupType.PARTIAL, "test", codec=codec
+    )
+
+    async with backup:
+        await backup.store_folders(["share"])
+
+    with tarfile.open(tar_path, "r:") as tar:
+        assert tar.getnames()[0] == f"./{inner_tar_name('share', codec)}"
+
+    share = supervisor_data.joinpath("share")
+    for item in share.iterdir():
+        item.unlink()
+
+    restore = Backup(coresys, tar_path)
+    assert await restore.load()
+    assert restore.codec == codec
+    restore.set_password("test")
+    async with restore:
+        await restore.restore_folders(["share"])
+
+    assert share.joinpath("large.bin").read_bytes() == bytes(range(256)) * 4096
+
+
+async def test_store_incompressible_folder(
+    coresys: CoreSys, tmp_path: Path, supervisor_data: Path
+):
+    """Test folders with already compressed data are stored uncompressed."""
+    media = supervisor_data.joinpath("media")
+    media.mkdir()
+    media.joinpath("video.mp4").write_bytes(os.urandom(256 * 1024))
+
+    backup = Backup(coresys, tmp_path.joinpath("test.tar"))
+    backup.new("test", "Test", utcnow().isoformat(), BackupType.PARTIAL)
+
+    async with backup:
+        await backup.store_folders(["share", "media"])
+
+    with tarfile.open(backup.tarfile, "r:") as tar:
+        assert tar.getnames() == ["./share.tar.gz", "./media.tar", "./backup.json"]
+
+
+def test_compressible_sampled_over_file(tmp_path: Path):
+    """Test files are sampled beyond a compressed header."""
+    text = b"log line with some words in it\n" * 32768
+    tmp_path.joinpath("mixed.db").write_bytes(os.urandom(128 * 1024) + text)
+    assert is_compressible(tmp_path)
+
+    tmp_path.joinpath("mixed.db").write_bytes(
+        os.urandom(512 * 1024) + text[:8192] + os.urandom(512 * 1024)
+    )
+    assert not is_compressible(tmp_path)
+
+
+@pytest.mark.parametrize("key", [None, b"0123456789abcdef"])
+def test_gzip_compatible_with_securetar(tmp_path: Path, key: bytes | None):
+    """Test gzip tarfiles are compatible with SecureTarFile in both directions."""
+    with SecureTarFile(tmp_path.joinpath("old.tar.gz"), "w", key=key) as tar:
+        tar.add(__file__, arcname="test.py")
+    with BackupTarFile(tmp_path.joinpath("old.tar.gz"), "r", key=key) as tar:
+        assert tar.getnames() == ["test.py"]
+
+    with BackupTarFile(tmp_path.joinpath("new.tar.gz"), "w", key=key, level=1) as tar:
+        tar.add(__file__, arcname="test.py")
+    with SecureTarFile(tmp_path.joinpath("new.tar.gz"), "r", key=key) as tar:
+        assert tar.getnames() == ["test.py"]
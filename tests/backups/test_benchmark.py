@@ -0,0 +1,329 @@
+"""Benchmark throughput of the backup pipeline.
+
+Skipped by default, run with:
+pytest tests/backups/test_benchmark.py --benchmark [--benchmark-scale=0.5]
+[--benchmark-json=results.json]
+"""
+# pylint: disable=redefined-outer-name
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import random
+import tarfile
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+from securetar import atomic_contents_add
+
+from supervisor.backups.backup import Backup
+from supervisor.backups.codec import codec_from_name
+from supervisor.backups.const import BackupCodec, BackupType
+from supervisor.coresys import CoreSys
+from supervisor.utils.dt import utcnow
+
+pytestmark = pytest.mark.benchmark
+
+MB = 1024 * 1024
+WORDS = [b"sensor", b"state", b"light", b"on", b"off", b"temperature", b"21.5"]
+
+
+def _text(rand: random.Random, size: int) -> bytes:
+    """Return compressible text data like logs and configs."""
+    return b" ".join(rand.choices(WORDS, k=size // 6))[:size]
+
+
+def build_small_files(path: Path, scale: float) -> None:
+    """Write many small config like files."""
+    rand = random.Random(1)
+    for index in range(max(1, int(2000 * scale))):
+        folder = path.joinpath(f"dir{index % 50}")
+        folder.mkdir(exist_ok=True)
+        folder.joinpath(f"file{index}.yaml").write_bytes(_text(rand, 4096))
+
+
+def build_huge_files(path: Path, scale: float) -> None:
+    """Write few huge database like files, half compressible."""
+    rand = random.Random(2)
+    for index in range(2):
+        with path.joinpath(f"database{index}.db").open("wb") as file:
+            for _ in range(max(1, int(64 * scale))):
+                file.write(rand.randbytes(MB // 2) + _text(rand, MB // 2))
+
+
+def build_media(path: Path, scale: float) -> None:
+    """Write already compressed media files."""
+    rand = random.Random(3)
+    for index in range(max(1, int(16 * scale))):
+        path.joinpath(f"video{index}.mp4").write_bytes(rand.randbytes(4 * MB))
+
+
+DATASETS: dict[str, Callable[[Path, float], None]] = {
+    "small_files": build_small_files,
+    "huge_files": build_huge_files,
+    "media": build_media,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of one measured backup or restore."""
+
+    name: str
+    size: int
+    seconds: float
+    peak_rss: int
+    peak_temp: int
+    codec: str = ""
+
+    @property
+    def throughput(self) -> float:
+        """Return MB/s."""
+        return self.size / MB / self.seconds if self.seconds else 0
+
+
+def _rss() -> int:
+    """Return resident memory of this process."""
+    with open("/proc/self/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _folder_size(path: Path) -> int:
+    """Return size of all files inside a folder."""
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                continue
+    return size
+
+
+class ResourceMonitor:
+    """Sample peak RSS growth and temp space use in a thread."""
+
+    def __init__(self, temp: Path) -> None:
+        """Initialize monitor."""
+        self._temp = temp
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._base_rss = 0
+        self.peak_rss = 0
+        self.peak_temp = 0
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(0.01):
+            self.peak_rss = max(self.peak_rss, _rss() - self._base_rss)
+            self.peak_temp = max(self.peak_temp, _folder_size(self._temp))
+
+    def __enter__(self) -> "ResourceMonitor":
+        """Start sampling."""
+        self._base_rss = _rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+
+@pytest.fixture
+def benchmark_report(request: pytest.FixtureRequest, capsys):
+    """Print results and append them to the json report."""
+    results: list[BenchmarkResult] = []
+    yield results
+
+    with capsys.disabled():
+        for result in results:
+            print(
+                f"\n{result.name:60} {result.codec:10} {result.throughput:8.1f} MB/s "
+                f"{result.peak_rss / MB:8.1f} MB RSS {result.peak_temp / MB:8.1f} MB tmp"
+            )
+
+    if json_path := request.config.getoption("--benchmark-json"):
+        json_file = Path(json_path)
+        report = (
+            json.loads(json_file.read_text(encoding="utf-8"))
+            if json_file.exists()
+            else []
+        )
+        report.extend(
+            asdict(result) | {"throughput": result.throughput} for result in results
+        )
+        json_file.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def benchmark_data(coresys: CoreSys, tmp_path: Path) -> Path:
+    """Use temporary supervisor data and tmp folders."""
+    data = tmp_path.joinpath("data")
+    data.mkdir()
+    tmp = tmp_path.joinpath("tmp")
+    tmp.mkdir()
+
+    with patch.object(
+        type(coresys.config), "path_supervisor", new=PropertyMock(return_value=data)
+    ), patch.object(
+        type(coresys.config), "path_tmp", new=PropertyMock(return_value=tmp)
+    ):
+        yield data
+
+
+async def _measure(
+    coresys: CoreSys, name: str, size: int, run: Callable
+) -> BenchmarkResult:
+    """Measure a backup or restore run."""
+    with ResourceMonitor(coresys.config.path_tmp) as monitor:
+        start = time.perf_counter()
+        await run()
+        seconds = time.perf_counter() - start
+
+    return BenchmarkResult(name, size, seconds, monitor.peak_rss, monitor.peak_temp)
+
+
+def _stored_codecs(tar_path: Path) -> str:
+    """Return codecs the inner tarfiles of a backup were stored with."""
+    with tarfile.open(tar_path, "r:") as tar:
+        codecs = {
+            codec_from_name(name).value
+            for name in tar.getnames()
+            if name != "./backup.json"
+        }
+    return ",".join(sorted(codecs))
+
+
+def _mock_addon(slug: str, path_data: Path) -> MagicMock:
+    """Return add-on storing its data folder like Addon.backup."""
+
+    async def backup(tar_file, manifest=None):
+        def _write_tarfile():
+            with tar_file as tar:
+                if manifest is not None:
+                    manifest.add_contents(tar, path_data, [], "data")
+                else:
+                    atomic_contents_add(tar, path_data, [], "data")
+
+        await asyncio.get_running_loop().run_in_executor(None, _write_tarfile)
+
+    addon = MagicMock(slug=slug, version="1.0.0", path_data=path_data)
+    addon.name = slug
+    addon.backup = AsyncMock(side_effect=backup)
+    return addon
+
+
+async def _mock_addon_restore(slug: str, tar_file) -> None:
+    """Extract add-on data like Addon.restore."""
+
+    def _extract():
+        with tar_file as tar:
+            for member in tar:
+                if member.isfile():
+                    tar.extractfile(member).read()
+
+    await asyncio.get_running_loop().run_in_executor(None, _extract)
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+@pytest.mark.parametrize("password", [None, "benchmark"])
+@pytest.mark.parametrize("codec", [BackupCodec.GZIP, BackupCodec.NONE])
+async def test_benchmark_folders(
+    coresys: CoreSys,
+    tmp_path: Path,
+    benchmark_data: Path,
+    benchmark_report: list[BenchmarkResult],
+    request: pytest.FixtureRequest,
+    dataset: str,
+    password: str | None,
+    codec: BackupCodec,
+):
+    """Benchmark store and restore of a folder."""
+    share = benchmark_data.joinpath("share")
+    share.mkdir()
+    DATASETS[dataset](share, request.config.getoption("--benchmark-scale"))
+    size = _folder_size(share)
+    name = f"folder {dataset} {codec.value}{' protected' if password else ''}"
+
+    backup = Backup(coresys, tmp_path.joinpath("benchmark.tar"))
+    backup.new(
+        "bench",
+        "Bench",
+        utcnow().isoformat(),
+        BackupType.PARTIAL,
+        password,
+        codec=codec,
+    )
+
+    async def _store():
+        async with backup:
+            await backup.store_folders(["share"])
+
+    benchmark_report.append(await _measure(coresys, f"{name} store", size, _store))
+    # Incompressible data falls back to no compression
+    benchmark_report[-1].codec = _stored_codecs(backup.tarfile)
+
+    restore = Backup(coresys, backup.tarfile)
+    assert await restore.load()
+    restore.set_password(password)
+
+    async def _restore():
+        async with restore:
+            await restore.restore_folders(["share"])
+
+    benchmark_report.append(await _measure(coresys, f"{name} restore", size, _restore))
+    benchmark_report[-1].codec = benchmark_report[-2].codec
+    assert _folder_size(share) == size
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_benchmark_addons(
+    coresys: CoreSys,
+    tmp_path: Path,
+    benchmark_data: Path,
+    benchmark_report: list[BenchmarkResult],
+    request: pytest.FixtureRequest,
+    dataset: str,
+    concurrency: int,
+):
+    """Benchmark store and restore of add-ons."""
+    addons = []
+    for index in range(4):
+        path_data = benchmark_data.joinpath(f"addon{index}")
+        path_data.mkdir()
+        DATASETS[dataset](path_data, request.config.getoption("--benchmark-scale") / 4)
+        addons.append(_mock_addon(f"addon{index}", path_data))
+    size = _folder_size(benchmark_data)
+    name = f"addons {dataset} concurrency {concurrency}"
+
+    backup = Backup(coresys, tmp_path.joinpath("benchmark.tar"))
+    backup.new("bench", "Bench", utcnow().isoformat(), BackupType.PARTIAL)
+
+    async def _store():
+        async with backup:
+            await backup.store_addons(addons, concurrency)
+
+    benchmark_report.append(await _measure(coresys, f"{name} store", size, _store))
+    benchmark_report[-1].codec = _stored_codecs(backup.tarfile)
+    assert len(backup.addons) == 4
+
+    restore = Backup(coresys, backup.tarfile)
+    assert await restore.load()
+
+    async def _restore():
+        async with restore:
+            await restore.restore_addons(restore.addon_list, concurrency)
+
+    with patch.object(
+        coresys.addons, "restore", new=AsyncMock(side_effect=_mock_addon_restore)
+    ):
+        benchmark_report.append(
+            await _measure(coresys, f"{name} restore", size, _restore)
+        )
+    benchmark_report[-1].codec = benchmark_report[-2].codec
@@ -1,11 +1,14 @@
 """Test BackupManager class."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+from supervisor.backups.backup import Backup
 from supervisor.backups.const import BackupType
 from supervisor.backups.manager import BackupManager
 from supervisor.const import FOLDER_HOMEASSISTANT, FOLDER_SHARE, CoreState
 from supervisor.coresys import CoreSys
+from supervisor.utils.dt import utcnow
 
 from tests.const import TEST_ADDON_SLUG
 
@@ -34,10 +37,45 @@ async def test_do_backup_full(coresys: CoreSys, backup_mock, install_addon_ssh):
 
     backup_instance.store_folders.assert_called_once()
     assert len(backup_instance.store_folders.call_args[0][0]) == 4
+    assert backup_instance.store_folders.call_args[0][1] == 1
 
     assert coresys.core.state == CoreState.RUNNING
 
 
+async def test_do_backup_full_concurrency(
+    coresys: CoreSys, backup_mock, install_addon_ssh
+):
+    """Test creating Backup with concurrent add-on and folder backups."""
+    coresys.core.state = CoreState.RUNNING
+    coresys.hardware.disk.get_disk_free_space = lambda x: 5000
+
+    manager = BackupManager(coresys)
+
+    backup_instance: MagicMock = await manager.do_backup_full(concurrency=3)
+
+    assert backup_instance.store_addons.call_args[0][1] == 3
+    assert backup_instance.store_folders.call_args[0][1] == 3
+
+
+async def test_default_concurrency(coresys: CoreSys):
+    """Test default concurrency depends on the data disk, checked on load."""
+    manager = BackupManager(coresys)
+    assert manager.default_concurrency == 1
+
+    for fast_disk, cpu_count, concurrency in (
+        (False, 8, 1),
+        (True, 8, 4),
+        (True, 2, 2),
+    ):
+        with patch.object(
+            type(coresys.hardware.disk), "is_fast_disk", return_value=fast_disk
+        ), patch("os.cpu_count", return_value=cpu_count), patch.object(
+            manager, "reload"
+        ):
+            await manager.load()
+            assert manager.default_concurrency == concurrency
+
+
 async def test_do_backup_full_uncompressed(
     coresys: CoreSys, backup_mock, install_addon_ssh
 ):
@@ -321,3 +359,38 @@ async def test_fail_invalid_partial_backup(
         type(coresys.supervisor), "version", new=PropertyMock(return_value="2022.08.3")
     ):
         assert await manager.do_restore_partial(backup_instance) is False
+
+
+async def test_reload_uses_index(coresys: CoreSys, tmp_path: Path):
+    """Test reload only reads new or changed backup files."""
+    for slug in ("first", "second"):
+        backup = Backup(coresys, tmp_path.joinpath(f"{slug}.tar"))
+        backup.new(slug, slug, utcnow().isoformat(), BackupType.PARTIAL)
+        async with backup:
+            pass
+
+    manager = BackupManager(coresys)
+    manager._index.save_data = MagicMock()  # pylint: disable=protected-access
+
+    with patch.object(
+        type(coresys.config), "path_backup", new=PropertyMock(return_value=tmp_path)
+    ), patch.object(Backup, "load", autospec=True, side_effect=Backup.load) as load:
+        await manager.reload()
+        assert {backup.slug for backup in manager.list_backups} == {"first", "second"}
+        assert load.call_count == 2
+        manager._index.save_data.assert_called_once()  # pylint: disable=protected-access
+
+        load.reset_mock()
+        await manager.reload()
+        assert {backup.slug for backup in manager.list_backups} == {"first", "second"}
+        assert manager.get("first").name == "first"
+        load.assert_not_called()
+
+        tmp_path.joinpath("first.tar").touch()
+        tmp_path.joinpath("second.tar").unlink()
+        await manager.reload()
+        assert {backup.slug for backup in manager.list_backups} == {"first"}
+        assert load.call_count == 1
+        assert manager._index.paths == {  # pylint: disable=protected-access
+            tmp_path.joinpath("first.tar")
+        }
@@ -0,0 +1,53 @@
+"""Test backup stream pipeline stages."""
+import io
+
+import pytest
+
+from supervisor.backups.pipeline import ReadStage, WriteStage
+
+
+def test_write_stage():
+    """Test chunks pass a write stage in order."""
+    result = []
+    stage = WriteStage(result.append, "test")
+    for index in range(100):
+        stage.write(bytes([index]))
+    stage.close()
+
+    assert result == [bytes([index]) for index in range(100)]
+
+
+def test_write_stage_error():
+    """Test an error of the sink is raised to the writer."""
+
+    def sink(data: bytes) -> None:
+        raise OSError("No space left on device")
+
+    stage = WriteStage(sink, "test")
+    with pytest.raises(OSError):
+        for _ in range(100):
+            stage.write(b"data")
+    with pytest.raises(OSError):
+        stage.close()
+
+
+def test_read_stage():
+    """Test read stage reads ahead until the end of the source."""
+    source = io.BytesIO(bytes(range(256)) * 100)
+    stage = ReadStage(source.read, "test", 1000)
+
+    data = b""
+    while chunk := stage.read():
+        data += chunk
+    stage.close()
+
+    assert data == bytes(range(256)) * 100
+
+
+def test_read_stage_close_early():
+    """Test read stage stops once closed with a full buffer."""
+    source = io.BytesIO(bytes(100_000))
+    stage = ReadStage(source.read, "test", 10)
+
+    assert stage.read() == bytes(10)
+    stage.close()
@@ -49,6 +49,8 @@ from supervisor.dbus.network import NetworkManager
 from supervisor.dbus.resolved import Resolved
 from supervisor.dbus.systemd import Systemd
 from supervisor.dbus.timedate import TimeDate
+from supervisor.docker.collector import DockerStatsCollector
+from supervisor.docker.engine import DockerEngineClient
 from supervisor.docker.manager import DockerAPI
 from supervisor.docker.monitor import DockerMonitor
 from supervisor.store.addon import AddonStore
@@ -62,6 +64,38 @@ from .const import TEST_ADDON_SLUG
 # pylint: disable=redefined-outer-name, protected-access
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add options to run benchmarks."""
+    parser.addoption(
+        "--benchmark", action="store_true", help="Run benchmarks marked benchmark"
+    )
+    parser.addoption(
+        "--benchmark-scale",
+        type=float,
+        default=1.0,
+        help="Scale size of benchmark datasets",
+    )
+    parser.addoption("--benchmark-json", help="Append benchmark results to file")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register markers."""
+    config.addinivalue_line("markers", "benchmark: slow benchmark, needs --benchmark")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip benchmarks unless asked for."""
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 async def mock_async_return_true() -> bool:
     """Mock methods to return True."""
     return True
@@ -88,6 +122,9 @@ def docker() -> DockerAPI:
     ), patch(
         "supervisor.docker.manager.DockerConfig",
         return_value=MagicMock(),
+    ), patch(
+        "supervisor.docker.manager.DockerEngineClient",
+        return_value=MagicMock(spec=DockerEngineClient),
     ), patch(
         "supervisor.docker.manager.DockerAPI.load"
     ), patch(
@@ -316,6 +353,7 @@ async def coresys(
     coresys_obj._resolution.save_data = MagicMock()
     coresys_obj._addons.data.save_data = MagicMock()
     coresys_obj._store.save_data = MagicMock()
+    coresys_obj._backups._index.save_data = MagicMock()
 
     # Mock test client
     coresys_obj.arch._default_arch = "amd64"
@@ -329,6 +367,7 @@ async def coresys(
     # Mock docker
     coresys_obj._docker = docker
     coresys_obj.docker._monitor = DockerMonitor(coresys_obj)
+    coresys_obj.docker._collector = DockerStatsCollector(coresys_obj)
 
     # Set internet state
     coresys_obj.supervisor._connectivity = True
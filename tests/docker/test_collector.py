@@ -0,0 +1,103 @@
+"""Test stats collector of containers."""
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from supervisor.coresys import CoreSys
+from supervisor.docker.collector import STATS_HISTORY
+from supervisor.docker.const import ContainerState
+from supervisor.docker.monitor import DockerContainerStateEvent
+from supervisor.exceptions import DockerError
+
+from tests.common import load_json_fixture
+
+
+@pytest.fixture
+def samples() -> asyncio.Queue:
+    """Return queue feeding the stats stream of dockerd."""
+    return asyncio.Queue()
+
+
+@pytest.fixture
+def stats_stream(coresys: CoreSys, samples: asyncio.Queue):
+    """Stream samples of the queue until it gets None."""
+
+    async def _stream(name: str) -> AsyncIterator[dict[str, Any]]:
+        while sample := await samples.get():
+            yield sample
+
+    with patch.object(
+        coresys.docker.engine, "container_stats_stream", new=_stream
+    ) as stream:
+        yield stream
+
+
+async def test_stats_collector(coresys: CoreSys, samples: asyncio.Queue, stats_stream):
+    """Test stats are kept from a stream of samples."""
+    collector = coresys.docker.collector
+    sample = load_json_fixture("container_stats.json")
+
+    # First sample has nothing to compare CPU usage with
+    samples.put_nowait({**sample, "precpu_stats": {}})
+    samples.put_nowait(sample)
+    stats = await collector.stats("homeassistant")
+    assert stats.cpu_percent == 90.0
+
+    for _ in range(STATS_HISTORY + 5):
+        samples.put_nowait(sample)
+    while not samples.empty():
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
+
+    assert len(collector.history("homeassistant")) == STATS_HISTORY
+    assert len(collector.history("homeassistant", 5)) == 5
+    assert collector.history("homeassistant", 0) == []
+    assert (
+        await collector.stats("homeassistant") is collector.history("homeassistant")[-1]
+    )
+    assert collector.sweep() == {
+        "homeassistant": collector.history("homeassistant")[-1]
+    }
+
+    await collector.container_state_changed(
+        DockerContainerStateEvent("homeassistant", ContainerState.STOPPED, "abc", 1)
+    )
+    assert collector.history("homeassistant") == []
+
+
+async def test_stats_collector_stream_ended(
+    coresys: CoreSys, samples: asyncio.Queue, stats_stream
+):
+    """Test error if stream ends without samples."""
+    samples.put_nowait(None)
+    with pytest.raises(DockerError):
+        await coresys.docker.collector.stats("homeassistant")
+
+    assert coresys.docker.collector.history("homeassistant") == []
+
+
+async def test_stats_collector_load(coresys: CoreSys):
+    """Test streams are started for running managed containers."""
+    with patch.object(
+        coresys.docker.engine,
+        "containers_list",
+        return_value=[
+            {
+                "Names": ["/homeassistant"],
+                "State": "running",
+                "Labels": {"supervisor_managed": ""},
+            },
+            {
+                "Names": ["/addon_local_ssh"],
+                "State": "exited",
+                "Labels": {"supervisor_managed": ""},
+            },
+            {"Names": ["/portainer"], "State": "running", "Labels": {}},
+        ],
+    ), patch.object(coresys.docker.collector, "subscribe") as subscribe:
+        await coresys.docker.collector.load()
+
+    subscribe.assert_called_once_with("homeassistant")
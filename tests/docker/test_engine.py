@@ -0,0 +1,124 @@
+"""Test async Docker Engine API client."""
+# pylint: disable=redefined-outer-name
+import asyncio
+import json
+from pathlib import Path
+import struct
+
+from aiohttp import web
+import pytest
+
+from supervisor.docker.engine import DOCKER_CONNECTIONS, DockerEngineClient
+from supervisor.exceptions import DockerAPIError, DockerNotFound, DockerRequestError
+
+from tests.common import load_json_fixture
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    """Return frame of a multiplexed stream."""
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> DockerEngineClient:
+    """Return client connected to a fake dockerd."""
+    containers = {"homeassistant": {"State": {"Status": "running"}}}
+    shutdown = asyncio.Event()
+
+    async def inspect(request: web.Request) -> web.Response:
+        if request.match_info["name"] == "broken":
+            return web.json_response({"message": "server error"}, status=500)
+        if not (attrs := containers.get(request.match_info["name"])):
+            return web.json_response({"message": "No such container"}, status=404)
+        return web.json_response(attrs)
+
+    async def logs(request: web.Request) -> web.StreamResponse:
+        assert request.query["tail"] == "2"
+        response = web.StreamResponse()
+        await response.prepare(request)
+        # Frames can be split by the transport
+        data = _frame(1, b"first\n") + _frame(2, b"second\n")
+        await response.write(data[:20])
+        await response.write(data[20:])
+        return response
+
+    async def stats(request: web.Request) -> web.StreamResponse:
+        sample = load_json_fixture("container_stats.json")
+        if request.query["stream"] == "false":
+            return web.json_response(sample)
+
+        # Streams stay open until the client is gone
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(json.dumps(sample).encode() + b"\n")
+        await shutdown.wait()
+        return response
+
+    app = web.Application()
+    app.add_routes(
+        [
+            web.get("/containers/{name}/json", inspect),
+            web.get("/containers/{name}/logs", logs),
+            web.get("/containers/{name}/stats", stats),
+        ]
+    )
+    runner = web.AppRunner(app)
+    await runner.setup()
+    socket = tmp_path / "docker.sock"
+    await web.UnixSite(runner, str(socket)).start()
+
+    client = DockerEngineClient(socket)
+    yield client
+
+    await client.close()
+    shutdown.set()
+    await runner.cleanup()
+
+
+async def test_container_inspect(engine: DockerEngineClient):
+    """Test inspect and errors of dockerd."""
+    attrs = await engine.container_inspect("homeassistant")
+    assert attrs["State"]["Status"] == "running"
+
+    with pytest.raises(DockerNotFound):
+        await engine.container_inspect("addon_local_ssh")
+    with pytest.raises(DockerAPIError):
+        await engine.container_inspect("broken")
+
+
+async def test_container_logs(engine: DockerEngineClient):
+    """Test logs of a container are demultiplexed while streamed."""
+    chunks = [chunk async for chunk in engine.container_logs("homeassistant", tail=2)]
+    assert chunks == [b"first\n", b"second\n"]
+
+
+async def test_container_stats(engine: DockerEngineClient):
+    """Test one sample of stats."""
+    stats = await engine.container_stats("homeassistant")
+    assert stats["cpu_stats"]["online_cpus"]
+
+
+async def test_container_stats_streams(engine: DockerEngineClient):
+    """Test streams don't take the connections of requests."""
+    streams = [
+        engine.container_stats_stream("homeassistant")
+        for _ in range(DOCKER_CONNECTIONS + 1)
+    ]
+    try:
+        for stream in streams:
+            sample = await asyncio.wait_for(stream.__anext__(), 5)
+            assert sample["cpu_stats"]["online_cpus"]
+
+        attrs = await asyncio.wait_for(engine.container_inspect("homeassistant"), 5)
+        assert attrs["State"]["Status"] == "running"
+    finally:
+        for stream in streams:
+            await stream.aclose()
+
+
+async def test_no_dockerd(tmp_path: Path):
+    """Test connection issues."""
+    client = DockerEngineClient(tmp_path / "missing.sock")
+    with pytest.raises(DockerRequestError):
+        await client.container_inspect("homeassistant")
+    await client.close()
@@ -3,18 +3,22 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 from awesomeversion import AwesomeVersion
-from docker.errors import DockerException, NotFound
+from docker.errors import DockerException
 from docker.models.containers import Container
 from docker.models.images import Image
 import pytest
-from requests import RequestException
 
 from supervisor.const import BusEvent, CpuArch
 from supervisor.coresys import CoreSys
 from supervisor.docker.const import ContainerState
 from supervisor.docker.interface import DockerInterface
 from supervisor.docker.monitor import DockerContainerStateEvent
-from supervisor.exceptions import DockerAPIError, DockerError, DockerRequestError
+from supervisor.exceptions import (
+    DockerAPIError,
+    DockerError,
+    DockerNotFound,
+    DockerRequestError,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -80,33 +84,24 @@ async def test_current_state(
     coresys: CoreSys, attrs: dict[str, Any], expected: ContainerState
 ):
     """Test current state for container."""
-    container_collection = MagicMock()
-    container_collection.get.return_value = Container(attrs)
-    with patch(
-        "supervisor.docker.manager.DockerAPI.containers",
-        new=PropertyMock(return_value=container_collection),
-    ):
+    with patch.object(coresys.docker.engine, "container_inspect", return_value=attrs):
         assert await coresys.homeassistant.core.instance.current_state() == expected
 
 
 async def test_current_state_failures(coresys: CoreSys):
     """Test failure states for current state."""
-    container_collection = MagicMock()
-    with patch(
-        "supervisor.docker.manager.DockerAPI.containers",
-        new=PropertyMock(return_value=container_collection),
-    ):
-        container_collection.get.side_effect = NotFound("dne")
+    with patch.object(coresys.docker.engine, "container_inspect") as inspect:
+        inspect.side_effect = DockerNotFound("dne")
         assert (
             await coresys.homeassistant.core.instance.current_state()
             == ContainerState.UNKNOWN
         )
 
-        container_collection.get.side_effect = DockerException()
+        inspect.side_effect = DockerAPIError()
         with pytest.raises(DockerAPIError):
             await coresys.homeassistant.core.instance.current_state()
 
-        container_collection.get.side_effect = RequestException()
+        inspect.side_effect = DockerRequestError()
         with pytest.raises(DockerRequestError):
             await coresys.homeassistant.core.instance.current_state()
 
@@ -1,6 +1,7 @@
 """Test docker events monitor."""
 
 import asyncio
+import queue
 from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -146,3 +147,97 @@ async def test_unlabeled_container(coresys: CoreSys):
                 "homeassistant", ContainerState.FAILED, "abc123", 123
             ),
         )
+
+
+async def test_container_states(coresys: CoreSys):
+    """Test container states are loaded once and kept current from events."""
+    events = queue.Queue()
+    containers = [
+        {
+            "Names": ["/homeassistant"],
+            "State": "running",
+            "Status": "Up 2 hours (healthy)",
+        },
+        {
+            "Names": ["/addon_local_ssh"],
+            "State": "exited",
+            "Status": "Exited (137) 5 minutes ago",
+        },
+        {"Names": ["/addon_local_example"], "State": "created", "Status": "Created"},
+    ]
+    instance = coresys.homeassistant.core.instance
+
+    async def _state_changed(state: ContainerState):
+        for _ in range(100):
+            if await instance.current_state() == state:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"Container state not {state}")
+
+    with patch(
+        "supervisor.docker.manager.DockerAPI.events",
+        new=PropertyMock(return_value=iter(events.get, None)),
+    ), patch.object(
+        coresys.docker.engine, "containers_list", return_value=containers
+    ), patch.object(
+        coresys.docker.engine, "container_inspect"
+    ) as inspect:
+        await coresys.docker.monitor.load()
+        try:
+            assert await instance.current_state() == ContainerState.HEALTHY
+            assert await instance.is_running()
+            monitor = coresys.docker.monitor
+            assert monitor.container_state("addon_local_ssh") == ContainerState.FAILED
+            assert (
+                monitor.container_state("addon_local_example") == ContainerState.STOPPED
+            )
+            assert monitor.container_state("missing") == ContainerState.UNKNOWN
+
+            for action, attributes in (
+                ("die", {"exitCode": "0"}),
+                ("destroy", {}),
+            ):
+                events.put(
+                    {
+                        "id": "abc123",
+                        "time": 123,
+                        "Type": "container",
+                        "Action": action,
+                        "Actor": {
+                            "Attributes": {"name": "homeassistant", **attributes}
+                        },
+                    }
+                )
+            await _state_changed(ContainerState.UNKNOWN)
+            assert not await instance.is_running()
+
+            inspect.assert_not_called()
+        finally:
+            events.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, monitor.join)
+
+        assert monitor.container_state("homeassistant") is None
+
+
+async def test_container_states_reload_keeps_events(coresys: CoreSys):
+    """Test events applied while the container list is loaded are kept."""
+    monitor = coresys.docker.monitor
+
+    async def _containers_list():
+        # Stop event arrives while dockerd answers with the old state
+        monitor._set_state("homeassistant", ContainerState.STOPPED)
+        monitor._set_state("addon_local_ssh", None)
+        return [
+            {"Names": ["/homeassistant"], "State": "running", "Status": "Up 2 hours"},
+            {"Names": ["/addon_local_ssh"], "State": "running", "Status": "Up 1 hour"},
+            {"Names": ["/dns"], "State": "running", "Status": "Up 2 hours"},
+        ]
+
+    with patch.object(
+        coresys.docker.engine, "containers_list", new=_containers_list
+    ), patch.object(monitor, "is_alive", return_value=True):
+        await monitor.reload()
+
+        assert monitor.container_state("homeassistant") == ContainerState.STOPPED
+        assert monitor.container_state("addon_local_ssh") == ContainerState.UNKNOWN
+        assert monitor.container_state("dns") == ContainerState.RUNNING
@@ -98,3 +98,27 @@ def test_try_get_emmc_life_time(coresys, tmp_path):
     ):
         value = coresys.hardware.disk._try_get_emmc_life_time("mmcblk0")
     assert value == 20.0
+
+
+def test_is_fast_disk(coresys, tmp_path):
+    """Test fast disk detection."""
+    tmp_path.joinpath("fake-nvme0n1-rotational").write_text("0\n")
+    tmp_path.joinpath("fake-sda-rotational").write_text("1\n")
+
+    with patch(
+        "supervisor.hardware.disk._BLOCK_DEVICE_ROTATIONAL",
+        str(tmp_path / "fake-{}-rotational"),
+    ), patch.object(
+        coresys.hardware.disk, "_get_mount_source_device_name"
+    ) as device_name:
+        device_name.return_value = "nvme0n1"
+        assert coresys.hardware.disk.is_fast_disk("/data")
+
+        device_name.return_value = "sda"
+        assert not coresys.hardware.disk.is_fast_disk("/data")
+
+        device_name.return_value = "mmcblk0"
+        assert not coresys.hardware.disk.is_fast_disk("/data")
+
+        device_name.return_value = None
+        assert not coresys.hardware.disk.is_fast_disk("/data")
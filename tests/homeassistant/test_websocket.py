@@ -1,11 +1,18 @@
 """Test websocket."""
 # pylint: disable=protected-access, import-error
+from datetime import timedelta
 import logging
+from unittest.mock import AsyncMock
 
 from awesomeversion import AwesomeVersion
+import time_machine
 
 from supervisor.coresys import CoreSys
+from supervisor.docker.const import ContainerState
+from supervisor.docker.monitor import DockerContainerStateEvent
 from supervisor.homeassistant.const import WSEvent, WSType
+from supervisor.homeassistant.websocket import MAX_QUEUED_UPDATE_EVENTS
+from supervisor.utils.dt import utcnow
 
 
 async def test_send_command(coresys: CoreSys):
@@ -48,3 +55,133 @@ async def test_send_command_old_core_version(coresys: CoreSys, caplog):
         "test", {"lorem": "ipsum"}
     )
     client.async_send_command.assert_not_called()
+
+
+async def test_send_message_cached_api_state(coresys: CoreSys):
+    """Test sending messages does not probe the API for every event."""
+    client = coresys.homeassistant.websocket._client
+    client.connected = False
+    coresys.homeassistant.websocket._get_ws_client = AsyncMock(return_value=client)
+    coresys.homeassistant.api.check_api_state = AsyncMock(return_value=True)
+    coresys.homeassistant.api.set_api_state(True)
+
+    await coresys.homeassistant.websocket.async_supervisor_update_event("test")
+    await coresys.homeassistant.websocket.async_supervisor_update_event("test")
+    coresys.homeassistant.api.check_api_state.assert_not_called()
+    assert client.async_send_command.call_count == 2
+
+    with time_machine.travel(utcnow() + timedelta(minutes=5)):
+        await coresys.homeassistant.websocket.async_supervisor_update_event("test")
+    coresys.homeassistant.api.check_api_state.assert_called_once()
+
+
+async def test_send_message_api_starting(coresys: CoreSys):
+    """Test events are delivered shortly after a failed API check."""
+    client = coresys.homeassistant.websocket._client
+    client.connected = False
+    coresys.homeassistant.websocket._get_ws_client = AsyncMock(return_value=client)
+
+    # Core container started, the API is not up yet
+    coresys.homeassistant.api.set_api_state(False)
+    await coresys.homeassistant.websocket.async_supervisor_update_event("test")
+    client.async_send_command.assert_not_called()
+
+    coresys.homeassistant.api.check_api_state = AsyncMock(return_value=True)
+    with time_machine.travel(utcnow() + timedelta(seconds=6)):
+        await coresys.homeassistant.websocket.async_supervisor_update_event("test")
+    coresys.homeassistant.api.check_api_state.assert_called_once()
+    client.async_send_command.assert_called_once()
+
+
+async def test_api_state_container_events(coresys: CoreSys):
+    """Test container state events update the API state."""
+    coresys.homeassistant.api.check_api_state = AsyncMock(return_value=True)
+    coresys.homeassistant.api.set_api_state(True)
+
+    await coresys.homeassistant.api.container_state_changed(
+        DockerContainerStateEvent(
+            name="addon_local_ssh", state=ContainerState.STOPPED, id="abc", time=1
+        )
+    )
+    assert await coresys.homeassistant.api.get_api_state() is True
+
+    await coresys.homeassistant.api.container_state_changed(
+        DockerContainerStateEvent(
+            name="homeassistant", state=ContainerState.STOPPED, id="abc", time=1
+        )
+    )
+    assert await coresys.homeassistant.api.get_api_state() is False
+    coresys.homeassistant.api.check_api_state.assert_not_called()
+
+    await coresys.homeassistant.api.container_state_changed(
+        DockerContainerStateEvent(
+            name="homeassistant", state=ContainerState.RUNNING, id="abc", time=2
+        )
+    )
+    assert await coresys.homeassistant.api.get_api_state() is True
+    coresys.homeassistant.api.check_api_state.assert_called_once()
+
+
+async def test_update_events_coalesced(coresys: CoreSys):
+    """Test queued update events are coalesced per key."""
+    client = coresys.homeassistant.websocket._client
+
+    coresys.homeassistant.websocket.supervisor_update_event("network", {"a": 1})
+    coresys.homeassistant.websocket.supervisor_update_event("addons", {"b": 1})
+    coresys.homeassistant.websocket.supervisor_update_event("network", {"a": 2})
+    coresys.homeassistant.websocket.supervisor_update_event("network", {"c": 1})
+    await coresys.homeassistant.websocket._queue_task
+
+    assert client.async_send_command.call_count == 2
+    assert client.async_send_command.call_args_list[0].args[0]["data"] == {
+        "event": WSEvent.SUPERVISOR_UPDATE,
+        "update_key": "network",
+        "data": {"a": 2, "c": 1},
+    }
+    assert client.async_send_command.call_args_list[1].args[0]["data"] == {
+        "event": WSEvent.SUPERVISOR_UPDATE,
+        "update_key": "addons",
+        "data": {"b": 1},
+    }
+
+
+async def test_update_events_batched(coresys: CoreSys):
+    """Test queued update events are sent in one frame on newer cores."""
+    client = coresys.homeassistant.websocket._client
+    client.ha_version = AwesomeVersion("2023.2.0")
+    client.async_send_commands.return_value = [None, None]
+
+    coresys.homeassistant.websocket.supervisor_update_event("network", {"a": 1})
+    coresys.homeassistant.websocket.supervisor_update_event("addons", {"b": 1})
+    await coresys.homeassistant.websocket._queue_task
+
+    client.async_send_command.assert_not_called()
+    client.async_send_commands.assert_called_once()
+    assert [
+        message["data"]["update_key"]
+        for message in client.async_send_commands.call_args.args[0]
+    ] == ["network", "addons"]
+
+
+async def test_update_events_full_queue(coresys: CoreSys, caplog):
+    """Test a flood of updates keeps the queue bounded and in order."""
+    websocket = coresys.homeassistant.websocket
+    client = websocket._client
+    client.ha_version = AwesomeVersion("2023.2.0")
+    client.async_send_commands.return_value = []
+
+    for index in range(MAX_QUEUED_UPDATE_EVENTS + 10):
+        websocket.supervisor_update_event(f"key{index}", {"index": index})
+        assert len(websocket._queue) <= MAX_QUEUED_UPDATE_EVENTS
+    # Updates of pending keys are still merged
+    websocket.supervisor_update_event("key20", {"merged": True})
+    assert len(websocket._queue) == MAX_QUEUED_UPDATE_EVENTS
+    await websocket._queue_task
+
+    client.async_send_commands.assert_called_once()
+    messages = client.async_send_commands.call_args.args[0]
+    assert [message["data"]["update_key"] for message in messages] == [
+        f"key{index}" for index in range(10, MAX_QUEUED_UPDATE_EVENTS + 10)
+    ]
+    assert messages[10]["data"]["data"] == {"index": 20, "merged": True}
+    assert "dropped key0" in caplog.text
@@ -45,7 +45,7 @@ async def test_connectivity_events(coresys: CoreSys, force: bool):
         type(coresys.homeassistant.websocket), "async_send_message"
     ) as send_message:
         await coresys.host.network.check_connectivity(force=force)
-        await asyncio.sleep(0)
+        await coresys.homeassistant.websocket._queue_task
 
         assert coresys.host.network.connectivity is True
         send_message.assert_called_once_with(
@@ -66,7 +66,7 @@ async def test_connectivity_events(coresys: CoreSys, force: bool):
             new=PropertyMock(return_value=False),
         ):
             await coresys.host.network.check_connectivity(force=force)
-            await asyncio.sleep(0)
+            await coresys.homeassistant.websocket._queue_task
 
             assert coresys.host.network.connectivity is None
             send_message.assert_called_once_with(
@@ -50,16 +50,6 @@ async def fixture_plugin(
         yield coresys.plugins.observer
 
 
-async def mock_current_state(state: ContainerState) -> ContainerState:
-    """Mock for current state method."""
-    return state
-
-
-async def mock_is_running(running: bool) -> bool:
-    """Mock for is running method."""
-    return running
-
-
 async def mock_get_latest_version(version: AwesomeVersion) -> AwesomeVersion:
     """Mock for get latest version method."""
     return version
@@ -73,14 +63,14 @@ async def mock_get_latest_version(version: AwesomeVersion) -> AwesomeVersion:
 async def test_plugin_watchdog(coresys: CoreSys, plugin: PluginBase) -> None:
     """Test plugin watchdog works correctly."""
     with patch.object(type(plugin.instance), "attach"), patch.object(
-        type(plugin.instance), "is_running", return_value=mock_is_running(True)
+        type(plugin.instance), "is_running", return_value=True
     ):
         await plugin.load()
 
     with patch.object(type(plugin), "rebuild") as rebuild, patch.object(
         type(plugin), "start"
     ) as start, patch.object(type(plugin.instance), "current_state") as current_state:
-        current_state.return_value = mock_current_state(ContainerState.UNHEALTHY)
+        current_state.return_value = ContainerState.UNHEALTHY
         coresys.bus.fire_event(
             BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
             DockerContainerStateEvent(
@@ -95,7 +85,7 @@ async def test_plugin_watchdog(coresys: CoreSys, plugin: PluginBase) -> None:
         start.assert_not_called()
 
         rebuild.reset_mock()
-        current_state.return_value = mock_current_state(ContainerState.FAILED)
+        current_state.return_value = ContainerState.FAILED
         coresys.bus.fire_event(
             BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
             DockerContainerStateEvent(
@@ -111,7 +101,7 @@ async def test_plugin_watchdog(coresys: CoreSys, plugin: PluginBase) -> None:
 
         rebuild.reset_mock()
         # Plugins are restarted anytime they stop, not just on failure
-        current_state.return_value = mock_current_state(ContainerState.STOPPED)
+        current_state.return_value = ContainerState.STOPPED
         coresys.bus.fire_event(
             BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
             DockerContainerStateEvent(
@@ -127,7 +117,7 @@ async def test_plugin_watchdog(coresys: CoreSys, plugin: PluginBase) -> None:
 
         start.reset_mock()
         # Do not process event if container state has changed since fired
-        current_state.return_value = mock_current_state(ContainerState.HEALTHY)
+        current_state.return_value = ContainerState.HEALTHY
         coresys.bus.fire_event(
             BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
             DockerContainerStateEvent(
@@ -172,7 +162,7 @@ async def test_plugin_watchdog_rebuild_on_failure(
 ) -> None:
     """Test plugin watchdog rebuilds if start fails."""
     with patch.object(type(plugin.instance), "attach"), patch.object(
-        type(plugin.instance), "is_running", return_value=mock_is_running(True)
+        type(plugin.instance), "is_running", return_value=True
     ):
         await plugin.load()
 
@@ -184,8 +174,8 @@ async def test_plugin_watchdog_rebuild_on_failure(
         type(plugin.instance),
         "current_state",
         side_effect=[
-            mock_current_state(ContainerState.STOPPED),
-            mock_current_state(ContainerState.STOPPED),
+            ContainerState.STOPPED,
+            ContainerState.STOPPED,
         ],
     ):
         coresys.bus.fire_event(
@@ -225,7 +215,7 @@ async def test_plugin_load_running_container(
         "get_latest_version",
         return_value=mock_get_latest_version(test_version),
     ), patch.object(
-        type(plugin.instance), "is_running", return_value=mock_is_running(True)
+        type(plugin.instance), "is_running", return_value=True
     ):
         await plugin.load()
         register_event.assert_any_call(
@@ -261,7 +251,7 @@ async def test_plugin_load_stopped_container(
         "get_latest_version",
         return_value=mock_get_latest_version(test_version),
     ), patch.object(
-        type(plugin.instance), "is_running", return_value=mock_is_running(False)
+        type(plugin.instance), "is_running", return_value=False
     ):
         await plugin.load()
         register_event.assert_any_call(
@@ -297,7 +287,7 @@ async def test_plugin_load_missing_container(
         "get_latest_version",
         return_value=mock_get_latest_version(test_version),
     ), patch.object(
-        type(plugin.instance), "is_running", return_value=mock_is_running(False)
+        type(plugin.instance), "is_running", return_value=False
     ):
         await plugin.load()
         register_event.assert_any_call(
@@ -1,8 +1,17 @@
 """Test ingress."""
+import asyncio
 from datetime import timedelta
+from ipaddress import IPv4Address
+import time
+from unittest.mock import MagicMock, patch
 
+from aiohttp import web
+
+from supervisor.ingress import SESSION_SAVE_DELAY, SESSION_TIMEOUT, IngressSessions
 from supervisor.utils.dt import utc_from_timestamp
 
+# pylint: disable=protected-access
+
 
 def test_session_handling(coresys):
     """Create and test session."""
@@ -46,3 +55,82 @@ def test_dynamic_ports(coresys):
     assert port_test2 < 65500
     assert port_test1 > 62000
     assert port_test1 < 65500
+
+
+async def test_ingress_pool_keepalive(coresys, aiohttp_server):
+    """Test connections to an add-on are kept open and reused."""
+    app = web.Application()
+    app.router.add_get("/", lambda request: web.Response(text="ok"))
+    server = await aiohttp_server(app)
+
+    addon = MagicMock(slug="test", ip_address=IPv4Address("127.0.0.1"))
+    pool = await coresys.ingress.get_pool(addon)
+    assert await coresys.ingress.get_pool(addon) is pool
+
+    for _ in range(5):
+        async with pool.session.get(server.make_url("/")) as resp:
+            assert await resp.text() == "ok"
+
+    assert pool.requests == 5
+    assert pool.connections_created == 1
+    assert pool.connections_reused == 4
+
+    # New address of the add-on replaces the pool
+    addon.ip_address = IPv4Address("127.0.0.2")
+    new_pools = await asyncio.gather(
+        coresys.ingress.get_pool(addon), coresys.ingress.get_pool(addon)
+    )
+    new_pool = new_pools[0]
+    assert new_pool is not pool
+    assert new_pools[1] is new_pool
+    assert pool.session.closed
+
+    await coresys.ingress.unload()
+    assert new_pool.session.closed
+    assert not coresys.ingress.pools
+
+
+def test_session_expire(coresys):
+    """Test expired sessions are removed and extended ones kept."""
+    with patch("supervisor.ingress.time.monotonic_ns", return_value=0):
+        extended = coresys.ingress.create_session()
+        expired = coresys.ingress.create_session()
+
+    with patch(
+        "supervisor.ingress.time.monotonic_ns", return_value=SESSION_TIMEOUT // 2
+    ):
+        assert coresys.ingress.validate_session(extended)
+
+    with patch(
+        "supervisor.ingress.time.monotonic_ns", return_value=SESSION_TIMEOUT + 1
+    ):
+        assert not coresys.ingress.validate_session(expired)
+        assert coresys.ingress.sessions.expire() == 1
+        assert list(coresys.ingress.sessions) == [extended]
+        assert coresys.ingress.validate_session(extended)
+
+
+def test_session_load_dump(coresys):
+    """Test sessions are stored with timestamps and loaded again."""
+    sessions = IngressSessions(MagicMock())
+    valid = time.time() + 600
+    sessions.load({"valid": valid, "expired": time.time() - 10, "broken": 1e300})
+
+    assert list(sessions) == ["valid", "expired"]
+    dump = sessions.dump()
+    assert list(dump) == ["valid"]
+    assert abs(dump["valid"] - valid) < 1
+
+
+async def test_session_save_batched(coresys):
+    """Test changed sessions are saved in one batch."""
+    coresys.ingress.save_data.reset_mock()
+    with patch.object(coresys.loop, "call_later") as call_later:
+        session = coresys.ingress.create_session()
+        coresys.ingress.validate_session(session)
+        coresys.ingress.create_session()
+
+        call_later.assert_called_once_with(
+            SESSION_SAVE_DELAY, coresys.ingress._save_sessions
+        )
+        coresys.ingress.save_data.assert_not_called()
@@ -1,5 +1,17 @@
 """test json."""
-from supervisor.utils.json import write_json_file
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+
+import pytest
+
+from supervisor.utils.json import (
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    read_json_file,
+    write_json_file,
+)
 
 
 def test_file_permissions(tmp_path):
@@ -18,3 +30,35 @@ def test_new_file_permissions(tmp_path):
 
     write_json_file(tempfile, {"test": "data"})
     assert oct(tempfile.stat().st_mode)[-3:] == "600"
+
+
+def test_json_bytes_supervisor_objects():
+    """Test compact encoding of Supervisor objects."""
+    data = {
+        "date": datetime(2022, 10, 1, 12, 30, tzinfo=timezone.utc),
+        "path": Path("/data/options.json"),
+        "set": {"ssh"},
+        "name": "Zürich",
+        1: None,
+    }
+
+    assert json_bytes(data) == (
+        '{"date":"2022-10-01T12:30:00+00:00","path":"/data/options.json",'
+        '"set":["ssh"],"name":"Zürich","1":null}'
+    ).encode("utf-8")
+    assert json_dumps(data) == json_bytes(data).decode("utf-8")
+    assert json.loads(json_dumps(data, indent=True)) == json.loads(
+        json.dumps(data, cls=JSONEncoder)
+    )
+
+    with pytest.raises(TypeError):
+        json_bytes({"object": object()})
+
+
+def test_read_write_json_file(tmp_path):
+    """Test JSON files are written readable and read back."""
+    tempfile = tmp_path / "test.json"
+    write_json_file(tempfile, {"test": ["data"]})
+
+    assert tempfile.read_text() == '{\n  "test": [\n    "data"\n  ]\n}'
+    assert read_json_file(tempfile) == {"test": ["data"]}